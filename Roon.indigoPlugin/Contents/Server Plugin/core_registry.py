@@ -0,0 +1,66 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Roon Controller © Autolog 2019-2022
+#
+
+# Persistent registry of the Roon Cores seen by the plugin, by core unique id: host, http port, tcp port, display version,
+# name and the time last seen (registered with or discovered). Together with the id of the Core the plugin last registered
+# with, it lets the plugin connect to that Core's last known address at startup straight away, with discovery only used
+# to revalidate the address in the background (or to find the Core if the last known address no longer answers).
+
+import json
+import os
+import threading
+import time
+
+
+class CoreRegistry:
+    def __init__(self, path):
+        self.path = path
+        self._cores = dict()  # Core unique id -> {'host', 'http_port', 'tcp_port', 'display_version', 'name', 'last_seen'}
+        self._core_id = None  # Unique id of the Core last registered with
+        self._lock = threading.Lock()
+
+        try:
+            with open(self.path) as registry_file:
+                registry = json.load(registry_file)
+            self._cores = dict(registry.get('cores', dict()))
+            self._core_id = registry.get('core_id')
+        except (OSError, ValueError, AttributeError):
+            pass  # No (valid) registry yet: start empty
+
+    @property
+    def core_id(self):
+        return self._core_id
+
+    @core_id.setter
+    def core_id(self, core_id):
+        with self._lock:
+            if core_id != self._core_id:
+                self._core_id = core_id
+                self._save()
+
+    def get(self, core_id=None):
+        # Return the entry of the Core (by default, of the Core last registered with) or None if not known
+        with self._lock:
+            core = self._cores.get(self._core_id if core_id is None else core_id)
+            return None if core is None else dict(core)
+
+    def update(self, core_id, host, http_port, tcp_port=None, display_version=None, name=None):
+        # Record where the Core has just been seen; the optional details are only replaced if provided
+        with self._lock:
+            core = self._cores.setdefault(core_id, dict())
+            core['host'] = host
+            core['http_port'] = http_port
+            for key, value in (('tcp_port', tcp_port), ('display_version', display_version), ('name', name)):
+                if value is not None or key not in core:
+                    core[key] = value
+            core['last_seen'] = time.time()
+            self._save()
+
+    def _save(self):
+        work_path = f"{self.path}.tmp"
+        with open(work_path, 'w') as registry_file:
+            json.dump({'core_id': self._core_id, 'cores': self._cores}, registry_file, indent=2, sort_keys=True)
+        os.replace(work_path, self.path)  # Atomic: a crash mid-write never leaves a truncated registry
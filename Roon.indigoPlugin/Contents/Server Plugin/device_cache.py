@@ -0,0 +1,59 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Roon Controller © Autolog 2019-2022
+#
+
+# Cache of the Indigo device handles of the Roon Zone and Output devices, together with the plugin props needed at runtime.
+# indigo.devices[dev_id], dev.pluginProps and dev.enabled are each a round trip to the Indigo server, so the handle and props
+# are fetched once per device and then held until the device is started, stopped or updated.
+
+try:
+    import indigo  # noqa
+except ImportError:
+    pass
+
+from image_profiles import parse_profiles
+
+
+class CachedDevice:
+    __slots__ = ("dev", "enabled", "now_playing_var_id", "dynamic_grouped_zone_rename", "auto_name_new_device", "artwork_profiles",
+                 "queue_prefetch_items")
+
+    def __init__(self, dev):
+        plugin_props = dev.pluginProps
+        self.dev = dev
+        self.enabled = dev.enabled
+        self.now_playing_var_id = int(plugin_props.get('nowPlayingVarId', 0))
+        self.dynamic_grouped_zone_rename = bool(plugin_props.get('dynamicGroupedZoneRename', False))
+        self.artwork_profiles = ()
+        self.queue_prefetch_items = 0
+        if dev.deviceTypeId == 'roonZone':
+            self.queue_prefetch_items = int(plugin_props.get('queuePrefetchItems', 0))
+            self.auto_name_new_device = bool(plugin_props.get('autoNameNewRoonZone', True))
+            try:
+                self.artwork_profiles = parse_profiles(plugin_props.get('artworkProfiles', ''))
+            except ValueError:
+                pass  # Validated when the device is configured
+        else:
+            self.auto_name_new_device = bool(plugin_props.get('autoNameNewRoonOutput', True))
+
+
+class DeviceCache:
+    def __init__(self):
+        self._devices = dict()  # Indigo device id -> CachedDevice
+
+    def get(self, dev_id):
+        cached_device = self._devices.get(dev_id)
+        if cached_device is None:
+            cached_device = CachedDevice(indigo.devices[dev_id])
+            self._devices[dev_id] = cached_device
+        return cached_device
+
+    def refresh(self, dev):
+        # Replace a cached device with the (already fetched) copy passed to deviceUpdated, no server round trip needed
+        if dev.id in self._devices:
+            self._devices[dev.id] = CachedDevice(dev)
+
+    def invalidate(self, dev_id):
+        self._devices.pop(dev_id, None)
@@ -0,0 +1,118 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Roon Controller © Autolog 2019-2022
+#
+
+# On-disk cache of the processed Roon images, keyed by (image_key, scale, width, height, image format).
+# Roon image keys identify the image content, so a cached entry never goes stale: it is only evicted (least recently used
+# first) when the cache grows beyond its size limit. The per Zone image files are hardlinks to the cached entries (or copies
+# where a hardlink is not possible) and are only relinked when the image changes, so an unchanged image key costs
+# no network, decode or encode work.
+
+import hashlib
+import os
+import shutil
+import threading
+from collections import OrderedDict
+
+CACHE_FILE_SUFFIX = ".png"
+
+
+class ImageCache:
+    def __init__(self, folder, max_bytes):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # Cached file path -> size in bytes, least recently used first
+        self._total_bytes = 0
+        self._linked = dict()  # Target file path -> source file path it was last linked (or copied) from
+        self._lock = threading.Lock()
+
+        if not os.path.isdir(self.folder):
+            os.makedirs(self.folder, exist_ok=True)
+
+        # Re-load the entries of a previous run, in least recently used order
+        entries = list()
+        for file_name in os.listdir(self.folder):
+            path = os.path.join(self.folder, file_name)
+            if not file_name.endswith(CACHE_FILE_SUFFIX):
+                os.remove(path)  # Left over from an interrupted add
+                continue
+            file_stat = os.stat(path)
+            entries.append((file_stat.st_mtime, path, file_stat.st_size))
+        for _, path, size in sorted(entries):
+            self._entries[path] = size
+            self._total_bytes += size
+        with self._lock:
+            self._evict()
+
+    def path(self, image_key, scale, width, height, image_format="PNG"):
+        key = f"{image_key}|{scale}|{width}|{height}|{image_format}"
+        return os.path.join(self.folder, f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}{CACHE_FILE_SUFFIX}")
+
+    def get(self, image_key, scale, width, height, image_format="PNG"):
+        # Return the path of the cached image (marking it as most recently used) or None if it isn't cached
+        path = self.path(image_key, scale, width, height, image_format)
+        with self._lock:
+            if path not in self._entries:
+                return None
+            self._entries.move_to_end(path)
+        try:
+            os.utime(path)  # Persist the LRU order for the next run
+        except OSError:
+            with self._lock:
+                self._forget(path)
+            return None
+        return path
+
+    def add(self, image_key, scale, width, height, image_format, write):
+        # Cache the image written by write(path) and return its cached path
+        path = self.path(image_key, scale, width, height, image_format)
+        work_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            write(work_path)
+            os.replace(work_path, path)  # Atomic: a reader never sees a partially written entry
+        finally:
+            if os.path.exists(work_path):
+                os.remove(work_path)
+
+        size = os.path.getsize(path)
+        with self._lock:
+            self._forget(path)
+            self._entries[path] = size
+            self._total_bytes += size
+            self._evict()
+        return path
+
+    def link(self, source_path, target_path):
+        # Make target_path a hardlink to (or a copy of) source_path, unless it already is one
+        with self._lock:
+            if self._linked.get(target_path) == source_path and os.path.exists(target_path):
+                return False
+        work_path = f"{target_path}.{threading.get_ident()}.tmp"
+        try:
+            try:
+                os.link(source_path, work_path)
+            except OSError:
+                shutil.copyfile(source_path, work_path)  # e.g. different file systems
+            os.replace(work_path, target_path)
+        finally:
+            if os.path.exists(work_path):
+                os.remove(work_path)
+        with self._lock:
+            self._linked[target_path] = source_path
+        return True
+
+    def _forget(self, path):
+        size = self._entries.pop(path, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            path, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                os.remove(path)  # Zone image files linked to the entry keep their own link to the content
+            except OSError:
+                pass
@@ -0,0 +1,87 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Roon Controller © Autolog 2019-2022
+#
+
+# Background fetching of the Roon images, off the threads that process the Roon events.
+# Images are downloaded by a bounded pool of worker threads over a single keep-alive requests.Session, each download
+# has an overall deadline and concurrent requests for the same image key share one download.
+#
+# Each request is made for a target (e.g. a Zone image file): when a download completes, its result is only delivered
+# to the targets that still want that image key, so a slow download can never overwrite a newer image.
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import requests  # noqa
+except ImportError:
+    pass
+
+
+class ImageFetchError(Exception):
+    pass
+
+
+class ImageFetcher:
+    def __init__(self, workers=4, timeout=10.0):
+        self.timeout = timeout  # Seconds allowed for a complete download
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="RoonImage")
+        self._session = requests.Session()
+        self._session.mount("http://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=workers))
+        self._in_flight = dict()  # Image key -> Future of the download (and conversion) of the image
+        self._wanted = dict()  # Target -> image key last requested for it
+        self._lock = threading.RLock()  # Also held while delivering, so that deliveries to a target can't be reordered
+
+    def fetch(self, target, key, url, convert, deliver):
+        # Download url in the background, run convert(content) on the worker thread and then call deliver(result, None) for
+        # the target, or deliver(None, exception_error) if the download or conversion failed. Returns the Future of the download
+        with self._lock:
+            self._wanted[target] = key
+            future = self._in_flight.get(key)
+            if future is None:
+                future = self._executor.submit(self._fetch, url, convert)
+                self._in_flight[key] = future
+                future.add_done_callback(lambda done_future: self._finished(key))
+        future.add_done_callback(lambda done_future: self._deliver(target, key, done_future, deliver))
+        return future
+
+    def set_now(self, target, deliver):
+        # Deliver a result already available for the target (e.g. from a cache), superseding any download still in flight for it
+        with self._lock:
+            self._wanted.pop(target, None)
+            deliver()
+
+    def stop(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
+
+    def _fetch(self, url, convert):
+        deadline = time.monotonic() + self.timeout
+        with self._session.get(url, timeout=self.timeout, stream=True) as response:
+            if response.status_code != 200:
+                raise ImageFetchError(f"HTTP status {response.status_code} for '{url}'")
+            chunks = list()
+            for chunk in response.iter_content(chunk_size=65536):
+                if time.monotonic() > deadline:
+                    raise ImageFetchError(f"Download of '{url}' took longer than {self.timeout} seconds")
+                chunks.append(chunk)
+        return convert(b"".join(chunks))
+
+    def _finished(self, key):
+        with self._lock:
+            self._in_flight.pop(key, None)
+
+    def _deliver(self, target, key, future, deliver):
+        with self._lock:
+            if self._wanted.get(target) != key:
+                return  # A different image has been requested for the target since
+            del self._wanted[target]
+            if future.cancelled():
+                deliver(None, ImageFetchError("Download cancelled"))
+            elif future.exception() is not None:
+                deliver(None, future.exception())
+            else:
+                deliver(future.result(), None)
@@ -0,0 +1,120 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Roon Controller © Autolog 2019-2022
+#
+
+# Artwork profiles: the image files produced for a Roon Zone device in addition to the standard 500x500 image.
+# A profile is written as 'WIDTHxHEIGHT[:scale[:format[:quality]]]' and profiles are separated by commas,
+# e.g. '200x200, 1024x768:fit:jpeg:80'.
+#   scale:   fill (crop to the size, the default), fit (within the size, keeping the aspect ratio) or stretch
+#   format:  png (the default) or jpeg
+#   quality: 1 - 95, jpeg only (default 85)
+#
+# All the profiles of an image are rendered from a single download and decode.
+
+from PIL import Image, ImageOps
+
+from constants import JPEG_SIGNATURE, PNG_SIGNATURE
+
+SCALES = ("fill", "fit", "stretch")
+FORMATS = {"png": "PNG", "jpeg": "JPEG", "jpg": "JPEG"}
+MAX_SIZE = 2048
+
+
+class ImageProfile:
+    __slots__ = ("width", "height", "scale", "image_format", "quality")
+
+    def __init__(self, width, height, scale="fill", image_format="PNG", quality=None):
+        self.width = width
+        self.height = height
+        self.scale = scale
+        self.image_format = image_format
+        self.quality = quality  # JPEG only; None for the JPEG as delivered by the Roon Core
+
+    def __eq__(self, other):
+        return isinstance(other, ImageProfile) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __repr__(self):
+        return f"<ImageProfile {self.width}x{self.height}:{self.scale}:{self.cache_format}>"
+
+    def key(self):
+        return self.width, self.height, self.scale, self.image_format, self.quality
+
+    @property
+    def cache_format(self):
+        # Image format part of the image cache key e.g. 'PNG', 'JPEG' (as delivered) or 'JPEG80'
+        return f"{self.image_format}{self.quality or ''}"
+
+    @property
+    def file_suffix(self):
+        # e.g. '_200x200.png' or '_1024x768_fit.jpg'
+        scale = "" if self.scale == "fill" else f"_{self.scale}"
+        extension = ".jpg" if self.image_format == "JPEG" else ".png"
+        return f"_{self.width}x{self.height}{scale}{extension}"
+
+    def accepts(self, content):
+        # True if the downloaded content can be stored as is for this profile (it was requested at the profile's size and scale)
+        if self.image_format == "PNG":
+            return content.startswith(PNG_SIGNATURE)
+        return self.quality is None and content.startswith(JPEG_SIGNATURE)
+
+    def render(self, image, path):
+        # Write the decoded image, resized for the profile, to path
+        size = (self.width, self.height)
+        if self.scale == "fill":
+            image = ImageOps.fit(image, size, Image.LANCZOS)
+        elif self.scale == "fit":
+            image = ImageOps.contain(image, size, Image.LANCZOS)
+        elif image.size != size:
+            image = image.resize(size, Image.LANCZOS)
+        if self.image_format == "JPEG":
+            if image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            image.save(path, format="JPEG", quality=self.quality or 90)
+        else:
+            image.save(path, format="PNG")
+
+
+# The standard Album_Image.png / Artist_Image_N.png files of a Roon Zone device
+STANDARD_PNG_PROFILE = ImageProfile(500, 500)
+STANDARD_JPEG_PROFILE = ImageProfile(500, 500, image_format="JPEG")
+
+
+def parse_profiles(text):
+    # Return the tuple of ImageProfile described by text; raises ValueError for an invalid profile
+    profiles = list()
+    for entry in text.split(","):
+        entry = entry.strip()
+        if entry == "":
+            continue
+        parts = [part.strip().lower() for part in entry.split(":")]
+        try:
+            width, height = (int(value) for value in parts[0].split("x"))
+            scale = parts[1] if len(parts) > 1 and parts[1] != "" else "fill"
+            image_format = FORMATS[parts[2]] if len(parts) > 2 and parts[2] != "" else "PNG"
+            quality = int(parts[3]) if len(parts) > 3 and parts[3] != "" else (85 if image_format == "JPEG" else None)
+        except (KeyError, ValueError):
+            raise ValueError(f"Invalid artwork profile '{entry}'")
+        if not (0 < width <= MAX_SIZE and 0 < height <= MAX_SIZE) or scale not in SCALES or len(parts) > 4:
+            raise ValueError(f"Invalid artwork profile '{entry}'")
+        if image_format == "PNG":
+            quality = None
+        elif not 1 <= quality <= 95:
+            raise ValueError(f"Invalid artwork profile '{entry}': quality must be 1 - 95")
+        profile = ImageProfile(width, height, scale, image_format, quality)
+        if profile not in profiles:
+            profiles.append(profile)
+    return tuple(profiles)
+
+
+def source_request(profiles):
+    # Return the (scale, width, height) to download from the Roon Core to render all of the profiles
+    if len(profiles) == 1:
+        return profiles[0].scale, profiles[0].width, profiles[0].height  # Exactly as required
+    # Otherwise the whole image, large enough to be cropped or resized down to any of the profiles
+    size = max(max(profile.width, profile.height) for profile in profiles)
+    return "fit", size, size
@@ -6,18 +6,14 @@
 
 # noinspection PyUnresolvedReferences
 # ============================== Native Imports ===============================
-import copy
+import io
 import logging
 import os
 import platform
 from PIL import Image
-try:
-    import requests  # noqa
-except ImportError:
-    pass
-from shutil import copyfile
 import socket
 import sys
+import threading
 import traceback
 
 # ============================== Custom Imports ===============================
@@ -28,7 +24,15 @@ except ImportError:
 
 # ============================== Plugin Imports ===============================
 from constants import *
-from roon import RoonApi
+from core_registry import CoreRegistry
+from device_cache import DeviceCache
+from image_cache import ImageCache
+from image_fetcher import ImageFetcher
+from image_profiles import STANDARD_JPEG_PROFILE, STANDARD_PNG_PROFILE, parse_profiles, source_request
+from roon_model import Output, Zone, ZoneQueue
+from shadow_states import ShadowStates
+from roon import CallbackDispatcher, RoonApi, RoonDiscovery, codec as roon_codec
+from roon.constants import SERVICE_TRANSPORT
 
 
 # noinspection PyUnresolvedReferences
@@ -102,17 +106,26 @@ class Plugin(indigo.PluginBase):
         self.globals[ROON][INDIGO_DEVICE_BEING_DELETED] = dict()
         self.globals[ROON][ZONES] = dict()
         self.globals[ROON][OUTPUTS] = dict()
+        self.globals[ROON][QUEUES] = dict()  # Zone id -> ZoneQueue of the Zones subscribed to for artwork prefetch
+        self.globals[ROON][DEVICE_CACHE] = DeviceCache()  # Indigo device handles and runtime plugin props of the Roon Zone and Output devices
+        self.globals[ROON][SHADOW_STATES] = ShadowStates()  # Last states pushed to the Roon Zone and Output devices
 
         self.globals[ROON][MAP_ZONE] = dict()  
         self.globals[ROON][MAP_OUTPUT] = dict()  # TODO: Not sure this is being used in a meaningful way?
         self.globals[ROON][ZONE_UNIQUE_IDENTITY_KEY_TO_ZONE_ID] = dict()
         self.globals[ROON][ZONE_UNIQUE_IDENTITY_KEY_TO_DEV_ID] = dict()
         self.globals[ROON][OUTPUT_ID_TO_DEV_ID] = dict()
+        self.globals[ROON][DISPATCHER] = None
+        self.globals[ROON][API] = None  # Set once connected to the Roon Core (which may be after startup, see discover_and_connect_roon_core)
 
         self.globals[ROON][PLUGIN_PREFS_FOLDER] = f"{self.globals[PLUGIN_INFO][PATH]}/Preferences/Plugins/com.autologplugin.indigoplugin.rooncontroller"
         if not os.path.exists(self.globals[ROON][PLUGIN_PREFS_FOLDER]):
             self.mkdir_with_mode(self.globals[ROON][PLUGIN_PREFS_FOLDER])
 
+        self.globals[ROON][IMAGE_CACHE] = None  # Created once the plugin config has been read
+        self.globals[ROON][CORE_REGISTRY] = None  # Created once the plugin config has been read
+        self.globals[ROON][IMAGE_SLOTS] = dict()  # (Zone dev id, image type, image suffix) -> (image key, image profiles) last processed
+
         self.globals[ROON][AVAILABLE_OUTPUT_NUMBERS] = OUTPUT_MAP_NUMBERS
         self.globals[ROON][AVAILABLE_ZONE_ALPHAS] = ZONE_MAP_ALPHAS
 
@@ -128,6 +141,11 @@ class Plugin(indigo.PluginBase):
         self.getPrefsConfigUiValues()
         self.closedPrefsConfigUi(plugin_prefs, False)
 
+        self.globals[ROON][IMAGE_CACHE] = ImageCache(f"{self.globals[ROON][PLUGIN_PREFS_FOLDER]}/image_cache",
+                                                     self.globals[CONFIG][IMAGE_CACHE_SIZE] * 1024 * 1024)
+        self.globals[ROON][IMAGE_FETCHER] = ImageFetcher(workers=4, timeout=10.0)  # Downloads the images off the Roon event threads
+        self.globals[ROON][CORE_REGISTRY] = CoreRegistry(f"{self.globals[ROON][PLUGIN_PREFS_FOLDER]}/roon_core_registry.json")
+
         self.globals[DEVICES_TO_ROON_CONTROLLER_TABLE] = dict()  # TODO: Is this used?
 
     def __del__(self):
@@ -185,11 +203,15 @@ class Plugin(indigo.PluginBase):
 
             # ### IP Address ###
 
+            roon_core_address = (self.globals[CONFIG][ROON_CORE_IP_ADDRESS], self.globals[CONFIG].get(ROON_CORE_PORT))
             self.globals[CONFIG][ROON_CORE_IP_ADDRESS] = values_dict.get('roonCoreIpAddress', "")
             try:
                 self.globals[CONFIG][ROON_CORE_PORT] = int(values_dict.get('roonCorePort', 9300))
             except ValueError:
                 self.globals[CONFIG][ROON_CORE_PORT] = 9300
+            if self.globals[ROON][CORE_REGISTRY] is not None and roon_core_address != (self.globals[CONFIG][ROON_CORE_IP_ADDRESS], self.globals[CONFIG][ROON_CORE_PORT]):
+                # Changed by the user: connect to the Roon Core at the address as specified (rather than as last registered with) on the next startup
+                self.globals[ROON][CORE_REGISTRY].core_id = None
 
             # ### AUTO-CREATE DEVICES + DEVICE FOLDER ###
             self.globals[CONFIG][AUTO_CREATE_DEVICES] = values_dict.get("autoCreateDevices", False)
@@ -223,12 +245,43 @@ class Plugin(indigo.PluginBase):
             # Display Track playing info in Indigo UI Notes field: True / False
             self.globals[CONFIG][DISPLAY_TRACK_PLAYING] = values_dict.get("displayTrackPlayingInIndigoUi", False)
 
+            # ### EVENT COALESCING ###
+            try:
+                self.globals[CONFIG][EVENT_COALESCING_WINDOW] = float(values_dict.get("eventCoalescingWindow", 0.5))
+            except ValueError:
+                self.globals[CONFIG][EVENT_COALESCING_WINDOW] = 0.5
+
+            # ### STATE FLUSH INTERVAL ###
+            try:
+                self.globals[CONFIG][STATE_FLUSH_INTERVAL] = float(values_dict.get("stateFlushInterval", 0.25))
+            except ValueError:
+                self.globals[CONFIG][STATE_FLUSH_INTERVAL] = 0.25
+            self.globals[ROON][SHADOW_STATES].deferred = self.globals[CONFIG][STATE_FLUSH_INTERVAL] > 0.0
+
+            # ### IMAGE CACHE ###
+            try:
+                self.globals[CONFIG][IMAGE_CACHE_SIZE] = int(values_dict.get("imageCacheSize", 50))
+            except ValueError:
+                self.globals[CONFIG][IMAGE_CACHE_SIZE] = 50
+            if self.globals[ROON].get(IMAGE_CACHE) is not None:
+                self.globals[ROON][IMAGE_CACHE].max_bytes = self.globals[CONFIG][IMAGE_CACHE_SIZE] * 1024 * 1024
+
+            # Store the JPEG images delivered by the Roon Core as is, instead of converting them to PNG: True / False
+            self.globals[CONFIG][KEEP_CORE_JPEG_IMAGES] = bool(values_dict.get("keepCoreJpegImages", False))
+
+            # ### JSON CODEC ###
+            self.globals[CONFIG][JSON_CODEC] = roon_codec.select(values_dict.get("jsonCodec", roon_codec.AUTO))
+            self.logger.debug(f"Roon messages encoded and decoded with the '{self.globals[CONFIG][JSON_CODEC]}' JSON codec")
+
         except Exception as exception_error:
             self.exception_handler(exception_error, True)  # Log error and display failing statement
 
     def deviceDeleted(self, dev):
         try:
             self.globals[ROON][INDIGO_DEVICE_BEING_DELETED][dev.id] = dev.address
+            self.globals[ROON][DEVICE_CACHE].invalidate(dev.id)
+            self.globals[ROON][SHADOW_STATES].forget(dev.id)
+            self.forget_image_slots(dev.id)
 
         except Exception as exception_error:
             self.exception_handler(exception_error, True)  # Log error and display failing statement
@@ -240,6 +293,11 @@ class Plugin(indigo.PluginBase):
         try:
             dev.stateListOrDisplayStateIdChanged()  # Ensure latest devices.xml is being used
 
+            if dev.deviceTypeId in ('roonZone', 'roonOutput'):
+                self.globals[ROON][DEVICE_CACHE].invalidate(dev.id)  # Props may have been edited while the device was stopped
+                self.globals[ROON][SHADOW_STATES].resync(dev)  # States may have been changed while the device was stopped
+                self.forget_image_slots(dev.id)  # Image files may have been changed while the device was stopped
+
             if dev.deviceTypeId == 'roonZone':
                 zone_dev = dev
                 zone_dev_plugin_props = zone_dev.pluginProps
@@ -249,16 +307,15 @@ class Plugin(indigo.PluginBase):
 
                 zone_id = ""
                 for found_zone_id in self.globals[ROON][ZONES]:
-                    if ZONE_UNIQUE_IDENTITY_KEY in self.globals[ROON][ZONES][found_zone_id]:
-                        if zone_unique_identity_key == self.globals[ROON][ZONES][found_zone_id][ZONE_UNIQUE_IDENTITY_KEY]:
-                            zone_id = found_zone_id
+                    if zone_unique_identity_key == self.globals[ROON][ZONES][found_zone_id].unique_identity_key:
+                        zone_id = found_zone_id
 
-                            # LOGIC TO HANDLE PLUGIN PROPS 'roonZoneId' ?????
-                            dev_plugin_props = dev.pluginProps
-                            dev_plugin_props['roonZoneId'] = zone_id
-                            dev.replacePluginPropsOnServer(dev_plugin_props)
+                        # LOGIC TO HANDLE PLUGIN PROPS 'roonZoneId' ?????
+                        dev_plugin_props = dev.pluginProps
+                        dev_plugin_props['roonZoneId'] = zone_id
+                        dev.replacePluginPropsOnServer(dev_plugin_props)
 
-                            break
+                        break
 
                 try:
                     shared_props = dev.sharedProps
@@ -271,7 +328,7 @@ class Plugin(indigo.PluginBase):
                     # At this point it is a brand new Roon Zone device as address not setup
 
                     if zone_id != '':
-                        output_count = self.globals[ROON][ZONES][zone_id][OUTPUTS_COUNT]
+                        output_count = len(self.globals[ROON][ZONES][zone_id].outputs)
                     else:
                         output_count = 0
                     address_alpha = self.globals[ROON][AVAILABLE_ZONE_ALPHAS].pop(0)
@@ -333,12 +390,8 @@ class Plugin(indigo.PluginBase):
                     return
 
                 if output_id not in self.globals[ROON][OUTPUTS]:
-                    key_value_list = [
-                        {'key': 'output_connected', 'value': False},
-                        {'key': 'output_status', 'value': 'disconnected'},
-                    ]
-                    output_dev.updateStatesOnServer(key_value_list)
-                    output_dev.updateStateImageOnServer(indigo.kStateImageSel.PowerOff)
+                    self.globals[ROON][SHADOW_STATES].update(output_dev, {'output_connected': False, 'output_status': 'disconnected'},
+                                                             indigo.kStateImageSel.PowerOff, flush_on=('output_connected',))
                     return
 
                 self.update_roon_output_device(output_dev.id, output_id)
@@ -387,6 +440,9 @@ class Plugin(indigo.PluginBase):
                 for zoneUniqueIdentityKey, devId in list(self.globals[ROON][ZONE_UNIQUE_IDENTITY_KEY_TO_DEV_ID].items()):
                     if devId == zone_dev.id:
                         del self.globals[ROON][ZONE_UNIQUE_IDENTITY_KEY_TO_DEV_ID][zoneUniqueIdentityKey]
+                        zone_id = self.globals[ROON][ZONE_UNIQUE_IDENTITY_KEY_TO_ZONE_ID].get(zoneUniqueIdentityKey)
+                        if zone_id is not None:
+                            self.cancel_queue_prefetch(zone_id)
                 if not device_being_deleted:
                     self.disconnect_roon_zone_device(zone_dev.id)
 
@@ -398,6 +454,10 @@ class Plugin(indigo.PluginBase):
                 if not device_being_deleted:
                     self.disconnect_roon_output_device(output_dev.id)
 
+            self.globals[ROON][DEVICE_CACHE].invalidate(dev.id)
+            if device_being_deleted:
+                self.globals[ROON][SHADOW_STATES].forget(dev.id)
+
         except Exception as exception_error:
             self.exception_handler(exception_error, True)  # Log error and display failing statement
 
@@ -410,6 +470,11 @@ class Plugin(indigo.PluginBase):
                     self.globals[ROON][newDev.id][DEVICE_STARTED]):  # IGNORE THESE UPDATES TO AVOID LOOP!!!
                 pass
 
+            elif newDev.deviceTypeId in ('roonZone', 'roonOutput') and newDev.pluginId == self.pluginId:
+                # Pick up states new to the shadow; the full resync is only done when the device is started (or after a failed push)
+                self.globals[ROON][DEVICE_CACHE].refresh(newDev)
+                self.globals[ROON][SHADOW_STATES].adopt_external(newDev)
+
         except Exception as exception_error:
             self.exception_handler(exception_error, True)  # Log error and display failing statement
 
@@ -473,12 +538,49 @@ class Plugin(indigo.PluginBase):
             prefs_config_ui_values["roonDeviceFolderName"] = "Roon"
         if "dynamicGroupedZonesRename" not in prefs_config_ui_values:
             prefs_config_ui_values["dynamicGroupedZonesRename"] = True
+        if "jsonCodec" not in prefs_config_ui_values:
+            prefs_config_ui_values["jsonCodec"] = roon_codec.AUTO
+        if "eventCoalescingWindow" not in prefs_config_ui_values:
+            prefs_config_ui_values["eventCoalescingWindow"] = "0.5"
+        if "stateFlushInterval" not in prefs_config_ui_values:
+            prefs_config_ui_values["stateFlushInterval"] = "0.25"
+        if "imageCacheSize" not in prefs_config_ui_values:
+            prefs_config_ui_values["imageCacheSize"] = "50"
+        if "keepCoreJpegImages" not in prefs_config_ui_values:
+            prefs_config_ui_values["keepCoreJpegImages"] = False
 
         return prefs_config_ui_values
 
+    def runConcurrentThread(self):
+        try:
+            while True:
+                # Push the device states accumulated since the last tick: one Indigo call per device that changed
+                try:
+                    self.globals[ROON][SHADOW_STATES].flush()
+                except Exception as exception_error:
+                    self.exception_handler(exception_error, True)  # Log error and display failing statement
+
+                if self.globals[CONFIG][STATE_FLUSH_INTERVAL] > 0.0:
+                    self.sleep(self.globals[CONFIG][STATE_FLUSH_INTERVAL])
+                else:
+                    self.sleep(1.0)  # States are pushed immediately: nothing to do
+
+        except self.StopThread:
+            pass  # Shutdown pushes whatever is still pending
+
     def shutdown(self):
         self.logger.debug("Shutdown called")
 
+        if self.globals[ROON][API] is not None:
+            self.globals[ROON][API].stop()  # Also delivers any coalesced changes still pending
+        if self.globals[ROON][DISPATCHER] is not None:
+            self.globals[ROON][DISPATCHER].stop(timeout=5.0)
+        self.globals[ROON][IMAGE_FETCHER].stop()  # Abandon any image downloads still in flight
+        try:
+            self.globals[ROON][SHADOW_STATES].flush()  # Push any device states still waiting for the next flush tick
+        except Exception as exception_error:
+            self.exception_handler(exception_error, True)  # Log error and display failing statement
+
         self.logger.info("'Roon Controller' Plugin shutdown complete")
 
     def startup(self):
@@ -519,6 +621,8 @@ class Plugin(indigo.PluginBase):
             dir_list = [d for d in os.listdir(self.globals[ROON][PLUGIN_PREFS_FOLDER]) if os.path.isdir(
                 os.path.join(self.globals[ROON][PLUGIN_PREFS_FOLDER], d))]
             for dir_name in dir_list:
+                if dir_name[0:5] != 'ZONE-':
+                    continue  # e.g. the image cache folder
                 dir_alpha = dir_name.split('-')[1]  # dev.address = e.g. 'ZONE-A-2' which gives 'A' or 'ZONE-CD-1' which gives 'CD'
                 if len(dir_alpha) == 1:
                     dir_alpha = f" {dir_alpha}"
@@ -542,15 +646,48 @@ class Plugin(indigo.PluginBase):
 
             self.logger.debug(f"'Roon Controller' token [0]: {self.globals[ROON][TOKEN]}")
 
-            if self.globals[CONFIG][ROON_CORE_IP_ADDRESS] == '':
-                self.logger.error("'Roon Controller' has no Roon Core IP Address specified in Plugin configuration"
-                                  " - correct and then restart plugin.")
-                return False
+            # Connect straight away to the address the Roon Core was last seen at (or as specified in the plugin config if not known yet).
+            # If nothing answers there, the Roon Core is discovered in the background instead, so that startup doesn't wait for discovery.
+            # Either way, the address is then revalidated by discovery in the background
+            core = self.globals[ROON][CORE_REGISTRY].get()
+            if core is not None:
+                roon_core_ip_address, roon_core_port = core['host'], core['http_port']
+            else:
+                roon_core_ip_address, roon_core_port = self.globals[CONFIG][ROON_CORE_IP_ADDRESS], self.globals[CONFIG][ROON_CORE_PORT]
+            if roon_core_ip_address != '' and self.roon_core_answers(roon_core_ip_address, roon_core_port):
+                self.connect_roon_core(roon_core_ip_address, roon_core_port)
+                threading.Thread(target=self.revalidate_roon_core, name="RoonCoreDiscovery", daemon=True).start()
+            else:
+                threading.Thread(target=self.discover_and_connect_roon_core, args=(roon_core_ip_address, roon_core_port),
+                                 name="RoonCoreDiscovery", daemon=True).start()
+
+        except Exception as exception_error:
+            self.exception_handler(exception_error, True)  # Log error and display failing statement
+
+    def roon_core_answers(self, roon_core_ip_address, roon_core_port):  # noqa [May be static]
+        try:
+            with socket.create_connection((roon_core_ip_address, roon_core_port), timeout=1.0):
+                return True
+        except OSError:
+            return False
+
+    def connect_roon_core(self, roon_core_ip_address, roon_core_port):
+        # Connect to the Roon Core, waiting until the plugin is registered with it, and process its Outputs and Zones
+        try:
+            # Roon state changes are processed on the dispatcher's worker threads (in order per zone / output)
+            # so that Indigo updates and image downloads don't hold up the websocket reader thread
+            self.globals[ROON][DISPATCHER] = CallbackDispatcher(workers=4, max_queue_size=1000)
 
             self.globals[ROON][API] = RoonApi(self.globals[ROON][EXTENSION_INFO], self.globals[ROON][TOKEN],
-                                                  self.globals[CONFIG][ROON_CORE_IP_ADDRESS], self.globals[CONFIG][ROON_CORE_PORT])
-            self.globals[ROON][API].register_state_callback(self.process_roon_callback_state)
-            # self.globals[ROON][API].register_queue_callback(self.process_roon_callback_queue)
+                                              roon_core_ip_address, roon_core_port,
+                                              dispatcher=self.globals[ROON][DISPATCHER],
+                                              coalesce_window=self.globals[CONFIG][EVENT_COALESCING_WINDOW],
+                                              address_resolver=self.discover_roon_core)  # Follows the Roon Core to a new address on a reconnect
+            if self.globals[ROON][API].core_id is not None:  # Not known if the connection was stopped before the Roon Core registered the plugin
+                self.globals[ROON][CORE_REGISTRY].update(self.globals[ROON][API].core_id, self.globals[ROON][API].host, self.globals[ROON][API].port,
+                                                         name=self.globals[ROON][API].core_name)
+                self.globals[ROON][CORE_REGISTRY].core_id = self.globals[ROON][API].core_id
+            self.globals[ROON][API].register_state_callback(self.process_roon_callback_state, with_changes=True)
 
             # self.globals[ROON][API].register_volume_control('Indigo', 'Indigo', self.process_roon_volume_control)
 
@@ -563,11 +700,10 @@ class Plugin(indigo.PluginBase):
                 with open(self.globals[ROON][TOKEN_FILE], "w") as f:
                     f.write(self.globals[ROON][TOKEN])
 
-            self.globals[ROON][ZONES] = copy.deepcopy(self.globals[ROON][API].zones)
-            self.globals[ROON][OUTPUTS] = copy.deepcopy(self.globals[ROON][API].outputs)
-
-            self.process_outputs(self.globals[ROON][OUTPUTS])
-            self.process_zones(self.globals[ROON][ZONES])
+            # The Roon API zones and outputs are immutable snapshots, so no (deep) copy is needed
+            snapshot = self.globals[ROON][API].snapshot()
+            self.process_outputs(snapshot.outputs)
+            self.process_zones(snapshot.zones)
 
             # self.print_known_zones_summary('INITIALISATION')
 
@@ -576,6 +712,52 @@ class Plugin(indigo.PluginBase):
         except Exception as exception_error:
             self.exception_handler(exception_error, True)  # Log error and display failing statement
 
+    def discover_and_connect_roon_core(self, roon_core_ip_address, roon_core_port):
+        # Runs on its own thread at startup if nothing answered at the Roon Core's last known (or configured) address:
+        # connect to the Roon Core discovered, or to that address if none was discovered, in case the Roon Core is just slow to start
+        try:
+            roon_core_ip_address, roon_core_port = self.discover_roon_core() or (roon_core_ip_address, roon_core_port)
+            if roon_core_ip_address == '':
+                self.logger.error("'Roon Controller' has no Roon Core IP Address specified in Plugin configuration and no Roon Core was discovered"
+                                  " - correct and then restart plugin.")
+                return
+            self.connect_roon_core(roon_core_ip_address, roon_core_port)
+
+        except Exception as exception_error:
+            self.exception_handler(exception_error, True)  # Log error and display failing statement
+
+    def discover_roon_core(self):
+        # Discover the Roon Core last registered with (or any Roon Core if none yet) and record it in the Core registry.
+        # Returns its (host, http port) or None if not found. Blocks for up to the discovery timeout
+        try:
+            cores = RoonDiscovery(self.globals[ROON][CORE_REGISTRY].core_id).cores(first_only=True)
+            if len(cores) == 0:
+                self.logger.debug("'discover_roon_core' no Roon Core discovered")
+                return None
+            core = cores[0]
+            self.globals[ROON][CORE_REGISTRY].update(core['unique_id'], core['host'], core['http_port'], core['tcp_port'], core['display_version'], core['name'])
+            self.logger.debug(f"'discover_roon_core' discovered Roon Core '{core['name']}' at {core['host']}:{core['http_port']}")
+            return core['host'], core['http_port']
+
+        except Exception as exception_error:
+            self.exception_handler(exception_error, True)  # Log error and display failing statement
+            return None
+
+    def revalidate_roon_core(self):
+        # Runs once on its own thread after startup: reconnect if the Roon Core is no longer at the address connected to
+        try:
+            roon_core_address = self.discover_roon_core()
+            roon_api = self.globals[ROON][API]
+            if roon_api is None:
+                self.logger.debug("'revalidate_roon_core' ignored as 'Roon Controller' is not connected to the Roon Core")
+                return
+            if roon_core_address is not None and roon_core_address != (roon_api.host, roon_api.port):
+                self.logger.info(f"Roon Core address has changed to {roon_core_address[0]}:{roon_core_address[1]} - reconnecting")
+                roon_api.update_server_address(*roon_core_address)
+
+        except Exception as exception_error:
+            self.exception_handler(exception_error, True)  # Log error and display failing statement
+
     def stopConcurrentThread(self):
         self.logger.debug("Thread shutdown called")
 
@@ -604,6 +786,15 @@ class Plugin(indigo.PluginBase):
                     error_dict["showAlertText"] = "You must select an available Roon Zone to be able to create the Roon Zone device."
                     return False, values_dict, error_dict
 
+                try:
+                    parse_profiles(values_dict.get('artworkProfiles', ''))
+                except ValueError as exception_error:
+                    error_dict = indigo.Dict()
+                    error_dict["artworkProfiles"] = f"{exception_error}"
+                    error_dict["showAlertText"] = ("Artwork profiles are entered as 'WIDTHxHEIGHT[:scale[:format[:quality]]]' separated by commas"
+                                                   " e.g. '200x200, 1024x768:fit:jpeg:80'. Scale is fill, fit or stretch, format is png or jpeg.")
+                    return False, values_dict, error_dict
+
             elif type_id == 'roonOutput':
                 valid = False
                 if 'roonOutputId' in values_dict and len(values_dict['roonOutputId']) > 5:
@@ -647,7 +838,7 @@ class Plugin(indigo.PluginBase):
                 address_number = address_number[1:2]
             address = f"OUT-{address_number}"
 
-            output_name = f"Roon Output - {self.globals[ROON][OUTPUTS][output_id][DISPLAY_NAME]}"
+            output_name = f"Roon Output - {self.globals[ROON][OUTPUTS][output_id].display_name}"
 
             output_dev = (indigo.device.create(protocol=indigo.kProtocol.Plugin,
                           address=address,
@@ -669,7 +860,7 @@ class Plugin(indigo.PluginBase):
         try:
             self.logger.debug(f"Roon 'availableZoneAlphas':\n{self.globals[ROON][AVAILABLE_ZONE_ALPHAS]}\n")
 
-            outputCount = self.globals[ROON][ZONES][zone_id][OUTPUTS_COUNT]
+            outputCount = len(self.globals[ROON][ZONES][zone_id].outputs)
             addressAlpha = self.globals[ROON][AVAILABLE_ZONE_ALPHAS].pop(0)
             if addressAlpha[0:1] == ' ':
                 addressAlpha = addressAlpha[1:2]
@@ -678,14 +869,12 @@ class Plugin(indigo.PluginBase):
             else:
                 address = f"ZONE-{addressAlpha}"
 
-            zone_name = f"{self.globals[ROON][ZONES][zone_id][DISPLAY_NAME]}"
+            zone_name = f"{self.globals[ROON][ZONES][zone_id].display_name}"
 
             if outputCount == 0:
                 device_name = f"Roon Zone - {zone_name}"
             else:
-                temp_zone_name = self.globals[ROON][ZONES][zone_id][OUTPUTS][1][DISPLAY_NAME]
-                for i in range(2, outputCount + 1):
-                    temp_zone_name = f"{temp_zone_name} + {self.globals[ROON][ZONES][zone_id][OUTPUTS][i][DISPLAY_NAME]}"
+                temp_zone_name = " + ".join(output.display_name for output in self.globals[ROON][ZONES][zone_id].outputs)
                 device_name = f"Roon Zone - {temp_zone_name}"
 
             self.logger.debug(f"'auto_create_zone_device' - Creating Indigo Zone Device with Name: '{device_name}', Zone Name: '{zone_name}',\nZone Unique Identity Key: '{zoneUniqueIdentityKey}'")
@@ -712,27 +901,9 @@ class Plugin(indigo.PluginBase):
         except Exception as exception_error:
             self.exception_handler(exception_error, True)  # Log error and display failing statement
 
-    def convert_output_id_list_to_string(self, roonZoneOutputsList):
-        try:
-            outputs_list_string = ""
-
-            if type(roonZoneOutputsList) is list:
-                for outputId in roonZoneOutputsList:
-                    if outputs_list_string == '':
-                        outputs_list_string = f"{outputId}"
-                    else:
-                        outputs_list_string = f"{outputs_list_string}#{outputId}"
-
-                return outputs_list_string
-            else:
-                return roonZoneOutputsList
-
-        except Exception as exception_error:
-            self.exception_handler(exception_error, True)  # Log error and display failing statement
-
     def disconnect_roon_output_device(self, roonOutputDevId):
         try:
-            output_dev = indigo.devices[roonOutputDevId]
+            output_dev = self.globals[ROON][DEVICE_CACHE].get(roonOutputDevId).dev
             key_value_list = [
                 {'key': 'output_connected', 'value': False},
                 {'key': 'output_status', 'value': 'disconnected'},
@@ -758,15 +929,15 @@ class Plugin(indigo.PluginBase):
                 {'key': 'can_group_with_output_id_4', 'value': ''},
                 {'key': 'can_group_with_output_id_5', 'value': ''}]
 
-            output_dev.updateStatesOnServer(key_value_list)
-            output_dev.updateStateImageOnServer(indigo.kStateImageSel.PowerOff)
+            self.globals[ROON][SHADOW_STATES].update(output_dev, {item['key']: item['value'] for item in key_value_list},
+                                                     indigo.kStateImageSel.PowerOff, flush_on=('output_connected',))
 
         except Exception as exception_error:
             self.exception_handler(exception_error, True)  # Log error and display failing statement
 
     def disconnect_roon_zone_device(self, roonZoneDevId):
         try:
-            zone_dev = indigo.devices[roonZoneDevId]
+            zone_dev = self.globals[ROON][DEVICE_CACHE].get(roonZoneDevId).dev
             key_value_list = [
                 {'key': 'zone_connected', 'value': False},
                 {'key': 'zone_status', 'value': 'disconnected'},
@@ -806,8 +977,8 @@ class Plugin(indigo.PluginBase):
                 {'key': 'is_play_allowed', 'value': False},
                 {'key': 'is_next_allowed', 'value': False}]
 
-            zone_dev.updateStatesOnServer(key_value_list)
-            zone_dev.updateStateImageOnServer(indigo.kStateImageSel.PowerOff)
+            self.globals[ROON][SHADOW_STATES].update(zone_dev, {item['key']: item['value'] for item in key_value_list},
+                                                     indigo.kStateImageSel.PowerOff, flush_on=('zone_connected',))
 
         except Exception as exception_error:
             self.exception_handler(exception_error, True)  # Log error and display failing statement
@@ -825,7 +996,7 @@ class Plugin(indigo.PluginBase):
                         if dev.states['output_status'] == 'connected':
                             # Append self
                             outputs_list.append((roonOutputId,
-                                                 self.globals[ROON][OUTPUTS][roonOutputId][DISPLAY_NAME]))
+                                                 self.globals[ROON][OUTPUTS][roonOutputId].display_name))
                         else:
                             display_name = dev.states['display_name']
                             if display_name != '':
@@ -835,8 +1006,8 @@ class Plugin(indigo.PluginBase):
 
             for output_id in self.globals[ROON][OUTPUTS]:
                 if output_id not in allocated_output_ids:
-                    outputs_list.append((self.globals[ROON][OUTPUTS][output_id][OUTPUT_ID],
-                                         self.globals[ROON][OUTPUTS][output_id][DISPLAY_NAME]))
+                    outputs_list.append((self.globals[ROON][OUTPUTS][output_id].output_id,
+                                         self.globals[ROON][OUTPUTS][output_id].display_name))
 
             if len(outputs_list) == 0:
                 outputs_list.append(('-', '-- No Available Outputs --'))
@@ -863,8 +1034,8 @@ class Plugin(indigo.PluginBase):
             zone_unique_identity_keys_list = list()
 
             for zone_id in self.globals[ROON][ZONES]:
-                if self.globals[ROON][ZONES][zone_id][ZONE_UNIQUE_IDENTITY_KEY] not in allocatedRoonZoneUniqueIdentityKeys:
-                    zone_unique_identity_keys_list.append((self.globals[ROON][ZONES][zone_id][ZONE_UNIQUE_IDENTITY_KEY], self.globals[ROON][ZONES][zone_id][DISPLAY_NAME]))
+                if self.globals[ROON][ZONES][zone_id].unique_identity_key not in allocatedRoonZoneUniqueIdentityKeys:
+                    zone_unique_identity_keys_list.append((self.globals[ROON][ZONES][zone_id].unique_identity_key, self.globals[ROON][ZONES][zone_id].display_name))
 
             if len(zone_unique_identity_keys_list) == 0:
                 zone_unique_identity_keys_list.append(('-', '-- No Available Zones --'))
@@ -911,9 +1082,8 @@ class Plugin(indigo.PluginBase):
             if self.globals[CONFIG][PRINT_OUTPUTS_SUMMARY]:
                 logout = f"\n#################### {title} ####################\n"
                 for output_id in self.globals[ROON][OUTPUTS]:
-                    if 'display_name' in self.globals[ROON][OUTPUTS][output_id]:
-                        outputdisplay_name = self.globals[ROON][OUTPUTS][output_id][DISPLAY_NAME]
-                    else:
+                    outputdisplay_name = self.globals[ROON][OUTPUTS][output_id].display_name
+                    if outputdisplay_name == '':
                         outputdisplay_name = "NONE"
                     logout = logout + f"Output '{outputdisplay_name}' - Output ID = '{output_id}'"
                 logout = logout + '####################\n'
@@ -928,9 +1098,8 @@ class Plugin(indigo.PluginBase):
                 logout = f"\n#################### {title} ####################"
                 logout = logout + "\nInternal Zone table\n"
                 for zone_id in self.globals[ROON][ZONES]:
-                    if 'display_name' in self.globals[ROON][ZONES][zone_id]:
-                        zone_display_name = self.globals[ROON][ZONES][zone_id][DISPLAY_NAME]
-                    else:
+                    zone_display_name = self.globals[ROON][ZONES][zone_id].display_name
+                    if zone_display_name == '':
                         zone_display_name = "NONE"
                     logout = logout + f"\nZone '{zone_display_name}' - Zone ID = '{zone_id}'"
                 logout = logout + "\nIndigo Zone Devices\n"
@@ -946,38 +1115,35 @@ class Plugin(indigo.PluginBase):
 
     def print_output(self, output_id):
         try:
+            output = self.globals[ROON][OUTPUTS][output_id]
             outputPrint = "\n\nROON OUTPUT PRINT\n"
-            outputPrint = outputPrint + f"\nOutput: {self.globals[ROON][OUTPUTS][output_id][OUTPUT_ID]}"
-            outputPrint = outputPrint + f"\n    Display Name: {self.globals[ROON][OUTPUTS][output_id][DISPLAY_NAME]}"
-            outputPrint = outputPrint + f"\n    Zone Id: {self.globals[ROON][OUTPUTS][output_id][ZONE_ID]}"
-
-            if 'source_controls' in self.globals[ROON][OUTPUTS][output_id]:
-                outputPrint = outputPrint + f"\n    Source Controls: Count = {self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS_COUNT]}"
-                for key2, value2 in list(self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS].items()):
-                    key2Int = int(key2)
-                    outputPrint = outputPrint + f"\n        Source Controls '{key2}'"
-                    outputPrint = outputPrint + f"\n            Status: { self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS][key2Int][STATUS]}"
-                    outputPrint = outputPrint + f"\n            Display Name: { self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS][key2Int][DISPLAY_NAME]}"
-                    outputPrint = outputPrint + f"\n            Control Key: {self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS][key2Int][CONTROL_KEY]}"
-                    outputPrint = outputPrint + f"\n            Supports Standby: {self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS][key2Int][SUPPORTS_STANDBY]}"
-
-            if 'volume' in self.globals[ROON][OUTPUTS][output_id] and len(
-                    self.globals[ROON][OUTPUTS][output_id][VOLUME]) > 0:
+            outputPrint = outputPrint + f"\nOutput: {output.output_id}"
+            outputPrint = outputPrint + f"\n    Display Name: {output.display_name}"
+            outputPrint = outputPrint + f"\n    Zone Id: {output.zone_id}"
+
+            outputPrint = outputPrint + f"\n    Source Controls: Count = {len(output.source_controls)}"
+            for source_control_number, source_control in enumerate(output.source_controls, start=1):
+                outputPrint = outputPrint + f"\n        Source Controls '{source_control_number}'"
+                outputPrint = outputPrint + f"\n            Status: {source_control.status}"
+                outputPrint = outputPrint + f"\n            Display Name: {source_control.display_name}"
+                outputPrint = outputPrint + f"\n            Control Key: {source_control.control_key}"
+                outputPrint = outputPrint + f"\n            Supports Standby: {source_control.supports_standby}"
+
+            if output.volume is not None:
                 outputPrint = outputPrint + "\n    Volume:"
-                outputPrint = outputPrint + f"\n        Hard Limit Min: {self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_HARD_LIMIT_MIN]}"
-                outputPrint = outputPrint + f"\n        Min: {self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_MIN]}"
-                outputPrint = outputPrint + f"\n        Is Muted: {self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_IS_MUTED]}"
-                outputPrint = outputPrint + f"\n        Max: {self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_MAX]}"
-                outputPrint = outputPrint + f"\n        Value: {self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_VALUE]}"
-                outputPrint = outputPrint + f"\n        Step: {self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_STEP]}"
-                outputPrint = outputPrint + f"\n        Hard Limit Max: {self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_HARD_LIMIT_MAX]}"
-                outputPrint = outputPrint + f"\n        Soft Limit: {self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_SOFT_LIMIT]}"
-                outputPrint = outputPrint + f"\n        Type: {self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_TYPE]}"
-
-            outputPrint = outputPrint + f"\n    Can Group With Output Ids: Count = {self.globals[ROON][OUTPUTS][output_id][CAN_GROUP_WITH_OUTPUT_IDS_COUNT]}"
-            for key2, value2 in list(self.globals[ROON][OUTPUTS][output_id][CAN_GROUP_WITH_OUTPUT_IDS].items()):
-                key2Int = int(key2)
-                outputPrint = outputPrint + f"\n        Output Id [{key2}]: {self.globals[ROON][OUTPUTS][output_id][CAN_GROUP_WITH_OUTPUT_IDS][key2Int]}"
+                outputPrint = outputPrint + f"\n        Hard Limit Min: {output.volume.hard_limit_min}"
+                outputPrint = outputPrint + f"\n        Min: {output.volume.min}"
+                outputPrint = outputPrint + f"\n        Is Muted: {output.volume.is_muted}"
+                outputPrint = outputPrint + f"\n        Max: {output.volume.max}"
+                outputPrint = outputPrint + f"\n        Value: {output.volume.value}"
+                outputPrint = outputPrint + f"\n        Step: {output.volume.step}"
+                outputPrint = outputPrint + f"\n        Hard Limit Max: {output.volume.hard_limit_max}"
+                outputPrint = outputPrint + f"\n        Soft Limit: {output.volume.soft_limit}"
+                outputPrint = outputPrint + f"\n        Type: {output.volume.type}"
+
+            outputPrint = outputPrint + f"\n    Can Group With Output Ids: Count = {len(output.can_group_with_output_ids)}"
+            for can_group_number, can_group_with_output_id in enumerate(output.can_group_with_output_ids, start=1):
+                outputPrint = outputPrint + f"\n        Output Id [{can_group_number}]: {can_group_with_output_id}"
 
             self.logger.debug(outputPrint)
 
@@ -986,83 +1152,100 @@ class Plugin(indigo.PluginBase):
 
     def print_zone(self, zone_id):
         try:
-            zone_print = f"\n\nROON ZONE PRINT: '{self.globals[ROON][ZONES][zone_id][DISPLAY_NAME]}'\n"
-            zone_print = zone_print         + f"\nZone: {self.globals[ROON][ZONES][zone_id][ZONE_ID]}"
-            zone_print = zone_print         + f"\n    Queue Items Remaining: {self.globals[ROON][ZONES][zone_id][QUEUE_ITEMS_REMAINING]}"
-            zone_print = zone_print         + f"\n    Queue Time Remaining: {self.globals[ROON][ZONES][zone_id][QUEUE_TIME_REMAINING]}"
-            zone_print = zone_print         + f"\n    Display Name: {self.globals[ROON][ZONES][zone_id][DISPLAY_NAME]}"
+            zone = self.globals[ROON][ZONES][zone_id]
+            zone_print = f"\n\nROON ZONE PRINT: '{zone.display_name}'\n"
+            zone_print = zone_print         + f"\nZone: {zone.zone_id}"
+            zone_print = zone_print         + f"\n    Queue Items Remaining: {zone.queue_items_remaining}"
+            zone_print = zone_print         + f"\n    Queue Time Remaining: {zone.queue_time_remaining}"
+            zone_print = zone_print         + f"\n    Display Name: {zone.display_name}"
             zone_print = zone_print         + "\n    Settings:"
-            zone_print = zone_print         + f"\n        Auto Radio: {self.globals[ROON][ZONES][zone_id][SETTINGS][AUTO_RADIO]}"
-            zone_print = zone_print         + f"\n        Shuffle: {self.globals[ROON][ZONES][zone_id][SETTINGS][SHUFFLE]}"
-            zone_print = zone_print         + f"\n        Loop: {self.globals[ROON][ZONES][zone_id][SETTINGS][LOOP]}"
-            zone_print = zone_print         + f"\n    zone_id Unique Identity Key: {self.globals[ROON][ZONES][zone_id][ZONE_UNIQUE_IDENTITY_KEY]}"
-            zone_print = zone_print         + f"\n    Outputs: Count = {self.globals[ROON][ZONES][zone_id][OUTPUTS_COUNT]}"
-
-            for key, value in list(self.globals[ROON][ZONES][zone_id][OUTPUTS].items()):
-                keyInt = int(key)
-                zone_print = zone_print     + f"\n        Output '{key}'"
-                zone_print = zone_print     + f"\n            Output Id: {self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][OUTPUT_ID]}"
-                zone_print = zone_print     + f"\n            Display Name: {self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][DISPLAY_NAME]}"
-                zone_print = zone_print     + f"\n            Zone Id: {self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][ZONE_ID]}"
-
-                zone_print = zone_print     + f"\n            Source Controls: Count = {self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][SOURCE_CONTROLS_COUNT]}"
-                for key2, value2 in list(self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][SOURCE_CONTROLS].items()):
-                    key2Int = int(key2)
-                    zone_print = zone_print + f"\n                Source Controls '{key2}'"
-                    zone_print = zone_print + f"\n                    Status: {self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][SOURCE_CONTROLS][key2Int][STATUS]}"
-                    zone_print = zone_print + f"\n                    Display Name: {self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][SOURCE_CONTROLS][key2Int][DISPLAY_NAME]}"
-                    zone_print = zone_print + f"\n                    Control Key: {self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][SOURCE_CONTROLS][key2Int][CONTROL_KEY]}"
-                    zone_print = zone_print + f"\n                    Supports Standby: {self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][SOURCE_CONTROLS][key2Int][SUPPORTS_STANDBY]}"
-                zone_print = zone_print     + "\n            Volume:"
-                zone_print = zone_print     + f"\n                Hard Limit Min: {self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][VOLUME][VOLUME_HARD_LIMIT_MIN]}"
-                zone_print = zone_print     + f"\n                Min: {self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][VOLUME][VOLUME_MIN]}"
-                zone_print = zone_print     + f"\n                Is Muted: {self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][VOLUME][VOLUME_IS_MUTED]}"
-                zone_print = zone_print     + f"\n                Max: {self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][VOLUME][VOLUME_MAX]}"
-                zone_print = zone_print     + f"\n                Value: {self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][VOLUME][VOLUME_VALUE]}"
-                zone_print = zone_print     + f"\n                Step: {self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][VOLUME][VOLUME_STEP]}"
-                zone_print = zone_print     + f"\n                Hard Limit Max: {self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][VOLUME][VOLUME_HARD_LIMIT_MAX]}"
-                zone_print = zone_print     + f"\n                Soft Limit: {self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][VOLUME][VOLUME_SOFT_LIMIT]}"
-                zone_print = zone_print     + f"\n                Type: {self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][VOLUME][VOLUME_TYPE]}"
-
-                zone_print = zone_print     + f"\n            Can Group With Output Ids: Count = {self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][CAN_GROUP_WITH_OUTPUT_IDS_COUNT]}"
-                for key2, value2 in list(self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][CAN_GROUP_WITH_OUTPUT_IDS].items()):
-                    key2Int = int(key2)
-                    zone_print = zone_print + f"\n                Output Id [{key2}]: {self.globals[ROON][ZONES][zone_id][OUTPUTS][keyInt][CAN_GROUP_WITH_OUTPUT_IDS][key2Int]}"
+            zone_print = zone_print         + f"\n        Auto Radio: {zone.auto_radio}"
+            zone_print = zone_print         + f"\n        Shuffle: {zone.shuffle}"
+            zone_print = zone_print         + f"\n        Loop: {zone.loop}"
+            zone_print = zone_print         + f"\n    zone_id Unique Identity Key: {zone.unique_identity_key}"
+            zone_print = zone_print         + f"\n    Outputs: Count = {len(zone.outputs)}"
+
+            for output_number, output in enumerate(zone.outputs, start=1):
+                zone_print = zone_print     + f"\n        Output '{output_number}'"
+                zone_print = zone_print     + f"\n            Output Id: {output.output_id}"
+                zone_print = zone_print     + f"\n            Display Name: {output.display_name}"
+                zone_print = zone_print     + f"\n            Zone Id: {output.zone_id}"
+
+                zone_print = zone_print     + f"\n            Source Controls: Count = {len(output.source_controls)}"
+                for source_control_number, source_control in enumerate(output.source_controls, start=1):
+                    zone_print = zone_print + f"\n                Source Controls '{source_control_number}'"
+                    zone_print = zone_print + f"\n                    Status: {source_control.status}"
+                    zone_print = zone_print + f"\n                    Display Name: {source_control.display_name}"
+                    zone_print = zone_print + f"\n                    Control Key: {source_control.control_key}"
+                    zone_print = zone_print + f"\n                    Supports Standby: {source_control.supports_standby}"
+                if output.volume is not None:
+                    zone_print = zone_print     + "\n            Volume:"
+                    zone_print = zone_print     + f"\n                Hard Limit Min: {output.volume.hard_limit_min}"
+                    zone_print = zone_print     + f"\n                Min: {output.volume.min}"
+                    zone_print = zone_print     + f"\n                Is Muted: {output.volume.is_muted}"
+                    zone_print = zone_print     + f"\n                Max: {output.volume.max}"
+                    zone_print = zone_print     + f"\n                Value: {output.volume.value}"
+                    zone_print = zone_print     + f"\n                Step: {output.volume.step}"
+                    zone_print = zone_print     + f"\n                Hard Limit Max: {output.volume.hard_limit_max}"
+                    zone_print = zone_print     + f"\n                Soft Limit: {output.volume.soft_limit}"
+                    zone_print = zone_print     + f"\n                Type: {output.volume.type}"
+
+                zone_print = zone_print     + f"\n            Can Group With Output Ids: Count = {len(output.can_group_with_output_ids)}"
+                for can_group_number, can_group_with_output_id in enumerate(output.can_group_with_output_ids, start=1):
+                    zone_print = zone_print + f"\n                Output Id [{can_group_number}]: {can_group_with_output_id}"
 
             zone_print = zone_print         + "\n    Now Playing:"
-            if 'artist_image_keys' in self.globals[ROON][ZONES][zone_id][NOW_PLAYING]:
-                zone_print = zone_print     + f"\n        Artist Image Keys: Count = {self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ARTIST_IMAGE_KEYS_COUNT]}"
-                for key, value in list(self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ARTIST_IMAGE_KEYS].items()):
-                    keyInt = int(key)
-                    zone_print = zone_print + f"\n            Artist Image Key: {self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ARTIST_IMAGE_KEYS][keyInt]}"
-
-            if 'image_key' in self.globals[ROON][ZONES][zone_id][NOW_PLAYING]:
-                zone_print = zone_print     + f"\n        Image Key: {self.globals[ROON][ZONES][zone_id][NOW_PLAYING][IMAGE_KEY]}"
-            if 'length' in self.globals[ROON][ZONES][zone_id][NOW_PLAYING]:
-                zone_print = zone_print     + f"\n        Length: {self.globals[ROON][ZONES][zone_id][NOW_PLAYING][LENGTH]}"
-            zone_print = zone_print         + f"\n        Seek Position: {self.globals[ROON][ZONES][zone_id][NOW_PLAYING][SEEK_POSITION]}"
+            zone_print = zone_print         + f"\n        Artist Image Keys: Count = {len(zone.now_playing.artist_image_keys)}"
+            for artist_image_key in zone.now_playing.artist_image_keys:
+                zone_print = zone_print     + f"\n            Artist Image Key: {artist_image_key}"
+
+            zone_print = zone_print         + f"\n        Image Key: {zone.now_playing.image_key}"
+            zone_print = zone_print         + f"\n        Length: {zone.now_playing.length}"
+            zone_print = zone_print         + f"\n        Seek Position: {zone.now_playing.seek_position}"
             zone_print = zone_print         +  "\n        One Line:"
-            zone_print = zone_print         + f"\n            Line 1: {self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ONE_LINE][LINE_1]}"
+            zone_print = zone_print         + f"\n            Line 1: {zone.now_playing.one_line_1}"
             zone_print = zone_print         +  "\n        Two Line:"
-            zone_print = zone_print         + f"\n            Line 1: {self.globals[ROON][ZONES][zone_id][NOW_PLAYING][TWO_LINE][LINE_1]}"
-            zone_print = zone_print         + f"\n            Line 2: {self.globals[ROON][ZONES][zone_id][NOW_PLAYING][TWO_LINE][LINE_2]}"
+            zone_print = zone_print         + f"\n            Line 1: {zone.now_playing.two_line_1}"
+            zone_print = zone_print         + f"\n            Line 2: {zone.now_playing.two_line_2}"
             zone_print = zone_print         +  "\n        Three Line:"
-            zone_print = zone_print         + f"\n            Line 1: {self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE][LINE_1]}"
-            zone_print = zone_print         + f"\n            Line 2: {self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE][LINE_2]}"
-            zone_print = zone_print         + f"\n            Line 3: {self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE][LINE_3]}"
+            zone_print = zone_print         + f"\n            Line 1: {zone.now_playing.three_line_1}"
+            zone_print = zone_print         + f"\n            Line 2: {zone.now_playing.three_line_2}"
+            zone_print = zone_print         + f"\n            Line 3: {zone.now_playing.three_line_3}"
 
-            zone_print = zone_print         + f"\n    Is Previous Allowed: {self.globals[ROON][ZONES][zone_id][IS_PREVIOUS_ALLOWED]}"
-            zone_print = zone_print         + f"\n    Is Pause Allowed: {self.globals[ROON][ZONES][zone_id][IS_PAUSE_ALLOWED]}"
-            zone_print = zone_print         + f"\n    Is Seek Allowed: {self.globals[ROON][ZONES][zone_id][IS_SEEK_ALLOWED]}"
-            zone_print = zone_print         + f"\n    State: {self.globals[ROON][ZONES][zone_id][STATE]}"
-            zone_print = zone_print         + f"\n    Is Play Allowed: {self.globals[ROON][ZONES][zone_id][IS_PLAY_ALLOWED]}"
-            zone_print = zone_print         + f"\n    Is Next Allowed: {self.globals[ROON][ZONES][zone_id][IS_NEXT_ALLOWED]}"
+            zone_print = zone_print         + f"\n    Is Previous Allowed: {zone.is_previous_allowed}"
+            zone_print = zone_print         + f"\n    Is Pause Allowed: {zone.is_pause_allowed}"
+            zone_print = zone_print         + f"\n    Is Seek Allowed: {zone.is_seek_allowed}"
+            zone_print = zone_print         + f"\n    State: {zone.state}"
+            zone_print = zone_print         + f"\n    Is Play Allowed: {zone.is_play_allowed}"
+            zone_print = zone_print         + f"\n    Is Next Allowed: {zone.is_next_allowed}"
 
             self.logger.debug(zone_print)
 
         except Exception as exception_error:
             self.exception_handler(exception_error, True)  # Log error and display failing statement
 
+    def log_callback_dispatcher_statistics(self):
+        try:
+            if self.globals[ROON][DISPATCHER] is None:
+                self.logger.info("Roon callback dispatcher not started")
+                return
+
+            stats = self.globals[ROON][DISPATCHER].stats()
+            stats_message = "\n"  # Start with a line break
+            stats_message += f"{' Roon Callback Dispatcher Statistics ':={'^'}80}\n"
+            stats_message += f"{'Callbacks submitted:':<31} {stats['submitted']}\n"
+            stats_message += f"{'Callbacks delivered:':<31} {stats['delivered']}\n"
+            stats_message += f"{'Callbacks dropped:':<31} {stats['dropped']}\n"
+            stats_message += f"{'Callbacks failed:':<31} {stats['errors']}\n"
+            stats_message += f"{'Queued now:':<31} {stats['queued']}\n"
+            stats_message += f"{'Queue depth per worker:':<31} {stats['queue_depths']}\n"
+            stats_message += f"{'Highest depth per worker:':<31} {stats['high_water']}\n"
+            stats_message += f"{'':={'^'}80}\n"
+            self.logger.info(stats_message)
+
+        except Exception as exception_error:
+            self.exception_handler(exception_error, True)  # Log error and display failing statement
+
     def print_zone_summary(self, pluginAction):
         try:
             self.print_known_zones_summary('PROCESS PRINT ZONE SUMMARY ACTION')
@@ -1085,6 +1268,10 @@ class Plugin(indigo.PluginBase):
                 self.logger.error(f"'process_group_outputs' Roon Controller Action '{plugin_action.pluginTypeId}' ignored as Output '{output_dev.name}' is not connected to the Roon Core.")
                 return
 
+            if self.globals[ROON][API] is None:
+                self.logger.error(f"'process_group_outputs' Roon Controller Action '{plugin_action.pluginTypeId}' ignored as 'Roon Controller' is not connected to the Roon Core yet.")
+                return
+
             forceGroupAction = bool(plugin_action.props.get('forceGroupAction', True))
 
             output_dev_plugin_props = output_dev.pluginProps
@@ -1119,8 +1306,25 @@ class Plugin(indigo.PluginBase):
             detailed_exception_error = f"Output Device '{output_dev_name}': {exception_error}"
             self.exception_handler(detailed_exception_error, True)  # Log error and display failing statement
 
+    def forget_image_slots(self, zone_dev_id):
+        for image_slot in [image_slot for image_slot in self.globals[ROON][IMAGE_SLOTS] if image_slot[0] == zone_dev_id]:
+            self.globals[ROON][IMAGE_SLOTS].pop(image_slot, None)
+
+    def image_slots_to_retry(self, zone_dev_id):
+        # True if any of the Zone device's six image slots has not been processed (or was cleared to be processed again)
+        return sum(1 for image_slot in self.globals[ROON][IMAGE_SLOTS] if image_slot[0] == zone_dev_id) < 6
+
     def process_image(self, image_type, image_suffix, zone_dev, image_key):
         try:
+            # Nothing to do if the slot's image key (and the device's image profiles) are unchanged since the slot was last processed,
+            # e.g. for a shuffle / loop toggle, a play state change or a queue counter update
+            image_profiles = self.zone_image_profiles(zone_dev.id)
+            image_slot = (zone_dev.id, image_type, image_suffix)
+            slot_image = (image_key, image_profiles)
+            if self.globals[ROON][IMAGE_SLOTS].get(image_slot) == slot_image:
+                return
+            self.globals[ROON][IMAGE_SLOTS][image_slot] = slot_image
+
             # Next section of logic just creates a Zone  image folder with a dummy text file with the display name of the Zone to aid in viewing the image folder structure
             zone_image_folder = f"{self.globals[ROON][PLUGIN_PREFS_FOLDER]}/{zone_dev.address}"
             if not os.path.exists(zone_image_folder):
@@ -1132,113 +1336,125 @@ class Plugin(indigo.PluginBase):
             image_name = ['Artist_Image', 'Album_Image'][image_type]
             if image_suffix != '':
                 image_name = f"{image_name}_{image_suffix}"
-            set_default_image = True
-            if image_key != '':
-                image_url = self.globals[ROON][API].get_image(image_key, scale="fill")
-                work_file = f"{self.globals[ROON][PLUGIN_PREFS_FOLDER]}/{zone_dev.address}/temp.jpg"
-                image_request = requests.get(image_url)
-                if image_request.status_code == 200:
-                    try:
-                        with open(work_file, 'wb') as f:
-                            f.write(image_request.content)
-                        image_to_process = Image.open(work_file)
-                        output_image_file = f"{self.globals[ROON][PLUGIN_PREFS_FOLDER]}/{zone_dev.address}/{image_name}.png"
-                        image_to_process.save(output_image_file)
-                        try:
-                            os.remove(work_file)
-                        except:  # Not sure why this doesn't always work!
-                            pass
-                        set_default_image = False
-                    except Exception as exception_error:  # noqa [Too broad exception]
+            output_image_file = f"{self.globals[ROON][PLUGIN_PREFS_FOLDER]}/{zone_dev.address}/{image_name}.png"
+
+            default_image_path = f"{self.globals[PLUGIN_INFO][PATH]}/Plugins/Roon.indigoPlugin/Contents/Resources/"
+            if image_type == ARTIST:
+                default_image_file = f"{default_image_path}Artist_Image.png"
+            elif image_type == ALBUM:
+                default_image_file = f"{default_image_path}Album_Image.png"
+            else:
+                default_image_file = f"{default_image_path}Unknown_Image.png"
+
+            image_cache = self.globals[ROON][IMAGE_CACHE]
+
+            # The standard image file plus one file per artwork profile of the Zone device
+            image_files = {profile: f"{zone_image_folder}/{image_name}{profile.file_suffix}" for profile in image_profiles[1:]}
+            image_files[image_profiles[0]] = output_image_file
+
+            def retry_slot():
+                # Process the slot's image again on its next update, unless a different image has been requested for the slot since
+                if self.globals[ROON][IMAGE_SLOTS].get(image_slot) == slot_image:
+                    self.globals[ROON][IMAGE_SLOTS].pop(image_slot, None)
+
+            def link_images(cached_image_files, exception_error=None):
+                try:
+                    if exception_error is not None:
                         # leave as default image if any problem reported but only output debug message
-                        self.logger.debug(f"'process_image' [DEBUG ONLY] error detected. Line '{sys.exc_traceback.tb_lineno}' has error: '{exception_error}'")
-            if set_default_image:
-                default_image_path = f"{self.globals[PLUGIN_INFO][PATH]}/Plugins/Roon.indigoPlugin/Contents/Resources/"
-                if image_type == ARTIST:
-                    default_image_file = f"{default_image_path}Artist_Image.png"
-                elif image_type == ALBUM:
-                    default_image_file = f"{default_image_path}Album_Image.png"
-                else:
-                    default_image_file = f"{default_image_path}Unknown_Image.png"
-                output_image_file = f"{self.globals[ROON][PLUGIN_PREFS_FOLDER]}/{zone_dev.address}/{image_name}.png"
-                copyfile(default_image_file, output_image_file)
+                        self.logger.debug(f"'process_image' [DEBUG ONLY] unable to fetch image '{image_key}' for '{zone_dev.address}/{image_name}': '{exception_error}'")
+                        retry_slot()
+                    for image_profile, image_file in image_files.items():
+                        try:
+                            image_cache.link(cached_image_files.get(image_profile, default_image_file), image_file)
+                        except FileNotFoundError:  # Evicted from the image cache in the meantime
+                            image_cache.link(default_image_file, image_file)
+                            retry_slot()
+                except Exception as link_exception_error:
+                    retry_slot()
+                    self.exception_handler(link_exception_error, True)  # Log error and display failing statement
+
+            if image_key == '':  # Slot cleared: (hard)link the default image, no copy
+                self.globals[ROON][IMAGE_FETCHER].set_now(output_image_file, lambda: link_images(dict()))
+                return
+
+            # The Zone's image files are updated straight away if the image is cached for all its profiles, otherwise once fetched
+            self.cache_images(output_image_file, image_key, image_profiles, link_images)
 
         except Exception as exception_error:
+            self.globals[ROON][IMAGE_SLOTS].pop((zone_dev.id, image_type, image_suffix), None)  # Try again on the next update
             self.exception_handler(exception_error, True)  # Log error and display failing statement
 
+    def zone_image_profiles(self, zone_dev_id):
+        # The image profiles of a Zone device: the standard image profile first, followed by the device's artwork profiles
+        standard_profile = STANDARD_JPEG_PROFILE if self.globals[CONFIG][KEEP_CORE_JPEG_IMAGES] else STANDARD_PNG_PROFILE
+        artwork_profiles = self.globals[ROON][DEVICE_CACHE].get(zone_dev_id).artwork_profiles
+        return (standard_profile,) + tuple(profile for profile in artwork_profiles if profile != standard_profile)
+
+    def cache_images(self, target, image_key, image_profiles, deliver):
+        # Get the image for each of the profiles from the image cache. The processed images are cached by image key and profile,
+        # across all Zones: only the profiles not seen before are fetched (a single download for all of them) and rendered, in the background.
+        # deliver({profile: cached image file}, exception_error or None) is then called for the target, straight away if all were cached
+        image_cache = self.globals[ROON][IMAGE_CACHE]
+        image_fetcher = self.globals[ROON][IMAGE_FETCHER]
+
+        cached_image_files = dict()
+        for profile in image_profiles:
+            cached_image_file = image_cache.get(image_key, profile.scale, profile.width, profile.height, profile.cache_format)
+            if cached_image_file is not None:
+                cached_image_files[profile] = cached_image_file
+        missing_profiles = tuple(profile for profile in image_profiles if profile not in cached_image_files)
+        if len(missing_profiles) == 0:
+            image_fetcher.set_now(target, lambda: deliver(cached_image_files, None))
+            return
+
+        source_scale, source_width, source_height = source_request(missing_profiles)
+
+        def render_images(content):  # Runs on an image fetcher thread
+            rendered_image_files = dict()
+            image = None
+            for image_profile in missing_profiles:
+                if len(missing_profiles) == 1 and image_profile.accepts(content):
+                    # No conversion needed: store the image as delivered by the Roon Core
+                    def write_image(path):
+                        with open(path, 'wb') as image_file:
+                            image_file.write(content)
+                else:
+                    if image is None:
+                        image = Image.open(io.BytesIO(content))  # Decoded once from memory, no temporary file
+                        image.load()
+
+                    def write_image(path, image_profile=image_profile):
+                        image_profile.render(image, path)
+                rendered_image_files[image_profile] = image_cache.add(image_key, image_profile.scale, image_profile.width, image_profile.height,
+                                                                      image_profile.cache_format, write_image)
+            return rendered_image_files
+
+        def deliver_images(rendered_image_files, exception_error):
+            if rendered_image_files is None:
+                deliver(cached_image_files, exception_error)
+            else:
+                deliver({**cached_image_files, **rendered_image_files}, None)
+
+        image_url = self.globals[ROON][API].get_image(image_key, scale=source_scale, width=source_width, height=source_height)
+        fetch_key = (image_key,) + tuple(profile.key() for profile in missing_profiles)  # Identical requests share one download
+        image_fetcher.fetch(target, fetch_key, image_url, render_images, deliver_images)
+
     def process_output(self, output_id, outputData):
         process_output_return_state = False
 
         try:
-            self.globals[ROON][OUTPUTS][output_id] = dict()
-            self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS] = dict()
-            self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS_COUNT] = 0
-            self.globals[ROON][OUTPUTS][output_id][VOLUME] = dict()
-            self.globals[ROON][OUTPUTS][output_id][CAN_GROUP_WITH_OUTPUT_IDS] = dict()
-
-            for outputKey, outputValue in list(outputData.items()):
-                if outputKey == 'output_id':
-                    self.globals[ROON][OUTPUTS][output_id][OUTPUT_ID] = outputValue
-                elif outputKey == 'display_name':
-                    self.globals[ROON][OUTPUTS][output_id][DISPLAY_NAME] = outputValue
-                elif outputKey == 'zone_id':
-                    self.globals[ROON][OUTPUTS][output_id][ZONE_ID] = outputValue
-                elif outputKey == 'source_controls':
-                    sourceControlsCount = 0
-                    for sourceControls in outputValue:
-                        sourceControlsCount += 1
-                        self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS][sourceControlsCount] = dict()
-                        for sourceControlKey, sourceControlData in list(sourceControls.items()):
-                            if sourceControlKey == 'status':
-                                self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS][sourceControlsCount][STATUS] = sourceControlData
-                            elif sourceControlKey == 'display_name':
-                                self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS][sourceControlsCount][DISPLAY_NAME] = sourceControlData
-                            elif sourceControlKey == 'control_key':
-                                self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS][sourceControlsCount][CONTROL_KEY] = sourceControlData
-                            elif sourceControlKey == 'supports_standby':
-                                self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS][sourceControlsCount][SUPPORTS_STANDBY] = bool(sourceControlData)
-                    self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS_COUNT] = sourceControlsCount
-
-                elif outputKey == 'volume':
-                    for volumeKey, volumeData in list(outputValue.items()):
-                        if volumeKey == 'hard_limit_min':
-                            self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_HARD_LIMIT_MIN] = volumeData
-                        elif volumeKey == 'min':
-                            self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_MIN] = volumeData
-                        elif volumeKey == 'is_muted':
-                            self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_IS_MUTED] = volumeData
-                        elif volumeKey == 'max':
-                            self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_MAX] = volumeData
-                        elif volumeKey == 'value':
-                            self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_VALUE] = volumeData
-                        elif volumeKey == 'step':
-                            self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_STEP] = volumeData
-                        elif volumeKey == 'hard_limit_max':
-                            self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_HARD_LIMIT_MAX] = volumeData
-                        elif volumeKey == 'soft_limit':
-                            self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_SOFT_LIMIT] = volumeData
-                        elif volumeKey == 'type':
-                            self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_TYPE] = volumeData
-
-                elif outputKey == 'can_group_with_output_ids':
-                    canGroupCount = 0
-                    for can_group_with_output_id in outputValue:
-                        canGroupCount += 1
-                        self.globals[ROON][OUTPUTS][output_id][CAN_GROUP_WITH_OUTPUT_IDS][canGroupCount] = can_group_with_output_id
-                    self.globals[ROON][OUTPUTS][output_id][CAN_GROUP_WITH_OUTPUT_IDS_COUNT] = canGroupCount
+            if output_id not in self.globals[ROON][OUTPUTS]:
+                self.globals[ROON][OUTPUTS][output_id] = Output()
+            self.globals[ROON][OUTPUTS][output_id].update(outputData)  # Update the existing Output in place
 
             if output_id not in self.globals[ROON][OUTPUT_ID_TO_DEV_ID]:
                 if self.globals[CONFIG][AUTO_CREATE_DEVICES]:
                     self.auto_create_output_device(output_id)
 
-            if len(self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS]) > 0:
+            if len(self.globals[ROON][OUTPUTS][output_id].source_controls) > 0:
                 process_output_return_state = True
             else:
-                self.globals[ROON][OUTPUTS][output_id] = dict()
-                self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS] = dict()
-                self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS_COUNT] = 0
-                self.globals[ROON][OUTPUTS][output_id][VOLUME] = dict()
-                self.globals[ROON][OUTPUTS][output_id][CAN_GROUP_WITH_OUTPUT_IDS] = dict()
+                self.globals[ROON][OUTPUTS][output_id] = Output()
                 if output_id in self.globals[ROON][OUTPUT_ID_TO_DEV_ID]:
                     self.disconnect_roon_output_device(self.globals[ROON][OUTPUT_ID_TO_DEV_ID][output_id])
                 process_output_return_state = False
@@ -1266,7 +1482,7 @@ class Plugin(indigo.PluginBase):
                     tempOutputs = self.globals[ROON][API].outputs
                     self.logger.debug(f"'process_outputs_changed' - ALL OUTPUTS = \n\n{tempOutputs}\n\n.")
 
-                output_data = copy.deepcopy(self.globals[ROON][API].output_by_output_id(output_id))
+                output_data = self.globals[ROON][API].output_by_output_id(output_id)  # Immutable snapshot of the output
                 processOutput_successful = self.process_output(output_id, output_data)
                 self.logger.debug(f"'process_outputs_added' - Output '{'TEMPORARY DEBUG NAME'}'. Output ID = '{output_id}'\n{output_data}")
 
@@ -1275,11 +1491,11 @@ class Plugin(indigo.PluginBase):
                         roonOutputDevId = self.globals[ROON][OUTPUT_ID_TO_DEV_ID][output_id]
                         self.update_roon_output_device(roonOutputDevId, output_id)
                         self.logger.debug(
-                            f"'process_outputs_added' - Output '{self.globals[ROON][OUTPUTS][output_id][DISPLAY_NAME]}'."
-                            f" Indigo Device = '{indigo.devices[roonOutputDevId].name}', Output ID = '{output_id}'")
+                            f"'process_outputs_added' - Output '{self.globals[ROON][OUTPUTS][output_id].display_name}'."
+                            f" Indigo Device = '{self.globals[ROON][DEVICE_CACHE].get(roonOutputDevId).dev.name}', Output ID = '{output_id}'")
                     else:
                         self.logger.debug(
-                            f"'process_outputs_added' - Output '{self.globals[ROON][OUTPUTS][output_id][DISPLAY_NAME]}' no matching Indigo device. Output ID = '{output_id}'")
+                            f"'process_outputs_added' - Output '{self.globals[ROON][OUTPUTS][output_id].display_name}' no matching Indigo device. Output ID = '{output_id}'")
 
                         if self.globals[CONFIG][AUTO_CREATE_DEVICES]:
                             self.auto_create_output_device(output_id)
@@ -1299,17 +1515,19 @@ class Plugin(indigo.PluginBase):
                 #         f"'process_outputs_changed' - ALL OUTPUTS = \n\n{tempOutputs}\n\n.")
                 # DEBUG END
 
-                output_data = copy.deepcopy(self.globals[ROON][API].output_by_output_id(output_id))
+                output_data = self.globals[ROON][API].output_by_output_id(output_id)  # Immutable snapshot of the output
+                if output_data is None:
+                    continue  # Output removed before this (deferred) change was processed
                 processOutput_successful = self.process_output(output_id, output_data)
 
                 if processOutput_successful:
                     if output_id in self.globals[ROON][OUTPUT_ID_TO_DEV_ID]:
                         roonOutputDevId = self.globals[ROON][OUTPUT_ID_TO_DEV_ID][output_id]
                         self.update_roon_output_device(roonOutputDevId, output_id)
-                        self.logger.debug(f"'process_outputs_changed' - Output '{self.globals[ROON][OUTPUTS][output_id][DISPLAY_NAME]}'."
-                                          f" Indigo Device = '{indigo.devices[roonOutputDevId].name}', Output ID = '{ output_id}'\nOutput Data:\n{output_data}\n")
+                        self.logger.debug(f"'process_outputs_changed' - Output '{self.globals[ROON][OUTPUTS][output_id].display_name}'."
+                                          f" Indigo Device = '{self.globals[ROON][DEVICE_CACHE].get(roonOutputDevId).dev.name}', Output ID = '{ output_id}'\nOutput Data:\n{output_data}\n")
                     else:
-                        self.logger.debug(f"'process_outputs_changed' - Output '{self.globals[ROON][OUTPUTS][output_id][DISPLAY_NAME]}'. Output ID = '{output_id}'\n{output_data}")
+                        self.logger.debug(f"'process_outputs_changed' - Output '{self.globals[ROON][OUTPUTS][output_id].display_name}'. Output ID = '{output_id}'\n{output_data}")
 
         except Exception as exception_error:
             self.exception_handler(exception_error, True)  # Log error and display failing statement
@@ -1324,12 +1542,12 @@ class Plugin(indigo.PluginBase):
                     output_display_name = "Unknown Output"
                     self.logger.debug(
                         f"'OUTPUT REMOVED' - Output:\n{self.globals[ROON][OUTPUTS][output_id]}")
-                    if DISPLAY_NAME in self.globals[ROON][OUTPUTS][output_id]:
-                        output_display_name = self.globals[ROON][OUTPUTS][output_id][DISPLAY_NAME]
+                    if self.globals[ROON][OUTPUTS][output_id].display_name != '':
+                        output_display_name = self.globals[ROON][OUTPUTS][output_id].display_name
                     if output_id in self.globals[ROON][OUTPUT_ID_TO_DEV_ID]:
                         roon_output_dev_id = self.globals[ROON][OUTPUT_ID_TO_DEV_ID][output_id]
                         self.disconnect_roon_output_device(roon_output_dev_id)
-                        self.logger.debug(f"'OUTPUT REMOVED' - Output '{output_display_name}'. Indigo Device = '{indigo.devices[roon_output_dev_id].name}', Output ID = '{output_id}'")
+                        self.logger.debug(f"'OUTPUT REMOVED' - Output '{output_display_name}'. Indigo Device = '{self.globals[ROON][DEVICE_CACHE].get(roon_output_dev_id).dev.name}', Output ID = '{output_id}'")
                     else:
                         self.logger.debug(f"'OUTPUT REMOVED' - Output '{output_display_name}' no matching Indigo device.")
 
@@ -1358,6 +1576,10 @@ class Plugin(indigo.PluginBase):
                 self.logger.error(f"Roon Controller Action '{plugin_action.pluginTypeId}' ignored as Zone '{zone_dev.name}' is not connected to the Roon Core.")
                 return False
 
+            if self.globals[ROON][API] is None:
+                self.logger.error(f"Roon Controller Action '{plugin_action.pluginTypeId}' ignored as 'Roon Controller' is not connected to the Roon Core yet.")
+                return False
+
             self.globals[ROON][API].playback_control(zone_id, plugin_action.pluginTypeId.lower())
 
             return True
@@ -1384,13 +1606,21 @@ class Plugin(indigo.PluginBase):
                 self.logger.error(f"Roon Controller Action '{plugin_action.pluginTypeId}' ignored as Zone '{ zone_dev.name}' is not connected to the Roon Core.")
                 return
 
-            if self.globals[ROON][ZONES][zone_id][OUTPUTS_COUNT] > 0:
-                for output_number in self.globals[ROON][ZONES][zone_id][OUTPUTS]:
-                    output_id = self.globals[ROON][ZONES][zone_id][OUTPUTS][output_number][OUTPUT_ID]
+            if self.globals[ROON][API] is None:
+                self.logger.error(f"Roon Controller Action '{plugin_action.pluginTypeId}' ignored as 'Roon Controller' is not connected to the Roon Core yet.")
+                return
+
+            if len(self.globals[ROON][ZONES][zone_id].outputs) > 0:
+                mute_requests = []
+                for output in self.globals[ROON][ZONES][zone_id].outputs:
+                    output_id = output.output_id
+
+                    toggle = not self.globals[ROON][OUTPUTS][output_id].volume.is_muted
 
-                    toggle = not self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_IS_MUTED]
+                    mute_requests.append((SERVICE_TRANSPORT + "/mute", {"output_id": output_id, "how": "mute" if toggle else "unmute"}))
 
-                    self.globals[ROON][API].mute(output_id, toggle)
+                # Send the requests for all outputs of the zone back-to-back rather than waiting for each response in turn
+                self.globals[ROON][API].request_many(mute_requests)
 
         except Exception as exception_error:
             zone_dev_name = "Unknown Device"
@@ -1401,6 +1631,11 @@ class Plugin(indigo.PluginBase):
 
     def process_playback_control_mute_all(self, plugin_action, zone_dev):
         try:
+            if self.globals[ROON][API] is None:
+                self.logger.error(f"Roon Controller Action '{plugin_action.pluginTypeId}' ignored as 'Roon Controller' is not connected to the Roon Core yet.")
+                return
+
+            mute_requests = []
             for zone_dev in indigo.devices.iter("self"):
                 if zone_dev.deviceTypeId == 'roonZone':
 
@@ -1413,10 +1648,14 @@ class Plugin(indigo.PluginBase):
                         self.logger.debug(f"Roon Controller Action '{plugin_action.pluginTypeId}' ignored as Zone '{zone_dev.name}' is not connected to the Roon Core.")
                         continue
 
-                    if self.globals[ROON][ZONES][zone_id][OUTPUTS_COUNT] > 0:
-                        for output_number in self.globals[ROON][ZONES][zone_id][OUTPUTS]:
-                            output_id = self.globals[ROON][ZONES][zone_id][OUTPUTS][output_number][OUTPUT_ID]
-                            self.globals[ROON][API].mute(output_id, True)
+                    if len(self.globals[ROON][ZONES][zone_id].outputs) > 0:
+                        for output in self.globals[ROON][ZONES][zone_id].outputs:
+                            output_id = output.output_id
+                            mute_requests.append((SERVICE_TRANSPORT + "/mute", {"output_id": output_id, "how": "mute"}))
+
+            # Send the requests for all outputs back-to-back rather than waiting for each response in turn
+            if mute_requests:
+                self.globals[ROON][API].request_many(mute_requests)
 
         except Exception as exception_error:
             zone_dev_name = "Unknown Device"
@@ -1513,6 +1752,10 @@ class Plugin(indigo.PluginBase):
                                   f" ignored as Output '{output_dev.name}' is not connected to the Roon Core.")
                 return
 
+            if self.globals[ROON][API] is None:
+                self.logger.error(f"'process_playback_control_volume_decrease' Roon Controller Action '{plugin_action.pluginTypeId}' ignored as 'Roon Controller' is not connected to the Roon Core yet.")
+                return
+
             volume_decrement = -int(plugin_action.props['volumeDecrease'])
             if volume_decrement > -1:
                 volume_decrement = -1  # SAFETY CHECK!
@@ -1544,6 +1787,10 @@ class Plugin(indigo.PluginBase):
                                   f" ignored as Output '{output_dev.name}' is not connected to the Roon Core.")
                 return
 
+            if self.globals[ROON][API] is None:
+                self.logger.error(f"'process_playback_control_volume_increase' Roon Controller Action '{plugin_action.pluginTypeId}' ignored as 'Roon Controller' is not connected to the Roon Core yet.")
+                return
+
             volume_increment = int(plugin_action.props['volumeIncrease'])
             if volume_increment > 10:
                 volume_increment = 1  # SAFETY CHECK!
@@ -1573,6 +1820,10 @@ class Plugin(indigo.PluginBase):
                                   f" ignored as Output '{output_dev.name}' is not connected to the Roon Core.")
                 return
 
+            if self.globals[ROON][API] is None:
+                self.logger.error(f"'process_playback_control_volume_set' Roon Controller Action '{plugin_action.pluginTypeId}' ignored as 'Roon Controller' is not connected to the Roon Core yet.")
+                return
+
             volume_level = int(plugin_action.props['volumePercentage'])
 
             self.globals[ROON][API].change_volume(output_id, volume_level, method='absolute')
@@ -1584,20 +1835,62 @@ class Plugin(indigo.PluginBase):
             detailed_exception_error = f"Output Device '{output_dev_name}': {exception_error}"
             self.exception_handler(detailed_exception_error, True)  # Log error and display failing statement
 
-    def process_roon_callback_queue(self):
+    def update_queue_prefetch(self, zone_id, queue_prefetch_items):
+        # Subscribe to (or unsubscribe from) the Zone's play queue as set for its Roon Zone device: the queue is held up to and including
+        # the next queue_prefetch_items tracks, so that their artwork can be prefetched into the image cache
+        max_items = queue_prefetch_items + 1 if queue_prefetch_items > 0 else 0  # The first queue item is the track now playing
+        if self.globals[ROON][API] is None:
+            self.logger.debug(f"'update_queue_prefetch' ignored for Zone ID '{zone_id}' as 'Roon Controller' is not connected to the Roon Core yet")
+            return
+        zone_queue = self.globals[ROON][QUEUES].get(zone_id)
+        if (0 if zone_queue is None else zone_queue.max_items) == max_items:
+            return
+        self.cancel_queue_prefetch(zone_id)
+        if max_items > 0:
+            self.globals[ROON][QUEUES][zone_id] = ZoneQueue(max_items)
+            self.globals[ROON][API].register_queue_callback(lambda data, queue_zone_id=zone_id: self.process_roon_callback_queue(queue_zone_id, data),
+                                                            zone_id, max_item_count=max_items)
+
+    def cancel_queue_prefetch(self, zone_id):
+        if self.globals[ROON][QUEUES].pop(zone_id, None) is not None and self.globals[ROON][API] is not None:
+            self.globals[ROON][API].unregister_queue_callback(zone_id)
+
+    def process_roon_callback_queue(self, zone_id, data):
         try:
-            self.logger.debug(f"'Roon [SELF] Queue Callback' '{event}': {changed_items}")
+            zone_queue = self.globals[ROON][QUEUES].get(zone_id)
+            zone = self.globals[ROON][ZONES].get(zone_id)
+            if zone_queue is None or zone is None:
+                return  # Unsubscribed in the meantime
+            zone_queue.update(data)
+
+            zone_dev_id = self.globals[ROON][ZONE_UNIQUE_IDENTITY_KEY_TO_DEV_ID].get(zone.unique_identity_key)
+            if zone_dev_id is None:
+                return
+
+            # Fetch the album artwork of the queued tracks into the image cache (for all the Zone device's image profiles), so that on
+            # a track change the Zone's image files are just relinked to the cached images. A track change whilst a prefetch is still
+            # in flight shares its download
+            image_profiles = self.zone_image_profiles(zone_dev_id)
+            for queue_item in zone_queue.items:
+                if queue_item.image_key != '':
+                    self.cache_images(('prefetch', queue_item.image_key), queue_item.image_key, image_profiles, self.prefetched_images)
+
+            self.logger.debug(f"'Roon [SELF] Queue Callback' Zone '{zone.display_name}': {[queue_item.one_line_1 for queue_item in zone_queue.items]}")
 
         except Exception as exception_error:
             self.exception_handler(exception_error, True)  # Log error and display failing statement
 
-    def process_roon_callback_state(self, event, changed_items):
+    def prefetched_images(self, cached_image_files, exception_error):
+        if exception_error is not None:
+            self.logger.debug(f"'prefetched_images' [DEBUG ONLY] unable to prefetch image: '{exception_error}'")
+
+    def process_roon_callback_state(self, event, changed_items, changes=None):
         try:
             if event == 'zones_seek_changed':
                 self.process_zones_seek_changed(event, changed_items)
 
             elif event == 'zones_changed':
-                self.process_zones_changed(event, changed_items)
+                self.process_zones_changed(event, changed_items, changes)
 
             elif event == 'zones_added':
                 self.process_zones_added(event, changed_items)
@@ -1632,193 +1925,24 @@ class Plugin(indigo.PluginBase):
         try:
             self.logger.debug(f"PROCESS ZONE - ZONEDATA:\n{zoneData}\n")
 
-            self.globals[ROON][ZONES][zone_id] = dict()
-
-            self.globals[ROON][ZONES][zone_id][ZONE_ID] = ""
-            self.globals[ROON][ZONES][zone_id][QUEUE_ITEMS_REMAINING] = 0
-            self.globals[ROON][ZONES][zone_id][QUEUE_TIME_REMAINING] = 0
-            self.globals[ROON][ZONES][zone_id][DISPLAY_NAME] = ""
-            self.globals[ROON][ZONES][zone_id][SETTINGS] = dict()
-            self.globals[ROON][ZONES][zone_id][SETTINGS][AUTO_RADIO] = False
-            self.globals[ROON][ZONES][zone_id][SETTINGS][SHUFFLE] = False
-            self.globals[ROON][ZONES][zone_id][SETTINGS][LOOP] = "disabled"
-            self.globals[ROON][ZONES][zone_id][ZONE_UNIQUE_IDENTITY_KEY] = ""
-            self.globals[ROON][ZONES][zone_id][OUTPUTS] = dict()
-            self.globals[ROON][ZONES][zone_id][OUTPUTS_COUNT] = 0
-            self.globals[ROON][ZONES][zone_id][NOW_PLAYING] = dict()
-            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ARTIST_IMAGE_KEYS] = dict()
-            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ARTIST_IMAGE_KEYS_COUNT] = 0
-            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][IMAGE_KEY] = ""
-            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ONE_LINE] = dict()
-            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ONE_LINE][LINE_1] = ""
-            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][TWO_LINE] = dict()
-            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][TWO_LINE][LINE_1] = ""
-            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][TWO_LINE][LINE_2] = ""
-            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE] = dict()
-            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE][LINE_1] = ""
-            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE][LINE_2] = ""
-            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE][LINE_3] = ""
-            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][LENGTH] = 0
-            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][SEEK_POSITION] = 0
-            self.globals[ROON][ZONES][zone_id][IS_PREVIOUS_ALLOWED] = False
-            self.globals[ROON][ZONES][zone_id][IS_PAUSE_ALLOWED] = False
-            self.globals[ROON][ZONES][zone_id][IS_SEEK_ALLOWED] = False
-            self.globals[ROON][ZONES][zone_id][STATE] = "stopped"
-            self.globals[ROON][ZONES][zone_id][IS_PLAY_ALLOWED] = False
-            self.globals[ROON][ZONES][zone_id][IS_NEXT_ALLOWED] = False
-
-            for zoneKey, zoneValue in list(zoneData.items()):
-
-                if zoneKey == 'zone_id':
-                    self.globals[ROON][ZONES][zone_id][ZONE_ID] = zoneValue
-                if zoneKey == 'queue_items_remaining':
-                    self.globals[ROON][ZONES][zone_id][QUEUE_ITEMS_REMAINING] = zoneValue
-                elif zoneKey == 'queue_time_remaining':
-                    self.globals[ROON][ZONES][zone_id][QUEUE_TIME_REMAINING] = zoneValue
-                elif zoneKey == 'display_name':
-                    self.globals[ROON][ZONES][zone_id][DISPLAY_NAME] = zoneValue
-                elif zoneKey == 'settings':
-                    self.globals[ROON][ZONES][zone_id][SETTINGS] = dict()
-                    for zoneKey2, zoneValue2 in list(zoneValue.items()):
-                        if zoneKey2 == 'auto_radio':
-                            self.globals[ROON][ZONES][zone_id][SETTINGS][AUTO_RADIO] = bool(zoneValue2)
-                        elif zoneKey2 == 'shuffle':
-                            self.globals[ROON][ZONES][zone_id][SETTINGS][SHUFFLE] = bool(zoneValue2)
-                        elif zoneKey2 == 'loop':
-                            self.globals[ROON][ZONES][zone_id][SETTINGS][LOOP] = zoneValue2
-                elif zoneKey == 'outputs':
-                    self.globals[ROON][ZONES][zone_id][OUTPUTS] = dict()
-                    outputCount = 0
-                    outputsList = list()
-
-                    for output in zoneValue:
-
-
-                        outputCount += 1
-                        self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount] = dict()
-                        for outputKey, outputData in list(output.items()):
-                            if outputKey == 'output_id':
-                                self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][OUTPUT_ID] = outputData
-                                outputsList.append(outputData)
-                            elif outputKey == 'display_name':
-                                self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][DISPLAY_NAME] = outputData
-                            elif outputKey == 'zone_id':
-                                self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][ZONE_ID] = outputData
-                            elif outputKey == 'source_controls':
-                                self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][SOURCE_CONTROLS] = dict()
-                                sourceControlsCount = 0
-                                for sourceControls in outputData:
-                                    sourceControlsCount += 1
-                                    self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][SOURCE_CONTROLS][sourceControlsCount] = dict()
-                                    for sourceControlKey, sourceControlData in list(sourceControls.items()):
-                                        if sourceControlKey == 'status':
-                                            self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][SOURCE_CONTROLS][sourceControlsCount][STATUS] = sourceControlData
-                                        elif sourceControlKey == 'display_name':
-                                            self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][SOURCE_CONTROLS][sourceControlsCount][DISPLAY_NAME] = sourceControlData
-                                        elif sourceControlKey == 'control_key':
-                                            self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][SOURCE_CONTROLS][sourceControlsCount][CONTROL_KEY] = sourceControlData
-                                        elif sourceControlKey == 'supports_standby':
-                                            self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][SOURCE_CONTROLS][sourceControlsCount][SUPPORTS_STANDBY] = bool(sourceControlData)
-                                self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][SOURCE_CONTROLS_COUNT] = sourceControlsCount
-                            elif outputKey == 'volume':
-                                self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][VOLUME] = dict()
-                                for volumeKey, volumeData in list(outputData.items()):
-                                    if volumeKey == 'hard_limit_min':
-                                        self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][VOLUME][VOLUME_HARD_LIMIT_MIN] = volumeData
-                                    elif volumeKey == 'min':
-                                        self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][VOLUME][VOLUME_MIN] = volumeData
-                                    elif volumeKey == 'is_muted':
-                                        self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][VOLUME][VOLUME_IS_MUTED] = volumeData
-                                    elif volumeKey == 'max':
-                                        self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][VOLUME][VOLUME_MAX] = volumeData
-                                    elif volumeKey == 'value':
-                                        self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][VOLUME][VOLUME_VALUE] = volumeData
-                                    elif volumeKey == 'step':
-                                        self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][VOLUME][VOLUME_STEP] = volumeData
-                                    elif volumeKey == 'hard_limit_max':
-                                        self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][VOLUME][VOLUME_HARD_LIMIT_MAX] = volumeData
-                                    elif volumeKey == 'soft_limit':
-                                        self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][VOLUME][VOLUME_SOFT_LIMIT] = volumeData
-                                    elif volumeKey == 'type':
-                                        self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][VOLUME][VOLUME_TYPE] = volumeData
-
-                            elif outputKey == 'can_group_with_output_ids':
-                                self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][CAN_GROUP_WITH_OUTPUT_IDS] = dict()
-                                canGroupCount = 0
-                                for can_group_with_output_id in outputData:
-                                    canGroupCount += 1
-                                    self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][CAN_GROUP_WITH_OUTPUT_IDS][canGroupCount] = can_group_with_output_id
-                                self.globals[ROON][ZONES][zone_id][OUTPUTS][outputCount][CAN_GROUP_WITH_OUTPUT_IDS_COUNT] = canGroupCount
-                    self.globals[ROON][ZONES][zone_id][OUTPUTS_COUNT] = outputCount
-                    outputsList.sort()
-                    self.globals[ROON][ZONES][zone_id][ZONE_UNIQUE_IDENTITY_KEY] = self.convert_output_id_list_to_string(outputsList)
-
-                elif zoneKey == 'now_playing':
-                    for zoneKey2, zoneValue2 in list(zoneValue.items()):
-                        if zoneKey2 == 'artist_image_keys':
-                            artistImageCount = 0
-                            for artist_image_key in zoneValue2:
-                                artistImageCount += 1
-                                self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ARTIST_IMAGE_KEYS][artistImageCount] = artist_image_key
-                            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ARTIST_IMAGE_KEYS_COUNT] = artistImageCount
-                        elif zoneKey2 == 'image_key':
-                            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][IMAGE_KEY] = zoneValue2
-                        elif zoneKey2 == 'one_line':
-                            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ONE_LINE] = dict()
-                            for zoneKey3, zoneValue3 in list(zoneValue2.items()):
-                                if zoneKey3 == 'line1':
-                                    self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ONE_LINE][LINE_1] = zoneValue3
-                        elif zoneKey2 == 'two_line':
-                            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][TWO_LINE] = dict()
-                            for zoneKey3, zoneValue3 in list(zoneValue2.items()):
-                                if zoneKey3 == 'line1':
-                                    self.globals[ROON][ZONES][zone_id][NOW_PLAYING][TWO_LINE][LINE_1] = zoneValue3
-                                elif zoneKey3 == 'line2':
-                                    self.globals[ROON][ZONES][zone_id][NOW_PLAYING][TWO_LINE][LINE_2] = zoneValue3
-                        elif zoneKey2 == 'three_line':
-                            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE] = dict()
-                            for zoneKey3, zoneValue3 in list(zoneValue2.items()):
-                                if zoneKey3 == 'line1':
-                                    self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE][LINE_1] = zoneValue3
-                                elif zoneKey3 == 'line2':
-                                    self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE][LINE_2] = zoneValue3
-                                elif zoneKey3 == 'line3':
-                                    self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE][LINE_3] = zoneValue3
-                        if zoneKey2 == 'length':
-                            self.globals[ROON][ZONES][zone_id][NOW_PLAYING][LENGTH] = zoneValue2
-                        if zoneKey2 == 'seek_position':
-                            if zoneValue2 is None:
-                                self.globals[ROON][ZONES][zone_id][NOW_PLAYING][SEEK_POSITION] = 0
-                            else:
-                                self.globals[ROON][ZONES][zone_id][NOW_PLAYING][SEEK_POSITION] = zoneValue2
-
-                elif zoneKey == 'is_previous_allowed':
-                    self.globals[ROON][ZONES][zone_id][IS_PREVIOUS_ALLOWED] = bool(zoneValue)
-                elif zoneKey == 'is_pause_allowed':
-                    self.globals[ROON][ZONES][zone_id][IS_PAUSE_ALLOWED] = bool(zoneValue)
-                elif zoneKey == 'is_seek_allowed':
-                    self.globals[ROON][ZONES][zone_id][IS_SEEK_ALLOWED] = bool(zoneValue)
-                elif zoneKey == 'state':
-                    self.globals[ROON][ZONES][zone_id][STATE] = zoneValue
-                elif zoneKey == 'is_play_allowed':
-                    self.globals[ROON][ZONES][zone_id][IS_PLAY_ALLOWED] = bool(zoneValue)
-                elif zoneKey == 'is_next_allowed':
-                    self.globals[ROON][ZONES][zone_id][IS_NEXT_ALLOWED] = bool(zoneValue)
+            if zone_id not in self.globals[ROON][ZONES]:
+                self.globals[ROON][ZONES][zone_id] = Zone()
+            self.globals[ROON][ZONES][zone_id].update(zoneData)  # Update the existing Zone in place
 
             # ### SPECIAL ANNOUCEMENT CODE - START ####
-            if self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE][LINE_1] != '':
-                zone_state = self.globals[ROON][ZONES][zone_id][STATE]
+            if self.globals[ROON][ZONES][zone_id].now_playing.three_line_1 != '':
+                zone_state = self.globals[ROON][ZONES][zone_id].state
                 self.logger.debug(f"STC. STATE = {zone_state}")
 
                 if zone_state == "playing":
-                    announcement_track = self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE][LINE_1]
-                    work_artist = self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE][LINE_2]
+                    announcement_track = self.globals[ROON][ZONES][zone_id].now_playing.three_line_1
+                    work_artist = self.globals[ROON][ZONES][zone_id].now_playing.three_line_2
                     work_artist = work_artist.replace(' / Various Artists', '')
                     work_artist = work_artist.replace(' / ', ' and ')
                     work_artist = work_artist.replace(' & ', ' and ')
                     work_artist = work_artist.replace(', Jr.', ' junior')
                     announcement_artist = work_artist
-                    announcement_album = self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE][LINE_3]
+                    announcement_album = self.globals[ROON][ZONES][zone_id].now_playing.three_line_3
                     work_announcement = f"Now playing {announcement_track}"
                     if announcement_artist != '':
                         work_announcement = f"{work_announcement}, by {announcement_artist}"
@@ -1832,31 +1956,31 @@ class Plugin(indigo.PluginBase):
 
                 self.logger.debug(f"STC. OUTPUT ID TO DEV ID = {self.globals[ROON][OUTPUT_ID_TO_DEV_ID]}")
 
-                for key, output in list(self.globals[ROON][ZONES][zone_id][OUTPUTS].items()):
-                    self.logger.debug(f"STC. Key = {key}, Output ID = {output}")
-                    if 'output_id' in output:
-                        roonOutputDevId = self.globals[ROON][OUTPUT_ID_TO_DEV_ID][output[OUTPUT_ID]]
+                for output in self.globals[ROON][ZONES][zone_id].outputs:
+                    self.logger.debug(f"STC. Output ID = {output.output_id}")
+                    if output.output_id in self.globals[ROON][OUTPUT_ID_TO_DEV_ID]:
+                        roonOutputDevId = self.globals[ROON][OUTPUT_ID_TO_DEV_ID][output.output_id]
                         self.logger.debug(f"STC. ROONOUTPUTDEVID = {roonOutputDevId}")
 
-                        roonOutputDev = indigo.devices[roonOutputDevId]
-                        if roonOutputDev.enabled:
-                            nowPlayingVarId = int(roonOutputDev.pluginProps.get('nowPlayingVarId', 0))
-                            self.logger.debug(f"STC. INDIGO OUTPUT DEV [{roonOutputDev.name}]: NOWPLAYINGVARID = {nowPlayingVarId}")
+                        roonOutputDevice = self.globals[ROON][DEVICE_CACHE].get(roonOutputDevId)
+                        if roonOutputDevice.enabled:
+                            nowPlayingVarId = roonOutputDevice.now_playing_var_id
+                            self.logger.debug(f"STC. INDIGO OUTPUT DEV [{roonOutputDevice.dev.name}]: NOWPLAYINGVARID = {nowPlayingVarId}")
                             if nowPlayingVarId != 0:
                                 indigo.variable.updateValue(nowPlayingVarId, value=announcement)
 
             # ### SPECIAL ANNOUCEMENT CODE - END ####
 
-            if self.globals[ROON][ZONES][zone_id][ZONE_ID] != '' and self.globals[ROON][ZONES][zone_id][ZONE_UNIQUE_IDENTITY_KEY] != '':
-                self.globals[ROON][ZONE_UNIQUE_IDENTITY_KEY_TO_ZONE_ID][self.globals[ROON][ZONES][zone_id][ZONE_UNIQUE_IDENTITY_KEY]] = self.globals[ROON][ZONES][zone_id][ZONE_ID]
+            if self.globals[ROON][ZONES][zone_id].zone_id != '' and self.globals[ROON][ZONES][zone_id].unique_identity_key != '':
+                self.globals[ROON][ZONE_UNIQUE_IDENTITY_KEY_TO_ZONE_ID][self.globals[ROON][ZONES][zone_id].unique_identity_key] = self.globals[ROON][ZONES][zone_id].zone_id
 
-                if self.globals[ROON][ZONES][zone_id][ZONE_UNIQUE_IDENTITY_KEY] not in self.globals[ROON][ZONE_UNIQUE_IDENTITY_KEY_TO_DEV_ID]:
+                if self.globals[ROON][ZONES][zone_id].unique_identity_key not in self.globals[ROON][ZONE_UNIQUE_IDENTITY_KEY_TO_DEV_ID]:
                     if self.globals[CONFIG][AUTO_CREATE_DEVICES]:
-                        self.auto_create_zone_device(zone_id, self.globals[ROON][ZONES][zone_id][ZONE_UNIQUE_IDENTITY_KEY])
+                        self.auto_create_zone_device(zone_id, self.globals[ROON][ZONES][zone_id].unique_identity_key)
 
             else:
                 self.logger.error(f"'process_zone' unable to set up 'zoneUniqueIdentityKeyToZoneId'"
-                                  f" entry: Zone_id = '{zone_id}', zone_unique_identity_key = '{self.globals[ROON][ZONES][zone_id][ZONE_UNIQUE_IDENTITY_KEY]}'")
+                                  f" entry: Zone_id = '{zone_id}', zone_unique_identity_key = '{self.globals[ROON][ZONES][zone_id].unique_identity_key}'")
 
         except Exception as exception_error:
             self.exception_handler(exception_error, True)  # Log error and display failing statement
@@ -1876,19 +2000,19 @@ class Plugin(indigo.PluginBase):
             # self.print_known_zones_summary('PROCESS ZONES ADDED')
 
             for zone_id in changed_items:
-                zoneData = copy.deepcopy(self.globals[ROON][API].zone_by_zone_id(zone_id))
+                zoneData = self.globals[ROON][API].zone_by_zone_id(zone_id)  # Immutable snapshot of the zone
                 self.process_zone(zone_id, zoneData)
-                zoneUniqueIdentityKey = self.globals[ROON][ZONES][zone_id][ZONE_UNIQUE_IDENTITY_KEY]
-                self.logger.debug(f"'process_zones_added' - Zone '{self.globals[ROON][ZONES][zone_id][DISPLAY_NAME]}'. Zone ID = '{zone_id}', "
+                zoneUniqueIdentityKey = self.globals[ROON][ZONES][zone_id].unique_identity_key
+                self.logger.debug(f"'process_zones_added' - Zone '{self.globals[ROON][ZONES][zone_id].display_name}'. Zone ID = '{zone_id}', "
                                   f"Unique ID = '{zoneUniqueIdentityKey}'\nZoneData:\n{zoneData}\n")
 
                 if zoneUniqueIdentityKey in self.globals[ROON][ZONE_UNIQUE_IDENTITY_KEY_TO_DEV_ID]:
                     roonZoneDevId = self.globals[ROON][ZONE_UNIQUE_IDENTITY_KEY_TO_DEV_ID][zoneUniqueIdentityKey]
                     self.update_roon_zone_device(roonZoneDevId, zone_id)
-                    self.logger.debug(f"'process_zones_added' - Zone '{self.globals[ROON][ZONES][zone_id][DISPLAY_NAME]}'. Indigo Device = '{indigo.devices[roonZoneDevId].name}', "
+                    self.logger.debug(f"'process_zones_added' - Zone '{self.globals[ROON][ZONES][zone_id].display_name}'. Indigo Device = '{self.globals[ROON][DEVICE_CACHE].get(roonZoneDevId).dev.name}', "
                                       f"Zone ID = '{zone_id}', Unique ID = '{zoneUniqueIdentityKey}'")
                 else:
-                    self.logger.debug(f"'process_zones_added' - Zone '{self.globals[ROON][ZONES][zone_id][DISPLAY_NAME]}' no matching Indigo device."
+                    self.logger.debug(f"'process_zones_added' - Zone '{self.globals[ROON][ZONES][zone_id].display_name}' no matching Indigo device."
                                       f" Zone ID = '{zone_id}', Unique ID = '{zoneUniqueIdentityKey}'")
 
                     if self.globals[CONFIG][AUTO_CREATE_DEVICES]:
@@ -1897,23 +2021,28 @@ class Plugin(indigo.PluginBase):
         except Exception as exception_error:
             self.exception_handler(exception_error, True)  # Log error and display failing statement
 
-    def process_zones_changed(self, event, changed_items):
+    def process_zones_changed(self, event, changed_items, changes=None):
         try:
             # self.print_known_zones_summary('PROCESS ZONES CHANGED')
 
             for zone_id in changed_items:
 
-                zoneData = copy.deepcopy(self.globals[ROON][API].zone_by_zone_id(zone_id))
+                zoneData = self.globals[ROON][API].zone_by_zone_id(zone_id)  # Immutable snapshot of the zone
+                if zoneData is None:
+                    continue  # Zone removed before this (deferred) change was processed
                 self.process_zone(zone_id, zoneData)
 
-                zoneUniqueIdentityKey = self.globals[ROON][ZONES][zone_id][ZONE_UNIQUE_IDENTITY_KEY]
+                zoneUniqueIdentityKey = self.globals[ROON][ZONES][zone_id].unique_identity_key
                 if zoneUniqueIdentityKey in self.globals[ROON][ZONE_UNIQUE_IDENTITY_KEY_TO_DEV_ID]:
                     roonZoneDevId = self.globals[ROON][ZONE_UNIQUE_IDENTITY_KEY_TO_DEV_ID][zoneUniqueIdentityKey]
-                    self.update_roon_zone_device(roonZoneDevId, zone_id)
-                    self.logger.debug(f"'ZONE CHANGED' - Zone '{self.globals[ROON][ZONES][zone_id][DISPLAY_NAME]}'."
-                                      f" Indigo Device = '{indigo.devices[roonZoneDevId].name}', Unique ID = '{zoneUniqueIdentityKey}'")
+                    # Only (re)fetch the artwork if the changed paths reported by the Roon API say it changed (None = new zone)
+                    zone_changes = None if changes is None else changes.get(zone_id)
+                    update_images = zone_changes is None or any(path.startswith(('now_playing.image_key', 'now_playing.artist_image_keys')) or path == 'now_playing' for path in zone_changes)
+                    self.update_roon_zone_device(roonZoneDevId, zone_id, update_images)
+                    self.logger.debug(f"'ZONE CHANGED' - Zone '{self.globals[ROON][ZONES][zone_id].display_name}'."
+                                      f" Indigo Device = '{self.globals[ROON][DEVICE_CACHE].get(roonZoneDevId).dev.name}', Unique ID = '{zoneUniqueIdentityKey}'")
                 else:
-                    self.logger.debug(f"'ZONE CHANGED' - Zone '{self.globals[ROON][ZONES][zone_id][DISPLAY_NAME]}' no matching Indigo device. Unique ID = '{zoneUniqueIdentityKey}'")
+                    self.logger.debug(f"'ZONE CHANGED' - Zone '{self.globals[ROON][ZONES][zone_id].display_name}' no matching Indigo device. Unique ID = '{zoneUniqueIdentityKey}'")
 
         except Exception as exception_error:
             self.exception_handler(exception_error, True)  # Log error and display failing statement
@@ -1929,22 +2058,23 @@ class Plugin(indigo.PluginBase):
                 if zone_id in self.globals[ROON][ZONES]:
                     self.logger.debug(f"'process_zones_removed' - Zone:\n{self.globals[ROON][ZONES][zone_id]}")
 
-                    if DISPLAY_NAME in self.globals[ROON][ZONES][zone_id]:
-                        zone_display_name = self.globals[ROON][ZONES][zone_id][DISPLAY_NAME]
-                    if ZONE_UNIQUE_IDENTITY_KEY in self.globals[ROON][ZONES][zone_id]:
-                        zone_unique_identity_key = self.globals[ROON][ZONES][zone_id][ZONE_UNIQUE_IDENTITY_KEY]
+                    if self.globals[ROON][ZONES][zone_id].display_name != '':
+                        zone_display_name = self.globals[ROON][ZONES][zone_id].display_name
+                    if self.globals[ROON][ZONES][zone_id].unique_identity_key != '':
+                        zone_unique_identity_key = self.globals[ROON][ZONES][zone_id].unique_identity_key
                         if zone_unique_identity_key in self.globals[ROON][ZONE_UNIQUE_IDENTITY_KEY_TO_DEV_ID]:
                             roonZoneDevId = self.globals[ROON][ZONE_UNIQUE_IDENTITY_KEY_TO_DEV_ID][
                                 zone_unique_identity_key]
                             self.disconnect_roon_zone_device(roonZoneDevId)
-                            self.logger.debug(f"'process_zones_removed' - Zone '{self.globals[ROON][ZONES][zone_id][DISPLAY_NAME]}'."
-                                              f" Indigo Device = '{indigo.devices[roonZoneDevId].name}', Zone ID = '{zone_id}', Unique ID = '{zone_unique_identity_key}'")
+                            self.logger.debug(f"'process_zones_removed' - Zone '{self.globals[ROON][ZONES][zone_id].display_name}'."
+                                              f" Indigo Device = '{self.globals[ROON][DEVICE_CACHE].get(roonZoneDevId).dev.name}', Zone ID = '{zone_id}', Unique ID = '{zone_unique_identity_key}'")
                         else:
                             self.logger.debug(f"'process_zones_removed' - Zone '{zone_display_name}' no matching Indigo device. Unique ID = '{zone_unique_identity_key}'")
                     else:
                         self.logger.debug(
                             f"'process_zones_removed' - Zone '{zone_display_name}', Zone ID = '{zone_id}' no matching Indigo device. Unique ID = '{zone_unique_identity_key}'")
 
+                    self.cancel_queue_prefetch(zone_id)
                     del self.globals[ROON][ZONES][zone_id]
 
                     # self.print_known_zones_summary('PROCESS ZONES REMOVED [ZONE REMOVED]')
@@ -1961,61 +2091,59 @@ class Plugin(indigo.PluginBase):
         zoneData = None
         try:
             for zone_id in changed_items:
-                zoneData = copy.deepcopy(self.globals[ROON][API].zone_by_zone_id(zone_id))
+                zoneData = self.globals[ROON][API].zone_by_zone_id(zone_id)  # Immutable snapshot of the zone
+                if zoneData is None or zone_id not in self.globals[ROON][ZONES]:
+                    continue  # Zone removed before this (deferred) change was processed
 
-                self.globals[ROON][ZONES][zone_id][QUEUE_ITEMS_REMAINING] = zoneData['queue_items_remaining']
-                self.globals[ROON][ZONES][zone_id][QUEUE_TIME_REMAINING] = zoneData['queue_time_remaining']
+                self.globals[ROON][ZONES][zone_id].queue_items_remaining = zoneData['queue_items_remaining']
+                self.globals[ROON][ZONES][zone_id].queue_time_remaining = zoneData['queue_time_remaining']
                 if 'seek_position' in zoneData:
-                    self.globals[ROON][ZONES][zone_id][SEEK_POSITION] = zoneData['seek_position']
-                    if self.globals[ROON][ZONES][zone_id][SEEK_POSITION] is None:
-                        self.globals[ROON][ZONES][zone_id][SEEK_POSITION] = 0
-                        self.globals[ROON][ZONES][zone_id][REMAINING] = 0
+                    self.globals[ROON][ZONES][zone_id].seek_position = zoneData['seek_position']
+                    if self.globals[ROON][ZONES][zone_id].seek_position is None:
+                        self.globals[ROON][ZONES][zone_id].seek_position = 0
+                        self.globals[ROON][ZONES][zone_id].remaining = 0
                     else:
                         if 'now_playing' in zoneData and 'length' in zoneData['now_playing']:
-                            self.globals[ROON][ZONES][zone_id][REMAINING] = int(zoneData['now_playing']['length']) - int(self.globals[ROON][ZONES][zone_id][SEEK_POSITION])
+                            self.globals[ROON][ZONES][zone_id].remaining = int(zoneData['now_playing']['length']) - int(self.globals[ROON][ZONES][zone_id].seek_position)
                         else:
-                            self.globals[ROON][ZONES][zone_id][REMAINING] = 0
+                            self.globals[ROON][ZONES][zone_id].remaining = 0
                 else:
-                    self.globals[ROON][ZONES][zone_id][SEEK_POSITION] = 0
-                    self.globals[ROON][ZONES][zone_id][REMAINING] = 0
+                    self.globals[ROON][ZONES][zone_id].seek_position = 0
+                    self.globals[ROON][ZONES][zone_id].remaining = 0
 
-                self.globals[ROON][ZONES][zone_id][STATE] = zoneData.get('state', '-stopped-')
+                self.globals[ROON][ZONES][zone_id].state = zoneData.get('state', '-stopped-')
 
-                if ZONE_UNIQUE_IDENTITY_KEY in self.globals[ROON][ZONES][zone_id]:
-                    zone_unique_identity_key = self.globals[ROON][ZONES][zone_id][ZONE_UNIQUE_IDENTITY_KEY]
-                else:
+                zone_unique_identity_key = self.globals[ROON][ZONES][zone_id].unique_identity_key
+                if zone_unique_identity_key == '':
                     zone_unique_identity_key = "NONE"
                 if zone_unique_identity_key in self.globals[ROON][ZONE_UNIQUE_IDENTITY_KEY_TO_DEV_ID] and zone_unique_identity_key != 'NONE':
                     roonZoneDevId = self.globals[ROON][ZONE_UNIQUE_IDENTITY_KEY_TO_DEV_ID][zone_unique_identity_key]
 
-                    ui_queue_time_remaining = self.ui_time(self.globals[ROON][ZONES][zone_id][QUEUE_TIME_REMAINING])
-                    ui_seek_position = self.ui_time(self.globals[ROON][ZONES][zone_id][SEEK_POSITION])
-                    ui_remaining = self.ui_time(self.globals[ROON][ZONES][zone_id][REMAINING])
-
-                    zone_dev = indigo.devices[roonZoneDevId]
-                    key_value_list = [
-                        {'key': 'queue_items_remaining', 'value': self.globals[ROON][ZONES][zone_id][QUEUE_ITEMS_REMAINING]},
-                        {'key': 'queue_time_remaining', 'value': self.globals[ROON][ZONES][zone_id][QUEUE_TIME_REMAINING]},
-                        {'key': 'seek_position', 'value': self.globals[ROON][ZONES][zone_id][SEEK_POSITION]},
-                        {'key': 'remaining', 'value': self.globals[ROON][ZONES][zone_id][REMAINING]},
-                        {'key': 'state', 'value': self.globals[ROON][ZONES][zone_id][STATE]},
-                        {'key': 'ui_queue_time_remaining', 'value': ui_queue_time_remaining},
-                        {'key': 'ui_seek_position', 'value': ui_seek_position},
-                        {'key': 'ui_remaining', 'value': ui_remaining}
-                    ]
-
-                    if zone_dev.states['state'] != self.globals[ROON][ZONES][zone_id][STATE]:
-                        key_value_list.append({'key': 'state', 'value': self.globals[ROON][ZONES][zone_id][STATE]})
-                        if self.globals[ROON][ZONES][zone_id][STATE] == 'playing':
-                            zone_dev.updateStateImageOnServer(indigo.kStateImageSel.AvPlaying)
-                        elif self.globals[ROON][ZONES][zone_id][STATE] == 'paused':
-                            zone_dev.updateStateImageOnServer(indigo.kStateImageSel.AvPaused)
-                        else:
-                            zone_dev.updateStateImageOnServer(indigo.kStateImageSel.AvStopped)
-                    if zone_dev.states['zone_status'] != self.globals[ROON][ZONES][zone_id][STATE]:
-                        key_value_list.append({'key': 'zone_status', 'value': self.globals[ROON][ZONES][zone_id][STATE]})
+                    ui_queue_time_remaining = self.ui_time(self.globals[ROON][ZONES][zone_id].queue_time_remaining)
+                    ui_seek_position = self.ui_time(self.globals[ROON][ZONES][zone_id].seek_position)
+                    ui_remaining = self.ui_time(self.globals[ROON][ZONES][zone_id].remaining)
+
+                    zone_dev = self.globals[ROON][DEVICE_CACHE].get(roonZoneDevId).dev
+                    zone_states = {
+                        'queue_items_remaining': self.globals[ROON][ZONES][zone_id].queue_items_remaining,
+                        'queue_time_remaining': self.globals[ROON][ZONES][zone_id].queue_time_remaining,
+                        'seek_position': self.globals[ROON][ZONES][zone_id].seek_position,
+                        'remaining': self.globals[ROON][ZONES][zone_id].remaining,
+                        'state': self.globals[ROON][ZONES][zone_id].state,
+                        'zone_status': self.globals[ROON][ZONES][zone_id].state,
+                        'ui_queue_time_remaining': ui_queue_time_remaining,
+                        'ui_seek_position': ui_seek_position,
+                        'ui_remaining': ui_remaining
+                    }
+                    if self.globals[ROON][ZONES][zone_id].state == 'playing':
+                        state_image = indigo.kStateImageSel.AvPlaying
+                    elif self.globals[ROON][ZONES][zone_id].state == 'paused':
+                        state_image = indigo.kStateImageSel.AvPaused
+                    else:
+                        state_image = indigo.kStateImageSel.AvStopped
 
-                    zone_dev.updateStatesOnServer(key_value_list)
+                    # Seek updates are pushed on the next flush tick, a play state change is pushed immediately
+                    self.globals[ROON][SHADOW_STATES].update(zone_dev, zone_states, state_image, flush_on=('state',))
 
         except Exception as exception_error:
             self.exception_handler(exception_error, True)  # Log error and display failing statement
@@ -2090,13 +2218,14 @@ class Plugin(indigo.PluginBase):
             self.exception_handler(exception_error, True)  # Log error and display failing statement
 
     def update_roon_output_device(self, roonOutputDevId, output_id):
-        output_dev = indigo.devices[roonOutputDevId]
+        output_device = self.globals[ROON][DEVICE_CACHE].get(roonOutputDevId)
+        output_dev = output_device.dev
 
         try:
-            auto_name_new_roon_output = bool(output_dev.pluginProps.get('autoNameNewRoonOutput', True))
+            auto_name_new_roon_output = output_device.auto_name_new_device
             if auto_name_new_roon_output and output_dev.name[0:10] == 'new device':
 
-                output_name = f"{self.globals[ROON][OUTPUTS][output_id][DISPLAY_NAME]}"
+                output_name = f"{self.globals[ROON][OUTPUTS][output_id].display_name}"
                 new_device_name = f"Roon Output - {output_name}"
 
                 try:
@@ -2115,126 +2244,84 @@ class Plugin(indigo.PluginBase):
                     self.logger.error("'update_roon_output_device' [Auto-name];"  # TODO: Reformat as per output / zone
                                       f" Unable to rename Roon Output from '{output_dev.name}' to '{new_device_name}'. Line '{sys.exc_traceback.tb_lineno}' has error='{exception_error}'")
 
-            if 1 in self.globals[ROON][OUTPUTS][output_id][CAN_GROUP_WITH_OUTPUT_IDS]:
-                can_group_with_output_id_1 = self.globals[ROON][OUTPUTS][output_id][CAN_GROUP_WITH_OUTPUT_IDS][1]
-            else:
-                can_group_with_output_id_1 = ""
-            if 2 in self.globals[ROON][OUTPUTS][output_id][CAN_GROUP_WITH_OUTPUT_IDS]:
-                can_group_with_output_id_2 = self.globals[ROON][OUTPUTS][output_id][CAN_GROUP_WITH_OUTPUT_IDS][2]
-            else:
-                can_group_with_output_id_2 = ""
-            if 3 in self.globals[ROON][OUTPUTS][output_id][CAN_GROUP_WITH_OUTPUT_IDS]:
-                can_group_with_output_id_3 = self.globals[ROON][OUTPUTS][output_id][CAN_GROUP_WITH_OUTPUT_IDS][3]
+            # Pad the Output Ids this Output can group with to the five device state slots
+            can_group_with_output_id_1, can_group_with_output_id_2, can_group_with_output_id_3, can_group_with_output_id_4, can_group_with_output_id_5 = \
+                (self.globals[ROON][OUTPUTS][output_id].can_group_with_output_ids + ("", "", "", "", ""))[0:5]
+
+            output_states = {
+                'output_connected': True,
+                'output_status': 'connected',
+                'output_id': self.globals[ROON][OUTPUTS][output_id].output_id
+            }
+            if self.globals[ROON][OUTPUTS][output_id].display_name != '':  # < TEST LEAVING DISPLAY NAME UNALTERED
+                output_states['display_name'] = self.globals[ROON][OUTPUTS][output_id].display_name
+
+            if len(self.globals[ROON][OUTPUTS][output_id].source_controls) > 0:
+                output_states['source_control_1_status'] = self.globals[ROON][OUTPUTS][output_id].source_controls[0].status
+                output_states['source_control_1_display_name'] = self.globals[ROON][OUTPUTS][output_id].source_controls[0].display_name
+                output_states['source_control_1_control_key'] = self.globals[ROON][OUTPUTS][output_id].source_controls[0].control_key
+                output_states['source_control_1_supports_standby'] = self.globals[ROON][OUTPUTS][output_id].source_controls[0].supports_standby
             else:
-                can_group_with_output_id_3 = ""
-            if 4 in self.globals[ROON][OUTPUTS][output_id][CAN_GROUP_WITH_OUTPUT_IDS]:
-                can_group_with_output_id_4 = self.globals[ROON][OUTPUTS][output_id][CAN_GROUP_WITH_OUTPUT_IDS][4]
+                output_states['source_control_1_status'] = ''
+                output_states['source_control_1_display_name'] = ''
+                output_states['source_control_1_control_key'] = ''
+                output_states['source_control_1_supports_standby'] = False
+
+            if self.globals[ROON][OUTPUTS][output_id].volume is not None:
+                output_states['volume_hard_limit_min'] = self.globals[ROON][OUTPUTS][output_id].volume.hard_limit_min
+                output_states['volume_min'] = self.globals[ROON][OUTPUTS][output_id].volume.min
+                output_states['volume_is_muted'] = self.globals[ROON][OUTPUTS][output_id].volume.is_muted
+                output_states['volume_max'] = self.globals[ROON][OUTPUTS][output_id].volume.max
+                output_states['volume_value'] = self.globals[ROON][OUTPUTS][output_id].volume.value
+                output_states['volume_step'] = self.globals[ROON][OUTPUTS][output_id].volume.step
+                output_states['volume_hard_limit_max'] = self.globals[ROON][OUTPUTS][output_id].volume.hard_limit_max
+                output_states['volume_soft_limit'] = self.globals[ROON][OUTPUTS][output_id].volume.soft_limit
+                output_states['volume_type'] = self.globals[ROON][OUTPUTS][output_id].volume.type
             else:
-                can_group_with_output_id_4 = ""
-            if 5 in self.globals[ROON][OUTPUTS][output_id][CAN_GROUP_WITH_OUTPUT_IDS]:
-                can_group_with_output_id_5 = self.globals[ROON][OUTPUTS][output_id][CAN_GROUP_WITH_OUTPUT_IDS][5]
-            else:
-                can_group_with_output_id_5 = ""
-
-            key_value_list = list()
-            if not output_dev.states['output_connected']:
-                key_value_list.append({'key': 'output_connected', 'value': True})
-            if output_dev.states['output_status'] != 'connected':
-                key_value_list.append({'key': 'output_status', 'value': 'connected'})
-            if output_dev.states['output_id'] != self.globals[ROON][OUTPUTS][output_id][OUTPUT_ID]:
-                key_value_list.append({'key': 'output_id', 'value': self.globals[ROON][OUTPUTS][output_id][OUTPUT_ID]})
-            if output_dev.states['display_name'] != self.globals[ROON][OUTPUTS][output_id][DISPLAY_NAME]:
-                if self.globals[ROON][OUTPUTS][output_id][DISPLAY_NAME] != '':  # < TEST LEAVING DISPLAY NAME UNALTERED
-                    key_value_list.append({'key': 'display_name', 'value': self.globals[ROON][OUTPUTS][output_id][DISPLAY_NAME]})
-
-            if SOURCE_CONTROLS in self.globals[ROON][OUTPUTS][output_id] and self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS_COUNT] > 0:
-                if output_dev.states['source_control_1_status'] != self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS][1][STATUS]:
-                    key_value_list.append({'key': 'source_control_1_status', 'value': self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS][1][STATUS]})
-                if output_dev.states['source_control_1_display_name'] != self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS][1][DISPLAY_NAME]:
-                    key_value_list.append({'key': 'source_control_1_display_name', 'value': self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS][1][DISPLAY_NAME]})
-                if output_dev.states['source_control_1_control_key'] != self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS][1][CONTROL_KEY]:
-                    key_value_list.append({'key': 'source_control_1_control_key', 'value': self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS][1][CONTROL_KEY]})
-                if output_dev.states['source_control_1_control_key'] != self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS][1][CONTROL_KEY]:
-                    key_value_list.append({'key': 'source_control_1_control_key', 'value': self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS][1][CONTROL_KEY]})
-                if output_dev.states['source_control_1_supports_standby'] != self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS][1][SUPPORTS_STANDBY]:
-                    key_value_list.append({'key': 'source_control_1_supports_standby', 'value': self.globals[ROON][OUTPUTS][output_id][SOURCE_CONTROLS][1][SUPPORTS_STANDBY]})
-            else:
-                    key_value_list.append({'key': 'source_control_1_status', 'value': ''})
-                    key_value_list.append({'key': 'source_control_1_display_name', 'value': ''})
-                    key_value_list.append({'key': 'source_control_1_control_key', 'value': ''})
-                    key_value_list.append({'key': 'source_control_1_control_key', 'value': ''})
-                    key_value_list.append({'key': 'source_control_1_supports_standby', 'value': False})
-
-            if VOLUME in self.globals[ROON][OUTPUTS][output_id] and len(self.globals[ROON][OUTPUTS][output_id][VOLUME]) > 0:
-                if output_dev.states['volume_hard_limit_min'] != self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_HARD_LIMIT_MIN]:
-                    key_value_list.append({'key': 'volume_hard_limit_min', 'value': self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_HARD_LIMIT_MIN]})
-                if output_dev.states['volume_min'] != self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_MIN]:
-                    key_value_list.append({'key': 'volume_min', 'value': self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_MIN]})
-                if output_dev.states['volume_is_muted'] != self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_IS_MUTED]:
-                    key_value_list.append({'key': 'volume_is_muted', 'value': self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_IS_MUTED]})
-                if output_dev.states['volume_max'] != self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_MAX]:
-                    key_value_list.append({'key': 'volume_max', 'value': self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_MAX]})
-                if output_dev.states['volume_value'] != self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_VALUE]:
-                    key_value_list.append({'key': 'volume_value', 'value': self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_VALUE]})
-                if output_dev.states['volume_step'] != self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_STEP]:
-                    key_value_list.append({'key': 'volume_step', 'value': self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_STEP]})
-                if output_dev.states['volume_hard_limit_max'] != self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_HARD_LIMIT_MAX]:
-                    key_value_list.append({'key': 'volume_hard_limit_max', 'value': self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_HARD_LIMIT_MAX]})
-                if output_dev.states['volume_soft_limit'] != self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_SOFT_LIMIT]:
-                    key_value_list.append({'key': 'volume_soft_limit', 'value': self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_SOFT_LIMIT]})
-                if output_dev.states['volume_type'] != self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_TYPE]:
-                    key_value_list.append({'key': 'volume_type', 'value': self.globals[ROON][OUTPUTS][output_id][VOLUME][VOLUME_TYPE]})
-            else:
-                key_value_list.append({'key': 'volume_hard_limit_min', 'value': 0})
-                key_value_list.append({'key': 'volume_min', 'value': 0})
-                key_value_list.append({'key': 'volume_is_muted', 'value': False})
-                key_value_list.append({'key': 'volume_max', 'value': 0})
-                key_value_list.append({'key': 'volume_value', 'value': 0})
-                key_value_list.append({'key': 'volume_step', 'value': 0})
-                key_value_list.append({'key': 'volume_hard_limit_max', 'value': 0})
-                key_value_list.append({'key': 'volume_soft_limit', 'value': 0})
-                key_value_list.append({'key': 'volume_type', 'value': 'number'})
-
-            if output_dev.states['can_group_with_output_id_1'] != can_group_with_output_id_1:
-                key_value_list.append({'key': 'can_group_with_output_id_1', 'value': can_group_with_output_id_1})
-            if output_dev.states['can_group_with_output_id_2'] != can_group_with_output_id_2:
-                key_value_list.append({'key': 'can_group_with_output_id_2', 'value': can_group_with_output_id_2})
-            if output_dev.states['can_group_with_output_id_3'] != can_group_with_output_id_3:
-                key_value_list.append({'key': 'can_group_with_output_id_3', 'value': can_group_with_output_id_3})
-            if output_dev.states['can_group_with_output_id_4'] != can_group_with_output_id_4:
-                key_value_list.append({'key': 'can_group_with_output_id_4', 'value': can_group_with_output_id_4})
-            if output_dev.states['can_group_with_output_id_5'] != can_group_with_output_id_5:
-                key_value_list.append({'key': 'can_group_with_output_id_5', 'value': can_group_with_output_id_5})
-
-            if len(key_value_list) > 0:
-                output_dev.updateStatesOnServer(key_value_list)
-            output_dev.updateStateImageOnServer(indigo.kStateImageSel.PowerOn)
+                output_states['volume_hard_limit_min'] = 0
+                output_states['volume_min'] = 0
+                output_states['volume_is_muted'] = False
+                output_states['volume_max'] = 0
+                output_states['volume_value'] = 0
+                output_states['volume_step'] = 0
+                output_states['volume_hard_limit_max'] = 0
+                output_states['volume_soft_limit'] = 0
+                output_states['volume_type'] = 'number'
+
+            output_states['can_group_with_output_id_1'] = can_group_with_output_id_1
+            output_states['can_group_with_output_id_2'] = can_group_with_output_id_2
+            output_states['can_group_with_output_id_3'] = can_group_with_output_id_3
+            output_states['can_group_with_output_id_4'] = can_group_with_output_id_4
+            output_states['can_group_with_output_id_5'] = can_group_with_output_id_5
+
+            # Only the states that differ from those last pushed to the device are sent to the Indigo server (on the next flush tick,
+            # or immediately if the device has just connected or the play state has changed)
+            self.globals[ROON][SHADOW_STATES].update(output_dev, output_states, indigo.kStateImageSel.PowerOn, flush_on=('output_connected',))
 
         except Exception as exception_error:
             self.exception_handler(exception_error, True)  # Log error and display failing statement
 
-    def update_roon_zone_device(self, roonZoneDevId, zone_id):
+    def update_roon_zone_device(self, roonZoneDevId, zone_id, update_images=True):
         new_device_name = ""
-        zone_dev = indigo.devices[roonZoneDevId]
+        zone_device = self.globals[ROON][DEVICE_CACHE].get(roonZoneDevId)
+        zone_dev = zone_device.dev
 
         try:
-            auto_name_new_roon_zone = bool(zone_dev.pluginProps.get('autoNameNewRoonZone', True))
+            auto_name_new_roon_zone = zone_device.auto_name_new_device
             if auto_name_new_roon_zone and zone_dev.name[0:10] == 'new device':
 
-                zone_name = f"{self.globals[ROON][ZONES][zone_id][DISPLAY_NAME]}"
+                zone_name = f"{self.globals[ROON][ZONES][zone_id].display_name}"
                 new_device_name = f"Roon Zone - {zone_name}"
 
                 try:
                     zone_dev.pluginProps.update({'roonZoneName': zone_name})
                     zone_dev.replacePluginPropsOnServer(zone_dev.pluginProps)
 
-                    outputCount = self.globals[ROON][ZONES][zone_id][OUTPUTS_COUNT]
+                    outputCount = len(self.globals[ROON][ZONES][zone_id].outputs)
                     if outputCount == 0:
                         new_device_name = f"Roon Zone - {zone_name}"
                     else:
-                        temp_zone_name = self.globals[ROON][ZONES][zone_id][OUTPUTS][1][DISPLAY_NAME]
-                        for i in range(2, outputCount + 1):
-                            temp_zone_name = f"{temp_zone_name} + {self.globals[ROON][ZONES][zone_id][OUTPUTS][i][DISPLAY_NAME]}"
+                        temp_zone_name = " + ".join(output.display_name for output in self.globals[ROON][ZONES][zone_id].outputs)
                         new_device_name = f"Roon Zone - {temp_zone_name}"
 
                     self.logger.debug(f"'update_roon_zone_device' [Auto-name - New Device]; Debug Info of rename Roon Zone from '{zone_dev.name}' to '{new_device_name}'")
@@ -2246,15 +2333,13 @@ class Plugin(indigo.PluginBase):
                                       f" Unable to rename Roon Zone from '{zone_dev.name}' to '{new_device_name}'. Line '{sys.exc_traceback.tb_lineno}' has error='{exception_error}'")
 
             # Only check for a roon zone device dynamic rename if a grouped zone
-            if self.globals[ROON][ZONES][zone_id][OUTPUTS_COUNT] > 1:
-                dynamic_rename_check_required = bool(zone_dev.pluginProps.get('dynamicGroupedZoneRename', False))
+            if len(self.globals[ROON][ZONES][zone_id].outputs) > 1:
+                dynamic_rename_check_required = zone_device.dynamic_grouped_zone_rename
                 if dynamic_rename_check_required:   # True if Dynamic Rename Check Required
                     try:
-                        outputCount = self.globals[ROON][ZONES][zone_id][OUTPUTS_COUNT]
+                        outputCount = len(self.globals[ROON][ZONES][zone_id].outputs)
                         if outputCount > 0:
-                            new_zone_name = self.globals[ROON][ZONES][zone_id][OUTPUTS][1][DISPLAY_NAME]
-                            for i in range(2, outputCount + 1):
-                                new_zone_name = f"{new_zone_name} + {self.globals[ROON][ZONES][zone_id][OUTPUTS][i][DISPLAY_NAME]}"
+                            new_zone_name = " + ".join(output.display_name for output in self.globals[ROON][ZONES][zone_id].outputs)
                             new_device_name = f"Roon Zone - {new_zone_name}"
 
                             old_zone_name = zone_dev.pluginProps.get('roonZoneName', '-')  # e.g. 'Study + Dining Room'
@@ -2273,187 +2358,83 @@ class Plugin(indigo.PluginBase):
                                           f"Line '{sys.exc_traceback.tb_lineno}' has error='{exception_error}'")
 
 
-            if 1 in self.globals[ROON][ZONES][zone_id][OUTPUTS]:
-                output_id_1 = self.globals[ROON][ZONES][zone_id][OUTPUTS][1][OUTPUT_ID]
-            else:
-                output_id_1 = ""
-            if 2 in self.globals[ROON][ZONES][zone_id][OUTPUTS]:
-                output_id_2 = self.globals[ROON][ZONES][zone_id][OUTPUTS][2][OUTPUT_ID]
-            else:
-                output_id_2 = ""
-            if 3 in self.globals[ROON][ZONES][zone_id][OUTPUTS]:
-                output_id_3 = self.globals[ROON][ZONES][zone_id][OUTPUTS][3][OUTPUT_ID]
-            else:
-                output_id_3 = ""
-            if 4 in self.globals[ROON][ZONES][zone_id][OUTPUTS]:
-                output_id_4 = self.globals[ROON][ZONES][zone_id][OUTPUTS][4][OUTPUT_ID]
-            else:
-                output_id_4 = ""
-            if 5 in self.globals[ROON][ZONES][zone_id][OUTPUTS]:
-                output_id_5 = self.globals[ROON][ZONES][zone_id][OUTPUTS][5][OUTPUT_ID]
-            else:
-                output_id_5 = ""
-
-            if 1 in self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ARTIST_IMAGE_KEYS]:
-                artist_image_key_1 = self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ARTIST_IMAGE_KEYS][1]
-            else:
-                artist_image_key_1 = ""
-            self.process_image(ARTIST, '1', zone_dev, artist_image_key_1)
-
-            if 2 in self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ARTIST_IMAGE_KEYS]:
-                artist_image_key_2 = self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ARTIST_IMAGE_KEYS][2]
-            else:
-                artist_image_key_2 = ""
-            self.process_image(ARTIST, '2', zone_dev, artist_image_key_2)
-
-            if 3 in self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ARTIST_IMAGE_KEYS]:
-                artist_image_key_3 = self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ARTIST_IMAGE_KEYS][3]
-            else:
-                artist_image_key_3 = ""
-            self.process_image(ARTIST, '3', zone_dev, artist_image_key_3)
+            # Pad the Zone's Output Ids to the five device state slots
+            output_id_1, output_id_2, output_id_3, output_id_4, output_id_5 = \
+                (tuple(output.output_id for output in self.globals[ROON][ZONES][zone_id].outputs) + ("", "", "", "", ""))[0:5]
 
-            if 4 in self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ARTIST_IMAGE_KEYS]:
-                artist_image_key_4 = self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ARTIST_IMAGE_KEYS][4]
-            else:
-                artist_image_key_4 = ""
-            self.process_image(ARTIST, '4', zone_dev, artist_image_key_4)
+            # Pad the artist image keys to the five device state slots
+            artist_image_key_1, artist_image_key_2, artist_image_key_3, artist_image_key_4, artist_image_key_5 = \
+                (self.globals[ROON][ZONES][zone_id].now_playing.artist_image_keys + ("", "", "", "", ""))[0:5]
 
-            if 5 in self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ARTIST_IMAGE_KEYS]:
-                artist_image_key_5 = self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ARTIST_IMAGE_KEYS][5]
-            else:
-                artist_image_key_5 = ""
-            self.process_image(ARTIST, '5', zone_dev, artist_image_key_5)
+            # update_images is False if the artwork is known not to have changed, but a slot waiting to be retried (after a failed fetch)
+            # is processed on every update until it succeeds
+            if update_images or self.image_slots_to_retry(zone_dev.id):
+                self.process_image(ARTIST, '1', zone_dev, artist_image_key_1)
+                self.process_image(ARTIST, '2', zone_dev, artist_image_key_2)
+                self.process_image(ARTIST, '3', zone_dev, artist_image_key_3)
+                self.process_image(ARTIST, '4', zone_dev, artist_image_key_4)
+                self.process_image(ARTIST, '5', zone_dev, artist_image_key_5)
+                self.process_image(ALBUM, '', zone_dev, self.globals[ROON][ZONES][zone_id].now_playing.image_key)
 
-            self.process_image(ALBUM, '', zone_dev, self.globals[ROON][ZONES][zone_id][NOW_PLAYING][IMAGE_KEY])
+            self.update_queue_prefetch(zone_id, zone_device.queue_prefetch_items)
 
             zone_status = "stopped"
-            if self.globals[ROON][ZONES][zone_id][STATE] == 'playing':
-                zone_dev.updateStateImageOnServer(indigo.kStateImageSel.AvPlaying)
+            if self.globals[ROON][ZONES][zone_id].state == 'playing':
+                state_image = indigo.kStateImageSel.AvPlaying
                 zone_status = "playing"
-            elif self.globals[ROON][ZONES][zone_id][STATE] == 'paused':
-                zone_dev.updateStateImageOnServer(indigo.kStateImageSel.AvPaused)
+            elif self.globals[ROON][ZONES][zone_id].state == 'paused':
+                state_image = indigo.kStateImageSel.AvPaused
                 zone_status = "Paused"
             else:
-                zone_dev.updateStateImageOnServer(indigo.kStateImageSel.AvStopped)
-
-            key_value_list = list()
-
-            if not zone_dev.states['zone_connected']:
-                key_value_list.append({'key': 'zone_connected', 'value': True})
-
-            if zone_dev.states['zone_status'] != zone_status:
-                key_value_list.append({'key': 'zone_status', 'value': zone_status})
-
-            if zone_dev.states['zone_id'] != self.globals[ROON][ZONES][zone_id][ZONE_ID]:
-                key_value_list.append({'key': 'zone_id', 'value': self.globals[ROON][ZONES][zone_id][ZONE_ID]})
-
-            if zone_dev.states['display_name'] != self.globals[ROON][ZONES][zone_id][DISPLAY_NAME]:
-                key_value_list.append({'key': 'display_name', 'value': self.globals[ROON][ZONES][zone_id][DISPLAY_NAME]})
-
-            if zone_dev.states['auto_radio'] != self.globals[ROON][ZONES][zone_id][SETTINGS][AUTO_RADIO]:
-                key_value_list.append({'key': 'auto_radio', 'value': self.globals[ROON][ZONES][zone_id][SETTINGS][AUTO_RADIO]})
-
-            if zone_dev.states['shuffle'] != self.globals[ROON][ZONES][zone_id][SETTINGS][SHUFFLE]:
-                key_value_list.append({'key': 'shuffle', 'value': self.globals[ROON][ZONES][zone_id][SETTINGS][SHUFFLE]})
-
-            if zone_dev.states['loop'] != self.globals[ROON][ZONES][zone_id][SETTINGS][LOOP]:
-                key_value_list.append({'key': 'loop', 'value': self.globals[ROON][ZONES][zone_id][SETTINGS][LOOP]})
-
-            if zone_dev.states['number_of_outputs'] != self.globals[ROON][ZONES][zone_id][OUTPUTS_COUNT]:
-                key_value_list.append({'key': 'number_of_outputs', 'value': self.globals[ROON][ZONES][zone_id][OUTPUTS_COUNT]})
-
-            if zone_dev.states['output_1_id'] != output_id_1:
-                key_value_list.append({'key': 'output_1_id', 'value': output_id_1})
-
-            if zone_dev.states['output_2_id'] != output_id_2:
-                key_value_list.append({'key': 'output_2_id', 'value': output_id_2})
-
-            if zone_dev.states['output_3_id'] != output_id_3:
-                key_value_list.append({'key': 'output_3_id', 'value': output_id_3})
-
-            if zone_dev.states['output_4_id'] != output_id_4:
-                key_value_list.append({'key': 'output_4_id', 'value': output_id_4})
-
-            if zone_dev.states['output_5_id'] != output_id_5:
-                key_value_list.append({'key': 'output_5_id', 'value': output_id_5})
-
-            if zone_dev.states['number_of_artist_image_keys'] != self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ARTIST_IMAGE_KEYS_COUNT]:
-                key_value_list.append({'key': 'number_of_artist_image_keys', 'value': self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ARTIST_IMAGE_KEYS_COUNT]})
-
-            if zone_dev.states['artist_image_Key_1_id'] != artist_image_key_1:
-                key_value_list.append({'key': 'artist_image_Key_1_id', 'value': artist_image_key_1})
-
-            if zone_dev.states['artist_image_Key_2_id'] != artist_image_key_2:
-                key_value_list.append({'key': 'artist_image_Key_2_id', 'value': artist_image_key_2})
-
-            if zone_dev.states['artist_image_Key_3_id'] != artist_image_key_3:
-                key_value_list.append({'key': 'artist_image_Key_3_id', 'value': artist_image_key_3})
-
-            if zone_dev.states['artist_image_Key_4_id'] != artist_image_key_4:
-                key_value_list.append({'key': 'artist_image_Key_4_id', 'value': artist_image_key_4})
-
-            if zone_dev.states['artist_image_Key_5_id'] != artist_image_key_5:
-                key_value_list.append({'key': 'artist_image_Key_5_id', 'value': artist_image_key_5})
-
-            if zone_dev.states['image_key'] != self.globals[ROON][ZONES][zone_id][NOW_PLAYING][IMAGE_KEY]:
-                key_value_list.append({'key': 'image_key', 'value': self.globals[ROON][ZONES][zone_id][NOW_PLAYING][IMAGE_KEY]})
-
-            if zone_dev.states['one_line_1'] != self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ONE_LINE][LINE_1]:
-                key_value_list.append({'key': 'one_line_1', 'value': f"UNICODE Tëst: {self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ONE_LINE][LINE_1]}"})
-                track_title_changed = True
-            else:
-                track_title_changed = False
-
-            if zone_dev.states['two_line_1'] != self.globals[ROON][ZONES][zone_id][NOW_PLAYING][TWO_LINE][LINE_1]:
-                key_value_list.append({'key': 'two_line_1', 'value': self.globals[ROON][ZONES][zone_id][NOW_PLAYING][TWO_LINE][LINE_1]})
-
-            if zone_dev.states['two_line_2'] != self.globals[ROON][ZONES][zone_id][NOW_PLAYING][TWO_LINE][LINE_2]:
-                key_value_list.append({'key': 'two_line_2', 'value': self.globals[ROON][ZONES][zone_id][NOW_PLAYING][TWO_LINE][LINE_2]})
-
-            if zone_dev.states['three_line_1'] != self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE][LINE_1]:
-                key_value_list.append({'key': 'three_line_1', 'value': self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE][LINE_1]})
-
-            if zone_dev.states['three_line_2'] != self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE][LINE_2]:
-                key_value_list.append({'key': 'three_line_2', 'value': self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE][LINE_2]})
-
-            if zone_dev.states['three_line_3'] != self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE][LINE_3]:
-                key_value_list.append({'key': 'three_line_3', 'value': self.globals[ROON][ZONES][zone_id][NOW_PLAYING][THREE_LINE][LINE_3]})
-
-            if zone_dev.states['length'] != self.globals[ROON][ZONES][zone_id][NOW_PLAYING][LENGTH]:
-                key_value_list.append({'key': 'length', 'value': self.globals[ROON][ZONES][zone_id][NOW_PLAYING][LENGTH]})
-                ui_length = self.ui_time(self.globals[ROON][ZONES][zone_id][NOW_PLAYING][LENGTH])
-                key_value_list.append({'key': 'ui_length', 'value': ui_length})
-
-            if zone_dev.states['seek_position'] != self.globals[ROON][ZONES][zone_id][NOW_PLAYING][SEEK_POSITION]:
-                key_value_list.append({'key': 'seek_position', 'value': self.globals[ROON][ZONES][zone_id][NOW_PLAYING][SEEK_POSITION]})
-
-            if zone_dev.states['remaining'] != 0:
-                key_value_list.append({'key': 'remaining', 'value': 0})
-                key_value_list.append({'key': 'ui_remaining', 'value': '0:00'})
-
-            if zone_dev.states['is_previous_allowed'] != self.globals[ROON][ZONES][zone_id][IS_PREVIOUS_ALLOWED]:
-                key_value_list.append({'key': 'is_previous_allowed', 'value': self.globals[ROON][ZONES][zone_id][IS_PREVIOUS_ALLOWED]})
-
-            if zone_dev.states['is_pause_allowed'] != self.globals[ROON][ZONES][zone_id][IS_PAUSE_ALLOWED]:
-                key_value_list.append({'key': 'is_pause_allowed', 'value': self.globals[ROON][ZONES][zone_id][IS_PAUSE_ALLOWED]})
-
-            if zone_dev.states['is_seek_allowed'] != self.globals[ROON][ZONES][zone_id][IS_SEEK_ALLOWED]:
-                key_value_list.append({'key': 'is_seek_allowed', 'value': self.globals[ROON][ZONES][zone_id][IS_SEEK_ALLOWED]})
-
-            if zone_dev.states['state'] != self.globals[ROON][ZONES][zone_id][STATE]:
-                key_value_list.append({'key': 'state', 'value': self.globals[ROON][ZONES][zone_id][STATE]})
-
-            if zone_dev.states['is_play_allowed'] != self.globals[ROON][ZONES][zone_id][IS_PLAY_ALLOWED]:
-                key_value_list.append({'key': 'is_play_allowed', 'value': self.globals[ROON][ZONES][zone_id][IS_PLAY_ALLOWED]})
-
-            if zone_dev.states['is_next_allowed'] != self.globals[ROON][ZONES][zone_id][IS_NEXT_ALLOWED]:
-                key_value_list.append({'key': 'is_next_allowed', 'value': self.globals[ROON][ZONES][zone_id][IS_NEXT_ALLOWED]})
-
-            if len(key_value_list) > 0:
-                zone_dev.updateStatesOnServer(key_value_list)
-                if self.globals[CONFIG][DISPLAY_TRACK_PLAYING] and track_title_changed:
-                    zone_dev.description = self.globals[ROON][ZONES][zone_id][NOW_PLAYING][ONE_LINE][LINE_1]
-                    zone_dev.replaceOnServer()
+                state_image = indigo.kStateImageSel.AvStopped
+
+            zone_states = {
+                'zone_connected': True,
+                'zone_status': zone_status,
+                'zone_id': self.globals[ROON][ZONES][zone_id].zone_id,
+                'display_name': self.globals[ROON][ZONES][zone_id].display_name,
+                'auto_radio': self.globals[ROON][ZONES][zone_id].auto_radio,
+                'shuffle': self.globals[ROON][ZONES][zone_id].shuffle,
+                'loop': self.globals[ROON][ZONES][zone_id].loop,
+                'number_of_outputs': len(self.globals[ROON][ZONES][zone_id].outputs),
+                'output_1_id': output_id_1,
+                'output_2_id': output_id_2,
+                'output_3_id': output_id_3,
+                'output_4_id': output_id_4,
+                'output_5_id': output_id_5,
+                'number_of_artist_image_keys': len(self.globals[ROON][ZONES][zone_id].now_playing.artist_image_keys),
+                'artist_image_Key_1_id': artist_image_key_1,
+                'artist_image_Key_2_id': artist_image_key_2,
+                'artist_image_Key_3_id': artist_image_key_3,
+                'artist_image_Key_4_id': artist_image_key_4,
+                'artist_image_Key_5_id': artist_image_key_5,
+                'image_key': self.globals[ROON][ZONES][zone_id].now_playing.image_key,
+                'one_line_1': f"UNICODE Tëst: {self.globals[ROON][ZONES][zone_id].now_playing.one_line_1}",
+                'two_line_1': self.globals[ROON][ZONES][zone_id].now_playing.two_line_1,
+                'two_line_2': self.globals[ROON][ZONES][zone_id].now_playing.two_line_2,
+                'three_line_1': self.globals[ROON][ZONES][zone_id].now_playing.three_line_1,
+                'three_line_2': self.globals[ROON][ZONES][zone_id].now_playing.three_line_2,
+                'three_line_3': self.globals[ROON][ZONES][zone_id].now_playing.three_line_3,
+                'length': self.globals[ROON][ZONES][zone_id].now_playing.length,
+                'ui_length': self.ui_time(self.globals[ROON][ZONES][zone_id].now_playing.length),
+                'seek_position': self.globals[ROON][ZONES][zone_id].now_playing.seek_position,
+                'remaining': 0,
+                'ui_remaining': '0:00',
+                'is_previous_allowed': self.globals[ROON][ZONES][zone_id].is_previous_allowed,
+                'is_pause_allowed': self.globals[ROON][ZONES][zone_id].is_pause_allowed,
+                'is_seek_allowed': self.globals[ROON][ZONES][zone_id].is_seek_allowed,
+                'state': self.globals[ROON][ZONES][zone_id].state,
+                'is_play_allowed': self.globals[ROON][ZONES][zone_id].is_play_allowed,
+                'is_next_allowed': self.globals[ROON][ZONES][zone_id].is_next_allowed
+            }
+
+            # Only the states that differ from those last pushed to the device are sent to the Indigo server (on the next flush tick,
+            # or immediately if the device has just connected or the play state has changed)
+            key_value_list = self.globals[ROON][SHADOW_STATES].update(zone_dev, zone_states, state_image, flush_on=('zone_connected', 'state'))
+            track_title_changed = any(item['key'] == 'one_line_1' for item in key_value_list)
+            if self.globals[CONFIG][DISPLAY_TRACK_PLAYING] and track_title_changed:
+                zone_dev.description = self.globals[ROON][ZONES][zone_id].now_playing.one_line_1
+                zone_dev.replaceOnServer()
 
         except Exception as exception_error:
             self.exception_handler(exception_error, True)  # Log error and display failing statement
@@ -1,4 +1,10 @@
 # flake8: noqa
+from . import codec
 from .constants import LOGGER
 from .roonapi import RoonApi, split_media_path
+from .asyncroonapi import AsyncRoonApi
+from .roonapisocket import ConnectionClosedException, RequestTimeoutException
 from .discovery import RoonDiscovery
+from .dispatcher import CallbackDispatcher
+from .coalescer import EventCoalescer
+from .snapshot import Snapshot
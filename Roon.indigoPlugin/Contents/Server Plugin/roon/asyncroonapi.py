@@ -0,0 +1,510 @@
+"""
+Asyncio client for the roon websocket api.
+
+AsyncRoonApi offers the transport and browse calls of RoonApi as coroutines and
+exposes the zone, output and queue subscriptions as async iterators. It shares the
+MOO message encoding and decoding with the threaded client (see moomsg.py), but
+runs on a single event loop: every outstanding request is an asyncio future, so no
+thread is needed per wait.
+"""
+
+from __future__ import unicode_literals
+
+import asyncio
+import base64
+import hashlib
+import os
+import struct
+
+from websocket import ABNF, STATUS_NORMAL
+
+from .constants import (
+    LOGGER,
+    REQUEST_TIMEOUT,
+    SERVICE_BROWSE,
+    SERVICE_PING,
+    SERVICE_REGISTRY,
+    SERVICE_TRANSPORT,
+)
+from .moomsg import decode_message, encode_complete, encode_request
+from .roonapisocket import RequestTimeoutException
+
+
+# appended to the Sec-WebSocket-Key to compute the Sec-WebSocket-Accept of the server (RFC 6455, 4.2.2)
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+def handshake_request(resource, host, port):
+    """Return the bytes of the websocket upgrade request and its Sec-WebSocket-Key."""
+    key = base64.b64encode(os.urandom(16)).decode("ascii")
+    host_port = "%s:%d" % (host, port)
+    lines = [
+        "GET %s HTTP/1.1" % resource,
+        "Host: %s" % host_port,
+        "Upgrade: websocket",
+        "Connection: Upgrade",
+        "Sec-WebSocket-Key: %s" % key,
+        "Sec-WebSocket-Version: 13",
+        "Origin: http://%s" % host_port,
+        "",
+        "",
+    ]
+    return "\r\n".join(lines).encode("utf-8"), key
+
+
+def handshake_accepted(headers, key):
+    """Check the (lower case) headers of the server's 101 response against the key of the request."""
+    accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode("ascii")).digest()).decode("ascii")
+    return (
+        headers.get("upgrade", "").lower() == "websocket"
+        and "upgrade" in headers.get("connection", "").lower()
+        and headers.get("sec-websocket-accept") == accept
+    )
+
+
+class AsyncWebSocket:
+    """Minimal websocket client on top of asyncio streams."""
+
+    def __init__(self, reader, writer):
+        """Init with the streams of an upgraded connection."""
+        self._reader = reader
+        self._writer = writer
+        self.closed = False
+
+    @classmethod
+    async def connect(cls, host, port, resource="/api"):
+        """Open the connection and perform the websocket handshake."""
+        port = int(port)
+        reader, writer = await asyncio.open_connection(host, port)
+        request, key = handshake_request(resource, host, port)
+        writer.write(request)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        status = status_line.split(b" ", 2)
+        if len(status) < 2 or status[1] != b"101":
+            writer.close()
+            raise ConnectionError("Websocket handshake failed: %r" % status_line)
+        response_headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("utf-8").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+        if not handshake_accepted(response_headers, key):
+            writer.close()
+            raise ConnectionError("Invalid websocket handshake response")
+        return cls(reader, writer)
+
+    async def send(self, data, opcode=ABNF.OPCODE_BINARY):
+        """Send one (masked) frame."""
+        self._writer.write(ABNF.create_frame(data, opcode).format())
+        await self._writer.drain()
+
+    async def recv(self):
+        """Return the payload of the next data message, or None once the connection is closed."""
+        fragments = []
+        while not self.closed:
+            try:
+                head = await self._reader.readexactly(2)
+                length = head[1] & 0x7F
+                if length == 126:
+                    length = struct.unpack("!H", await self._reader.readexactly(2))[0]
+                elif length == 127:
+                    length = struct.unpack("!Q", await self._reader.readexactly(8))[0]
+                mask_key = await self._reader.readexactly(4) if head[1] & 0x80 else None
+                data = await self._reader.readexactly(length)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                self.closed = True
+                return None
+            if mask_key:
+                data = ABNF.mask(mask_key, data)
+
+            opcode = head[0] & 0x0F
+            if opcode == ABNF.OPCODE_PING:
+                await self.send(data, ABNF.OPCODE_PONG)
+            elif opcode == ABNF.OPCODE_CLOSE:
+                await self.close()
+            elif opcode != ABNF.OPCODE_PONG:
+                fragments.append(data)
+                if head[0] & 0x80:
+                    return b"".join(fragments)
+        return None
+
+    async def close(self):
+        """Close the connection."""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            await self.send(struct.pack("!H", STATUS_NORMAL), ABNF.OPCODE_CLOSE)
+        except ConnectionError:
+            pass
+        self._writer.close()
+
+
+class AsyncRoonApi:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
+    """Class to talk to the roon server from an asyncio event loop."""
+
+    @property
+    def token(self):
+        """Return the authentication key from the registration with Roon."""
+        return self._token
+
+    @property
+    def host(self):
+        """Return the roon host."""
+        return self._host
+
+    @property
+    def core_id(self):
+        """Return the roon core id."""
+        return self._core_id
+
+    @property
+    def core_name(self):
+        """Return the roon core name."""
+        return self._core_name
+
+    @property
+    def connected(self):
+        """Whether the websocket connection is open."""
+        return self._socket is not None and not self._socket.closed
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, appinfo, token, host, port, request_timeout=REQUEST_TIMEOUT):
+        """
+        Prepare the connection with Roon, call connect() to open it.
+
+        appinfo: a dict of the required information about the app that should be connected to the api
+        token: used for presistant storage of the auth token, will be set to token attribute if retrieved.
+        host: the ip or hostname of the Roon server
+        port: the http port of the Roon websockets api
+        request_timeout: the default deadline in seconds for the response to a request
+        """
+        if not appinfo or not isinstance(appinfo, dict):
+            raise ValueError("appinfo missing or in incorrect format!")
+        if not (host and port):
+            raise ValueError("host and port of the roon core must be specified!")
+
+        self._appinfo = appinfo
+        self._token = token
+        self._host = host
+        self._port = port
+        self._core_id = None
+        self._core_name = None
+        self._outputs = {}
+        self.request_timeout = request_timeout
+
+        self._socket = None
+        self._reader_task = None
+        self._requestid = 10
+        self._subkey = 0
+        self._pending = {}
+        self._subscriptions = {}
+
+    async def __aenter__(self):
+        """Connect on entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, exc_tb):
+        """Close the connection on exit."""
+        await self.close()
+
+    async def connect(self):
+        """
+        Open the websocket and register with the roon server.
+
+        Returns once the extension is registered. At first launch the user has to
+        approve the extension in the Roon settings before this completes.
+        """
+        LOGGER.debug("Connecting to Roon server %s:%s", self._host, self._port)
+        self._socket = await AsyncWebSocket.connect(self._host, self._port)
+        self._reader_task = asyncio.ensure_future(self._read_messages())
+
+        appinfo = self._appinfo.copy()
+        appinfo["required_services"] = [SERVICE_TRANSPORT, SERVICE_BROWSE]
+        appinfo["provided_services"] = []
+        if self._token:
+            appinfo["token"] = self._token
+        else:
+            LOGGER.info("The application should be approved within Roon's settings.")
+        reginfo = await self._request(
+            SERVICE_REGISTRY + "/register", appinfo, timeout=0
+        )
+        if not isinstance(reginfo, dict) or "token" not in reginfo or "core_id" not in reginfo:
+            raise ConnectionError("Registration refused by roon server: %r" % (reginfo,))
+        LOGGER.debug("Registered to Roon server %s", reginfo.get("display_name"))
+        self._token = reginfo["token"]
+        self._core_id = reginfo["core_id"]
+        self._core_name = reginfo.get("display_name")
+
+    async def close(self):
+        """Close the connection, outstanding requests fail with ConnectionError."""
+        if self._socket:
+            await self._socket.close()
+        if self._reader_task:
+            await self._reader_task
+            self._reader_task = None
+
+    async def _read_messages(self):
+        """Read messages from the socket and route them to requests and subscriptions."""
+        while True:
+            message = await self._socket.recv()
+            if message is None:
+                break
+            try:
+                moo_message = decode_message(message)
+                request_id = moo_message.request_id
+                if SERVICE_PING in moo_message.header:
+                    await self._socket.send(encode_complete("Success", request_id))
+                elif request_id in self._subscriptions:
+                    self._subscriptions[request_id].put_nowait(moo_message.body)
+                else:
+                    future = self._pending.pop(request_id, None)
+                    if future is not None and not future.done():
+                        future.set_result(moo_message.body)
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception("Error while parsing message '%s'", message)
+
+        LOGGER.debug("session closed")
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("Connection to roon server closed"))
+        self._pending = {}
+        for queue in self._subscriptions.values():
+            queue.put_nowait(None)
+
+    async def _send_request(self, command, data=None):
+        """Send a request and return the future that will hold its response."""
+        if not self.connected:
+            raise ConnectionError("Connection is not (yet) ready!")
+        request_id = self._requestid
+        self._requestid += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        await self._socket.send(encode_request(command, request_id, data))
+        return request_id, future
+
+    async def _request(self, command, data=None, timeout=None):
+        """
+        Send command and wait for result.
+
+        timeout is the deadline in seconds for this call, it defaults to
+        request_timeout; 0 waits indefinitely.
+        Raises RequestTimeoutException if the roon server does not answer in time.
+        """
+        if timeout is None:
+            timeout = self.request_timeout
+        request_id, future = await self._send_request(command, data)
+        try:
+            return await asyncio.wait_for(future, timeout or None)
+        except asyncio.TimeoutError:
+            self._pending.pop(request_id, None)
+            raise RequestTimeoutException(command, request_id, timeout) from None
+
+    async def request_many(self, requests, timeout=None):
+        """
+        Send several requests back-to-back and wait for all of their responses.
+
+        params:
+            requests: list of (command, data) tuples
+            timeout: optional deadline in seconds for the whole batch, defaults to request_timeout
+        returns: list with the response of each request, in the order of requests
+        Raises RequestTimeoutException if not all responses arrive in time.
+        """
+        results = [None] * len(requests)
+        async for index, result in self.iter_request_many(requests, timeout):
+            results[index] = result
+        return results
+
+    async def iter_request_many(self, requests, timeout=None):
+        """
+        Send several requests back-to-back and yield the responses as they arrive.
+
+        params:
+            requests: list of (command, data) tuples
+            timeout: optional deadline in seconds for the whole batch, defaults to request_timeout
+        yields: (index, response) tuples in order of arrival, index is the position in requests
+        Raises RequestTimeoutException if not all responses arrive in time.
+        """
+        if timeout is None:
+            timeout = self.request_timeout
+        outstanding = {}
+        for index, (command, data) in enumerate(requests):
+            request_id, future = await self._send_request(command, data)
+            outstanding[future] = (index, command, request_id)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+        while outstanding:
+            remaining = None if deadline is None else max(deadline - loop.time(), 0)
+            done, _ = await asyncio.wait(
+                outstanding, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                for _, _, request_id in outstanding.values():
+                    self._pending.pop(request_id, None)
+                _, command, request_id = next(iter(outstanding.values()))
+                raise RequestTimeoutException(command, request_id, timeout)
+            for future in done:
+                index, _, _ = outstanding.pop(future)
+                yield index, future.result()
+
+    async def _subscribe(self, service, endpoint, opt_data=None):
+        """Subscribe to events and yield each message as it arrives."""
+        if not self.connected:
+            raise ConnectionError("Connection is not (yet) ready!")
+        subkey = self._subkey
+        self._subkey += 1
+        data = {"subscription_key": subkey}
+        if opt_data:
+            data.update(opt_data)
+        queue = asyncio.Queue()
+        request_id = self._requestid
+        self._requestid += 1
+        self._subscriptions[request_id] = queue
+        try:
+            await self._socket.send(
+                encode_request(service + "/subscribe_" + endpoint, request_id, data)
+            )
+            while True:
+                body = await queue.get()
+                if body is None:
+                    return
+                yield body
+        finally:
+            del self._subscriptions[request_id]
+            if self.connected:
+                await self._send_request(
+                    service + "/unsubscribe_" + endpoint, {"subscription_key": subkey}
+                )
+
+    def subscribe_zones(self):
+        """Async iterator over the zone messages (zones, zones_changed, zones_seek_changed...)."""
+        return self._subscribe(SERVICE_TRANSPORT, "zones")
+
+    def subscribe_outputs(self):
+        """Async iterator over the output messages (outputs, outputs_changed...)."""
+        return self._subscribe(SERVICE_TRANSPORT, "outputs")
+
+    def subscribe_queue(self, zone_or_output_id):
+        """Async iterator over the queue messages of a zone or output."""
+        return self._subscribe(
+            SERVICE_TRANSPORT, "queue", {"zone_or_output_id": zone_or_output_id}
+        )
+
+    async def get_zones(self, timeout=None):
+        """Return all zones as a dict keyed by zone id."""
+        data = await self._request(SERVICE_TRANSPORT + "/get_zones", timeout=timeout)
+        return {zone["zone_id"]: zone for zone in data.get("zones", [])}
+
+    async def get_outputs(self, timeout=None):
+        """Return all outputs as a dict keyed by output id."""
+        data = await self._request(SERVICE_TRANSPORT + "/get_outputs", timeout=timeout)
+        self._outputs = {
+            output["output_id"]: output for output in data.get("outputs", [])
+        }
+        return self._outputs
+
+    def get_image(self, image_key, scale="fit", width=500, height=500):
+        """Get the image url for the specified image key, see RoonApi.get_image."""
+        return "http://%s:%s/api/image/%s?scale=%s&width=%s&height=%s" % (
+            self._host,
+            self._port,
+            image_key,
+            scale,
+            width,
+            height,
+        )
+
+    async def playback_control(self, zone_or_output_id, control="play", timeout=None):
+        """Send player command to the specified zone, see RoonApi.playback_control."""
+        data = {"zone_or_output_id": zone_or_output_id, "control": control}
+        return await self._request(SERVICE_TRANSPORT + "/control", data, timeout)
+
+    async def pause_all(self, timeout=None):
+        """Pause all zones."""
+        return await self._request(SERVICE_TRANSPORT + "/pause_all", timeout=timeout)
+
+    async def standby(self, output_id, control_key=None, timeout=None):
+        """Send standby command to the specified output."""
+        data = {"output_id": output_id, "control_key": control_key}
+        return await self._request(SERVICE_TRANSPORT + "/standby", data, timeout)
+
+    async def convenience_switch(self, output_id, control_key=None, timeout=None):
+        """Switch (convenience) an output, take it out of standby if needed."""
+        data = {"output_id": output_id, "control_key": control_key}
+        return await self._request(
+            SERVICE_TRANSPORT + "/convenience_switch", data, timeout
+        )
+
+    async def mute(self, output_id, mute=True, timeout=None):
+        """Mute/unmute an output."""
+        data = {"output_id": output_id, "how": "mute" if mute else "unmute"}
+        return await self._request(SERVICE_TRANSPORT + "/mute", data, timeout)
+
+    async def change_volume(self, output_id, value, method="absolute", timeout=None):
+        """Change the volume of an output, see RoonApi.change_volume."""
+        if output_id not in self._outputs:
+            await self.get_outputs(timeout)
+        output = self._outputs.get(output_id, {})
+        if "volume" not in output:
+            LOGGER.info("This endpoint has fixed volume.")
+            return None
+        if method == "absolute" and output["volume"]["type"] == "db":
+            value = int((float(value) / 100) * 80) - 80
+        data = {"output_id": output_id, "how": method, "value": value}
+        return await self._request(SERVICE_TRANSPORT + "/change_volume", data, timeout)
+
+    async def seek(self, zone_or_output_id, seconds, method="absolute", timeout=None):
+        """Seek to a time position within the now playing media."""
+        data = {
+            "zone_or_output_id": zone_or_output_id,
+            "how": method,
+            "seconds": seconds,
+        }
+        return await self._request(SERVICE_TRANSPORT + "/seek", data, timeout)
+
+    async def shuffle(self, zone_or_output_id, shuffle=True, timeout=None):
+        """Enable or disable playing in random order."""
+        data = {"zone_or_output_id": zone_or_output_id, "shuffle": shuffle}
+        return await self._request(SERVICE_TRANSPORT + "/change_settings", data, timeout)
+
+    async def repeat(self, zone_or_output_id, repeat=True, timeout=None):
+        """Enable/disable playing in a loop."""
+        loop = "loop" if repeat else "disabled"
+        data = {"zone_or_output_id": zone_or_output_id, "loop": loop}
+        return await self._request(SERVICE_TRANSPORT + "/change_settings", data, timeout)
+
+    async def transfer_zone(
+        self, from_zone_or_output_id, to_zone_or_output_id, timeout=None
+    ):
+        """Transfer the current queue from one zone to another."""
+        data = {
+            "from_zone_or_output_id": from_zone_or_output_id,
+            "to_zone_or_output_id": to_zone_or_output_id,
+        }
+        return await self._request(SERVICE_TRANSPORT + "/transfer_zone", data, timeout)
+
+    async def group_outputs(self, output_ids, timeout=None):
+        """Create a group of synchronized audio outputs."""
+        data = {"output_ids": output_ids}
+        return await self._request(SERVICE_TRANSPORT + "/group_outputs", data, timeout)
+
+    async def ungroup_outputs(self, output_ids, timeout=None):
+        """Ungroup outputs previous grouped."""
+        data = {"output_ids": output_ids}
+        return await self._request(
+            SERVICE_TRANSPORT + "/ungroup_outputs", data, timeout
+        )
+
+    async def browse_browse(self, opts, timeout=None):
+        """Complex browse call on the roon api, see RoonApi.browse_browse."""
+        return await self._request(SERVICE_BROWSE + "/browse", opts, timeout)
+
+    async def browse_load(self, opts, timeout=None):
+        """Complex browse call on the roon api, see RoonApi.browse_load."""
+        return await self._request(SERVICE_BROWSE + "/load", opts, timeout)
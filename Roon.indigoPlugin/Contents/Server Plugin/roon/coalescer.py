@@ -0,0 +1,126 @@
+"""
+Coalesce bursts of callbacks for the same zone or output.
+
+The state callbacks only get the ids of the changed zones/outputs and read the merged
+state when they run, so of several calls for the same event and id within a short
+window only the last one matters: it sees the newest state anyway. The coalescer holds
+a call back for the window and drops the calls that are superseded in the meantime.
+Urgent calls (eg a zone going from playing to paused) are not held back.
+"""
+
+from __future__ import unicode_literals
+
+import collections
+import threading
+import time
+
+from .constants import LOGGER
+
+
+class EventCoalescer:
+    """Delay callbacks by a window and merge the ones for the same key and event."""
+
+    def __init__(self, window=0.5, dispatcher=None):
+        """
+        Set up the coalescer, the flush thread starts on the first submit.
+
+        params:
+            window: seconds a call is held back to merge it with later calls
+            dispatcher: optional CallbackDispatcher to hand the calls to when they are due,
+                        by default they run on the coalescer's own thread
+        """
+        self.window = window
+        self._dispatcher = dispatcher
+        # (key, callback, event) -> (due time, key, callback, args), oldest first
+        self._pending = collections.OrderedDict()
+        self._condition = threading.Condition()
+        # held from taking calls off the queue until they have been delivered, so that the calls for a key
+        # can't overtake each other between the flush thread and an urgent submit (always taken after _condition)
+        self._delivering = threading.RLock()
+        self._thread = None
+        self._stopped = False
+        self.submitted = 0
+        self.coalesced = 0
+
+    def submit(self, key, callback, event, *args, urgent=False, merge=None):
+        """
+        Queue callback(event, *args), merging it with a pending call for the same key and event.
+
+        The merged call keeps its place (and due time) in the queue and takes the newest args,
+        or merge(pending_args, args) if given (eg to combine the changes both calls report).
+        An urgent call is delivered straight away, after any calls still pending for its key.
+        """
+        pending_key = (key, callback, event)
+        args = (event,) + args
+        with self._condition:
+            if self._stopped:
+                return
+            self.submitted += 1
+            if pending_key in self._pending:
+                self.coalesced += 1
+                if merge is not None:
+                    args = merge(self._pending[pending_key][3], args)
+            if urgent:
+                due = [item for pending, item in self._pending.items() if pending[0] == key]
+                for item in due:
+                    del self._pending[(item[1], item[2], item[3][0])]
+            elif pending_key in self._pending:
+                due_time = self._pending[pending_key][0]
+                self._pending[pending_key] = (due_time, key, callback, args)
+                return
+            else:
+                self._pending[pending_key] = (time.monotonic() + self.window, key, callback, args)
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="roon-coalesce")
+                    self._thread.daemon = True
+                    self._thread.start()
+                self._condition.notify()
+                return
+            self._delivering.acquire()
+        try:
+            for _, item_key, item_callback, item_args in due:
+                if (item_key, item_callback, item_args[0]) != pending_key:
+                    self._deliver(item_key, item_callback, item_args)
+            self._deliver(key, callback, args)
+        finally:
+            self._delivering.release()
+
+    def _deliver(self, key, callback, args):
+        """Hand a call to the dispatcher or run it."""
+        if self._dispatcher is not None:
+            self._dispatcher.submit(key, callback, *args)
+            return
+        try:
+            callback(*args)
+        # pylint: disable=broad-except
+        except Exception:
+            LOGGER.exception("Error while executing callback!")
+
+    def _run(self):
+        """Flush loop: deliver the calls whose window has passed."""
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    if self._pending:
+                        delay = next(iter(self._pending.values()))[0] - time.monotonic()
+                        if delay <= 0:
+                            break
+                        self._condition.wait(delay)
+                    else:
+                        self._condition.wait()
+                if not self._pending:
+                    return
+                _, (_, key, callback, args) = self._pending.popitem(last=False)
+                self._delivering.acquire()
+            try:
+                self._deliver(key, callback, args)
+            finally:
+                self._delivering.release()
+
+    def stop(self):
+        """Deliver the pending calls now and stop the flush thread."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
@@ -0,0 +1,103 @@
+"""
+JSON codec for the MOO transport.
+
+The fastest available backend is selected at import time, in the order of BACKENDS.
+Whatever the backend, loads() accepts bytes, memoryview or str and dumps() returns
+utf-8 encoded bytes, so the transport never needs an intermediate str.
+Use select() to override the choice (eg from the plugin config).
+"""
+
+from __future__ import unicode_literals
+
+import importlib
+
+from .constants import LOGGER
+
+BACKENDS = ("orjson", "ujson", "simplejson", "json")
+AUTO = "auto"
+
+
+def _orjson(module):
+    """Return loads and dumps for orjson, which works on bytes natively."""
+    return module.loads, module.dumps
+
+
+def _ujson(module):
+    """Return loads and dumps for ujson."""
+
+    def loads(data):
+        if isinstance(data, memoryview):
+            data = str(data, "utf-8")
+        return module.loads(data)
+
+    def dumps(obj):
+        return module.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+
+    return loads, dumps
+
+
+def _stdlib(module):
+    """Return loads and dumps for simplejson and json, which share their interface."""
+
+    def loads(data):
+        if not isinstance(data, str):
+            data = str(data, "utf-8")
+        return module.loads(data)
+
+    # one encoder for all calls, as dumps() with arguments builds a new encoder per call
+    encode = module.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+    def dumps(obj):
+        return encode(obj).encode("utf-8")
+
+    return loads, dumps
+
+
+_FACTORIES = {"orjson": _orjson, "ujson": _ujson, "simplejson": _stdlib, "json": _stdlib}
+
+name = None  # pylint: disable=invalid-name
+loads = None  # pylint: disable=invalid-name
+dumps = None  # pylint: disable=invalid-name
+
+
+def _load(backend):
+    """Return the (loads, dumps) pair of a backend or None if it is not installed."""
+    try:
+        module = importlib.import_module(backend)
+    except ImportError:
+        return None
+    return _FACTORIES[backend](module)
+
+
+def available():
+    """Return the names of the installed backends, fastest first."""
+    return [backend for backend in BACKENDS if _load(backend) is not None]
+
+
+def select(backend=AUTO):
+    """
+    Select the json backend used by the transport.
+
+    params:
+        backend: one of BACKENDS, or "auto" (or None) for the fastest installed one.
+                 An unknown or missing backend falls back to "auto" with a warning.
+    returns: the name of the selected backend
+    """
+    global name, loads, dumps  # pylint: disable=global-statement,invalid-name
+    if backend and backend != AUTO:
+        functions = _load(backend) if backend in _FACTORIES else None
+        if functions is not None:
+            name = backend
+            loads, dumps = functions
+            return name
+        LOGGER.warning("json backend '%s' is not available, selecting automatically", backend)
+    for candidate in BACKENDS:
+        functions = _load(candidate)
+        if functions is not None:
+            name = candidate
+            loads, dumps = functions
+            return name
+    return name
+
+
+select()
@@ -24,6 +24,10 @@ MESSAGE_CONTINUE = "CONTINUE"
 
 PAGE_SIZE = 100
 
+REQUEST_TIMEOUT = 2.5  # seconds to wait for the response to a request
+
+STATE_EVENTS = ("zones_changed", "zones_seek_changed", "outputs_changed")
+
 LOG_FORMAT = logging.Formatter(
     "%(asctime)-15s %(levelname)-5s  %(module)s -- %(message)s"
 )
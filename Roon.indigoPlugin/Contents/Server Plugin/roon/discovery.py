@@ -1,34 +1,91 @@
 """
 Module defining a class to discover Roon servers.
 
-If multiple servers are available on the network, the first to be discovered
+The SOOD query is sent on every IPv4 interface, both to the SOOD multicast group and as a broadcast,
+and retransmitted with backoff until the wanted server answers or the timeout expires. The responses
+on all interfaces are collected by unique_id, so a server answering on several interfaces is reported once.
+
+If multiple servers are available on the network and no core_id is given, the first to be discovered
 is selected. This may not be the one you have enabled the plugin for.
 """
 
+import ipaddress
 import os.path
+import selectors
 import socket
 import threading
+import time
 
 from .soodmessage import FormatException, SOODMessage
 from .constants import SOOD_PORT, SOOD_MULTICAST_IP, LOGGER
 
+try:
+    import ifaddr  # optional: lists every interface and its netmask (for the directed broadcast address)
+except ImportError:
+    ifaddr = None
+
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".soodmsg"), "rb") as sood_query_file:
+    SOOD_QUERY = sood_query_file.read()
+
+DISCOVERY_TIMEOUT = 5.0
+# the query is sent straight away and then retransmitted after 0.1, 0.2, 0.4, ... seconds, at most every 1.6 seconds
+RETRANSMIT_INTERVAL = 0.1
+MAX_RETRANSMIT_INTERVAL = 1.6
+# longest wait between checks of the stop flag
+STOP_CHECK_INTERVAL = 0.25
+
+
+def interface_addresses():
+    """Return (address, broadcast address) of every IPv4 interface other than loopback."""
+    addresses = {}
+    if ifaddr is not None:
+        for adapter in ifaddr.get_adapters():
+            for adapter_ip in adapter.ips:
+                if not adapter_ip.is_IPv4:
+                    continue
+                network = ipaddress.IPv4Network(
+                    "%s/%s" % (adapter_ip.ip, adapter_ip.network_prefix), strict=False
+                )
+                addresses[adapter_ip.ip] = (
+                    str(network.broadcast_address)
+                    if network.num_addresses > 2
+                    else "<broadcast>"
+                )
+    else:
+        try:
+            for info in socket.getaddrinfo(socket.gethostname(), None, socket.AF_INET):
+                addresses.setdefault(info[4][0], "<broadcast>")
+        except OSError:
+            pass
+        # the address of the interface with the route to the multicast group (connect() sends nothing over udp)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            try:
+                sock.connect((SOOD_MULTICAST_IP, SOOD_PORT))
+                addresses.setdefault(sock.getsockname()[0], "<broadcast>")
+            except OSError:
+                pass
+    return [
+        (address, broadcast)
+        for address, broadcast in addresses.items()
+        if not ipaddress.IPv4Address(address).is_loopback
+    ]
+
 
 class RoonDiscovery(threading.Thread):
     """Class to discover Roon Servers connected in the network."""
 
-    def __init__(self, core_id=None):
-        """Discover Roon Servers connected in the network."""
+    def __init__(self, core_id=None, timeout=DISCOVERY_TIMEOUT):
+        """Discover Roon Servers connected in the network (only the one with unique_id core_id, if given)."""
         self._exit = threading.Event()
         self._core_id = core_id
+        self._timeout = timeout
+        self.result = []
         threading.Thread.__init__(self)
         self.daemon = True
 
     def run(self):
-        """Run discovery until server found."""
-        while not self._exit.isSet():
-            host, _ = self.first()
-            if host:
-                self.stop()
+        """Run discovery once, until a server is found or the timeout expires. The servers found are left in result."""
+        self.result = self._discover(first_only=True)
 
     def stop(self):
         """Stop scan."""
@@ -36,57 +93,129 @@ class RoonDiscovery(threading.Thread):
 
     def all(self):
         """Scan and return all found entries as a list. Each server is a tuple of host,port."""
-        return self._discover(first_only=False)
+        return [(core["host"], core["http_port"]) for core in self._discover(first_only=False)]
 
     def first(self):
         """Return first server that is found."""
         all_servers = self._discover(first_only=True)
-        return all_servers[0] if all_servers else (None, None)
+        return (all_servers[0]["host"], all_servers[0]["http_port"]) if all_servers else (None, None)
+
+    def cores(self, first_only=False):
+        """
+        Scan and return the details of the servers found as a list of dicts.
+
+        Each dict holds the unique_id, name, display_version, host, http_port and tcp_port of a server.
+        A scan for the core_id (or with first_only) returns as soon as a server answers, otherwise it lasts the whole timeout.
+        """
+        return self._discover(first_only=first_only)
 
-    # pylint: disable=too-many-locals
     def _discover(self, first_only=False):
-        """Update the server entry with details."""
-        this_dir = os.path.dirname(os.path.abspath(__file__))
-        sood_file = os.path.join(this_dir, ".soodmsg")
-        with open(sood_file) as sood_query_file:
-            msg = sood_query_file.read()
-        msg = msg.encode()
-        entries = []
-
-        with socket.socket(
-            socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP
-        ) as sock:
-            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 32)
-            sock.sendto(msg, (SOOD_MULTICAST_IP, SOOD_PORT))
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            sock.sendto(msg, ("<broadcast>", SOOD_PORT))
-            sock.settimeout(5)
-            while not self._exit.isSet():
-                try:
-                    data, server = sock.recvfrom(1024)
-                    message = SOODMessage(data).as_dictionary
-
-                    host = server[0]
-                    port = message["properties"]["http_port"]
-                    unique_id = message["properties"]["unique_id"]
-                    LOGGER.debug("Discovered %s", message)
-
-                    if self._core_id is not None and self._core_id != unique_id:
-                        LOGGER.debug(
-                            "Ignoring server with id %s, because we're looking for %s",
-                            unique_id,
-                            self._core_id,
-                        )
-                        continue
-
-                    entries.append((host, port))
-                    if first_only:
-                        # we're only interested in the first server found
-                        break
-                except socket.timeout:
+        """Query on all interfaces and collect the responses by unique_id."""
+        found = {}
+        sockets = self._open_sockets()
+        if not sockets:
+            LOGGER.warning("No network interface to discover Roon servers on")
+            return []
+        try:
+            with selectors.DefaultSelector() as selector:
+                for sock, _ in sockets:
+                    selector.register(sock, selectors.EVENT_READ)
+                now = time.monotonic()
+                deadline = now + self._timeout
+                next_send = now
+                interval = RETRANSMIT_INTERVAL
+                while not self._exit.is_set() and now < deadline:
+                    if now >= next_send:
+                        self._send(sockets)
+                        next_send = now + interval
+                        interval = min(interval * 2, MAX_RETRANSMIT_INTERVAL)
+                    wait = min(next_send, deadline, now + STOP_CHECK_INTERVAL) - now
+                    for key, _ in selector.select(max(wait, 0)):
+                        core = self._receive(key.fileobj)
+                        if core is None or core["unique_id"] in found:
+                            continue
+                        found[core["unique_id"]] = core
+                        if first_only or self._core_id is not None:
+                            # the core_id has answered (the other servers are ignored), or any server will do
+                            return list(found.values())
+                    now = time.monotonic()
+                if not found:
                     LOGGER.debug("Timeout")
-                    break
-                except FormatException as format_exception:
-                    LOGGER.error("Format exception %s", format_exception.message)
-                    break
-        return entries
+        finally:
+            for sock, _ in sockets:
+                sock.close()
+        return list(found.values())
+
+    @staticmethod
+    def _open_sockets():
+        """Return (socket, broadcast address) to query on: the default interface, then each interface in turn."""
+        sockets = []
+        for address, broadcast in [("0.0.0.0", "<broadcast>")] + interface_addresses():
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+            try:
+                sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 32)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+                if address != "0.0.0.0":
+                    sock.setsockopt(
+                        socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(address)
+                    )
+                sock.bind((address, 0))
+                sock.setblocking(False)
+            except OSError as exc:
+                LOGGER.debug("Unable to discover on interface %s: %s", address, exc)
+                sock.close()
+                continue
+            sockets.append((sock, broadcast))
+        return sockets
+
+    @staticmethod
+    def _send(sockets):
+        """Send the query on every socket, to the multicast group and as a broadcast."""
+        for sock, broadcast in sockets:
+            for destination in (SOOD_MULTICAST_IP, broadcast):
+                try:
+                    sock.sendto(SOOD_QUERY, (destination, SOOD_PORT))
+                except OSError as exc:
+                    LOGGER.debug("Unable to send discovery query to %s: %s", destination, exc)
+
+    def _receive(self, sock):
+        """Read a response from the socket, return the details of the server or None if not wanted."""
+        try:
+            data, server = sock.recvfrom(1024)
+            message = SOODMessage(data).as_dictionary
+        except (BlockingIOError, InterruptedError):
+            return None
+        except OSError as exc:
+            LOGGER.debug("Discovery receive failed: %s", exc)
+            return None
+        except (FormatException, UnicodeDecodeError) as format_exception:
+            LOGGER.debug("Ignoring malformed discovery response: %s", format_exception)
+            return None
+        if message["type"] != SOODMessage.SOODMessageType.RESPONSE:
+            return None
+
+        properties = message["properties"]
+        unique_id = properties.get("unique_id")
+        LOGGER.debug("Discovered %s", message)
+        if unique_id is None or not properties.get("http_port"):
+            return None
+        if self._core_id is not None and self._core_id != unique_id:
+            LOGGER.debug(
+                "Ignoring server with id %s, because we're looking for %s",
+                unique_id,
+                self._core_id,
+            )
+            return None
+
+        try:
+            return {
+                "unique_id": unique_id,
+                "name": properties.get("name"),
+                "display_version": properties.get("display_version"),
+                "host": server[0],
+                "http_port": int(properties["http_port"]),
+                "tcp_port": int(properties["tcp_port"]) if properties.get("tcp_port") else None,
+            }
+        except ValueError:
+            LOGGER.debug("Ignoring discovery response with invalid ports: %s", properties)
+            return None
@@ -0,0 +1,147 @@
+"""
+Deliver callbacks on a pool of worker threads instead of the websocket reader thread.
+
+Every callback is submitted with a key (eg a zone or output id). Calls with the same
+key always go to the same worker, so they run in the order they were submitted,
+while calls for different keys run in parallel on the other workers.
+"""
+
+from __future__ import unicode_literals
+
+import collections
+import threading
+
+from .constants import LOGGER
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_DROP_NEWEST = "drop_newest"
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_DROP_NEWEST)
+
+
+class _Lane:  # pylint: disable=too-few-public-methods
+    """The queue of one worker thread."""
+
+    __slots__ = ("items", "condition", "thread", "high_water")
+
+    def __init__(self):
+        """Init an empty lane."""
+        self.items = collections.deque()
+        self.condition = threading.Condition()
+        self.thread = None
+        self.high_water = 0
+
+
+class CallbackDispatcher:
+    """Bounded worker pool that runs callbacks in order per key."""
+
+    def __init__(self, workers=4, max_queue_size=1000, overflow=OVERFLOW_BLOCK):
+        """
+        Set up the dispatcher, the worker threads start on the first submit.
+
+        params:
+            workers: number of worker threads
+            max_queue_size: maximum number of waiting calls per worker
+            overflow: what to do when a worker's queue is full:
+                      "block" waits for room (and so applies back pressure to the caller),
+                      "drop_oldest" discards the oldest waiting call,
+                      "drop_newest" discards the call being submitted
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError("overflow must be one of %s" % ", ".join(OVERFLOW_POLICIES))
+        self.max_queue_size = max(1, max_queue_size)
+        self.overflow = overflow
+        self._lanes = [_Lane() for _ in range(max(1, workers))]
+        self._stats_lock = threading.Lock()
+        self._submitted = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._errors = 0
+        self._stopped = False
+
+    def submit(self, key, callback, *args):
+        """
+        Queue callback(*args) to run on the worker for key.
+
+        returns: False if the call was dropped (or the dispatcher is stopped), True otherwise
+        """
+        if self._stopped:
+            return False
+        lane = self._lanes[hash(key) % len(self._lanes)]
+        accepted = True
+        dropped = False
+        with lane.condition:
+            if lane.thread is None:
+                lane.thread = threading.Thread(target=self._run, args=(lane,), name="roon-dispatch")
+                lane.thread.daemon = True
+                lane.thread.start()
+            if len(lane.items) >= self.max_queue_size:
+                if self.overflow == OVERFLOW_DROP_NEWEST:
+                    accepted = False
+                    dropped = True
+                elif self.overflow == OVERFLOW_DROP_OLDEST:
+                    lane.items.popleft()
+                    dropped = True
+                else:
+                    while len(lane.items) >= self.max_queue_size:
+                        lane.condition.wait()
+            if accepted:
+                lane.items.append((callback, args))
+                lane.high_water = max(lane.high_water, len(lane.items))
+                lane.condition.notify_all()
+        with self._stats_lock:
+            self._submitted += 1
+            if dropped:
+                self._dropped += 1
+        if dropped:
+            LOGGER.debug("callback queue for %s full, dropped the %s call", key, self.overflow[5:])
+        return accepted
+
+    def _run(self, lane):
+        """Worker loop: run the calls of a lane in order."""
+        while True:
+            with lane.condition:
+                while not lane.items and not self._stopped:
+                    lane.condition.wait()
+                if not lane.items:
+                    return
+                callback, args = lane.items.popleft()
+                lane.condition.notify_all()
+            try:
+                callback(*args)
+            # pylint: disable=broad-except
+            except Exception:
+                LOGGER.exception("Error while executing callback!")
+                with self._stats_lock:
+                    self._errors += 1
+            with self._stats_lock:
+                self._delivered += 1
+
+    def stats(self):
+        """
+        Return the queue metrics.
+
+        returns: dict with the submitted, delivered, dropped and failed call counts,
+                 the current total queue depth, and per worker the current and highest depth
+        """
+        depths = [len(lane.items) for lane in self._lanes]
+        with self._stats_lock:
+            return {
+                "submitted": self._submitted,
+                "delivered": self._delivered,
+                "dropped": self._dropped,
+                "errors": self._errors,
+                "queued": sum(depths),
+                "queue_depths": depths,
+                "high_water": [lane.high_water for lane in self._lanes],
+            }
+
+    def stop(self, timeout=None):
+        """Stop the workers once the calls already queued have run."""
+        self._stopped = True
+        for lane in self._lanes:
+            with lane.condition:
+                lane.condition.notify_all()
+        for lane in self._lanes:
+            if lane.thread is not None:
+                lane.thread.join(timeout)
@@ -0,0 +1,132 @@
+"""
+Encoding and decoding of the MOO messages that are exchanged with the roon server.
+
+A MOO message consists of a first line "MOO/1 <VERB> <name>", a set of headers and,
+optionally, a blank line followed by a body.
+See https://github.com/RoonLabs/node-roon-api/blob/master/moomsg.js
+"""
+
+from __future__ import unicode_literals
+
+from . import codec
+
+
+class MooMessage:  # pylint: disable=too-few-public-methods
+    """A decoded MOO message."""
+
+    __slots__ = ("header", "verb", "name", "request_id", "body")
+
+    def __init__(self, header, verb, name, request_id, body):
+        """Init with the parts of the message."""
+        self.header = header
+        self.verb = verb
+        self.name = name
+        self.request_id = request_id
+        self.body = body
+
+    def __repr__(self):
+        """Print verb, name and request id."""
+        return "<MooMessage %s %s %s>" % (self.verb, self.name, self.request_id)
+
+
+_JSON_CONTENT_TYPE = b"\nContent-Type: application/json\n\n"
+
+# Encoded "MOO/1 <VERB> <name>\nRequest-Id: " per verb and name. The names are the
+# service commands and reply names, so these stay small.
+_PREFIXES = {"REQUEST": {}, "CONTINUE": {}, "COMPLETE": {}}
+
+
+def _prefix(verb, name):
+    """Return the encoded first line and Request-Id header name of a message."""
+    prefixes = _PREFIXES[verb]
+    prefix = prefixes.get(name)
+    if prefix is None:
+        prefix = prefixes[name] = ("MOO/1 %s %s\nRequest-Id: " % (verb, name)).encode("utf-8")
+    return prefix
+
+
+def _encode(prefix, request_id, body, content_type=_JSON_CONTENT_TYPE):
+    """
+    Return the bytes of a message from its cached prefix.
+
+    The body is serialized straight to bytes by the codec and the message is built
+    with a single bytes formatting, so Content-Length is the length in bytes.
+    """
+    if body is None:
+        return b"%s%d\n\n" % (prefix, request_id)
+    body = codec.dumps(body)
+    return b"%s%d\nContent-Length: %d%s%s" % (prefix, request_id, len(body), content_type, body)
+
+
+def encode_request(command, request_id, body=None, content_type="application/json"):
+    """Return the bytes of a REQUEST message."""
+    prefix = _PREFIXES["REQUEST"].get(command) or _prefix("REQUEST", command)
+    if content_type == "application/json":
+        return _encode(prefix, request_id, body)
+    return _encode(prefix, request_id, body, ("\nContent-Type: %s\n\n" % content_type).encode("utf-8"))
+
+
+def encode_continue(name, request_id, body):
+    """Return the bytes of a CONTINUE message."""
+    return _encode(_PREFIXES["CONTINUE"].get(name) or _prefix("CONTINUE", name), request_id, body)
+
+
+def encode_complete(name, request_id, body=""):
+    """Return the bytes of a COMPLETE message."""
+    return _encode(_PREFIXES["COMPLETE"].get(name) or _prefix("COMPLETE", name), request_id, body or None)
+
+
+def decode_message(message):
+    """
+    Decode the bytes of a message received from the roon server.
+
+    The header block is parsed from the raw bytes in a single pass; the body is handed
+    to the json codec as a bytes slice of the frame, without decoding or splitting it
+    (a memoryview costs more to create than the copy saves, even on large zone frames).
+    A message without a body keeps its first line as body, as the replies to simple
+    requests carry their result (eg "MOO/1 COMPLETE Success") there.
+    """
+    if isinstance(message, str):
+        message = message.encode("utf-8")
+    boundary = message.find(b"\n\n")
+    header_end = boundary if boundary >= 0 else len(message)
+    line_end = message.find(b"\n", 0, header_end)
+    if line_end < 0:
+        line_end = header_end
+
+    header = message[:line_end].decode("utf-8")
+    parts = header.split(" ", 2)
+    verb = parts[1] if len(parts) > 1 else ""
+    name = parts[2] if len(parts) > 2 else ""
+
+    request_id = None
+    content_length = None
+    content_type = None
+    logging = False
+    if line_end < header_end:
+        for line in message[line_end + 1 : header_end].split(b"\n"):
+            key, _, value = line.partition(b":")
+            if key == b"Request-Id":
+                request_id = int(value)
+            elif key == b"Content-Length":
+                content_length = int(value)
+            elif key == b"Content-Type":
+                content_type = value.strip()
+            elif key == b"Logging":
+                logging = True
+
+    if content_type is None:
+        body = "" if logging else header
+    elif boundary < 0:
+        body = ""
+    else:
+        start = boundary + 2
+        end = len(message) if content_length is None else start + content_length
+        data = message[start:end]
+        if not data:
+            body = ""
+        elif content_type == b"application/json":
+            body = codec.loads(data)
+        else:
+            body = str(data, "utf-8")
+    return MooMessage(header, verb, name, request_id, body)
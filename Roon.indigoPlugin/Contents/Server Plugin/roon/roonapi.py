@@ -1,17 +1,45 @@
 from __future__ import unicode_literals
 
 import os
+import queue
 import threading
 import time
+from collections.abc import Mapping
+from types import MappingProxyType
 
 from .constants import (
     LOGGER,
     PAGE_SIZE,
+    REQUEST_TIMEOUT,
     SERVICE_BROWSE,
     SERVICE_REGISTRY,
     SERVICE_TRANSPORT,
+    STATE_EVENTS,
 )
-from .roonapisocket import RoonApiWebSocket
+from .coalescer import EventCoalescer
+from .roonapisocket import ConnectionClosedException, RequestTimeoutException, RoonApiWebSocket
+from .snapshot import Snapshot, freeze, merge
+
+
+def changed_paths(current, update, prefix="", paths=None):
+    """
+    Return the paths of the values in update that differ from current.
+
+    Nested dicts are compared key by key, so eg a new cover gives "now_playing.image_key"
+    and a volume change "volume.value"; any other value (eg the outputs list of a zone)
+    is reported by its own path when it differs.
+    """
+    if paths is None:
+        paths = []
+    for key, value in update.items():
+        old_value = current.get(key)
+        if old_value == value and key in current:
+            continue
+        if isinstance(value, Mapping) and isinstance(old_value, Mapping):
+            changed_paths(old_value, value, prefix + key + ".", paths)
+        else:
+            paths.append(prefix + key)
+    return paths
 
 
 def split_media_path(path):
@@ -44,10 +72,8 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
     _port = None
     _token = None
     _exit = False
-    _zones = {}
-    _outputs = {}
-    _state_callbacks = []
     ready = False
+    request_timeout = REQUEST_TIMEOUT
 
     @property
     def token(self):
@@ -59,6 +85,11 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
         """Return the roon host."""
         return self._host
 
+    @property
+    def port(self):
+        """Return the roon http port."""
+        return self._port
+
     @property
     def core_id(self):
         """Return the roon host."""
@@ -71,51 +102,52 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
 
     @property
     def zones(self):
-        """Return All zones as a dict."""
-        return self._zones
+        """Return All zones as a read-only mapping of frozen zones."""
+        return self.snapshot().zones
 
     @property
     def outputs(self):
-        """All outputs, returned as dict."""
-        return self._outputs
+        """All outputs, returned as a read-only mapping of frozen outputs."""
+        return self.snapshot().outputs
+
+    def snapshot(self):
+        """
+        Return the current state of all zones and outputs.
+
+        The snapshot and the zones and outputs in it are immutable, so they can be kept
+        and read from any thread without copying. Each state change gets a new version.
+        """
+        return self._snapshot
+
+    def _publish_snapshot(self):
+        """Publish the current zones and outputs as a new snapshot version."""
+        self._snapshot = Snapshot(
+            self._snapshot.version + 1,
+            MappingProxyType(dict(self._zones)),
+            MappingProxyType(dict(self._outputs)),
+        )
 
     def zone_by_name(self, zone_name):
         """Get zone details by name."""
-        for zone in self.zones.values():
-            if zone["display_name"] == zone_name:
-                return zone
-        return None
+        return self._zones.get(self._zone_id_by_name.get(zone_name))
 
     def output_by_name(self, output_name):
         """Get the output details from the name."""
-        for output in self.outputs.values():
-            if output["display_name"] == output_name:
-                return output
-        return None
+        return self._outputs.get(self._output_id_by_name.get(output_name))
 
     # Autolog Change Start
     def zone_by_zone_id(self, zone_id):
         ''' get the zone details by output id'''
-        for zone in self.zones.values():
-            if zone["zone_id"] == zone_id:
-                return zone
-        return None
+        return self._zones.get(zone_id)
 
     def output_by_output_id(self, output_id):
         ''' get the output details by output id'''
-        for output in self.outputs.values():
-            if output["output_id"] == output_id:
-                return output
-        return None
+        return self._outputs.get(output_id)
     # Autolog Change End
 
     def zone_by_output_id(self, output_id):
         """Get the zone details by output id."""
-        for zone in self.zones.values():
-            for output in zone["outputs"]:
-                if output["output_id"] == output_id:
-                    return zone
-        return None
+        return self._zones.get(self._zone_id_by_output_id.get(output_id))
 
     def zone_by_output_name(self, output_name):
         """
@@ -125,12 +157,7 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
             output_name: the name of the output
         returns: full zone details (dict)
         """
-
-        for zone in self.zones.values():
-            for output in zone["outputs"]:
-                if output["display_name"] == output_name:
-                    return zone
-        return None
+        return self._zones.get(self._zone_id_by_output_name.get(output_name))
 
     def is_grouped(self, output_id):
         """
@@ -202,7 +229,7 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
             height,
         )
 
-    def playback_control(self, zone_or_output_id, control="play"):
+    def playback_control(self, zone_or_output_id, control="play", timeout=None):
         """
         Send player command to the specified zone.
 
@@ -216,15 +243,21 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
                  * "stop" - Stop playback and release the audio device immediately
                  * "previous" - Go to the start of the current track, or to the previous track
                  * "next" - Advance to the next track
+            timeout: optional deadline in seconds for the response
         """
         data = {"zone_or_output_id": zone_or_output_id, "control": control}
-        return self._request(SERVICE_TRANSPORT + "/control", data)
+        return self._request(SERVICE_TRANSPORT + "/control", data, timeout=timeout)
 
-    def pause_all(self):
-        """Pause all zones."""
-        return self._request(SERVICE_TRANSPORT + "/pause_all")
+    def pause_all(self, timeout=None):
+        """
+        Pause all zones.
 
-    def standby(self, output_id, control_key=None):
+        params:
+            timeout: optional deadline in seconds for the response
+        """
+        return self._request(SERVICE_TRANSPORT + "/pause_all", timeout=timeout)
+
+    def standby(self, output_id, control_key=None, timeout=None):
         """
         Send standby command to the specified output.
 
@@ -234,11 +267,12 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
                          that is to be put into standby. If omitted,
                          then all source controls on this output that support
                          standby will be put into standby.
+            timeout: optional deadline in seconds for the response
         """
         data = {"output_id": output_id, "control_key": control_key}
-        return self._request(SERVICE_TRANSPORT + "/standby", data)
+        return self._request(SERVICE_TRANSPORT + "/standby", data, timeout=timeout)
 
-    def convenience_switch(self, output_id, control_key=None):
+    def convenience_switch(self, output_id, control_key=None, timeout=None):
         """
         Switch (convenience) an output, take it out of standby if needed.
 
@@ -246,23 +280,25 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
             output_id: the id of the output that should be convenience-switched.
             control_key: The control_key that identifies the source_control that is to be switched.
                          If omitted, then all controls on this output will be convenience switched.
+            timeout: optional deadline in seconds for the response
         """
         data = {"output_id": output_id, "control_key": control_key}
-        return self._request(SERVICE_TRANSPORT + "/convenience_switch", data)
+        return self._request(SERVICE_TRANSPORT + "/convenience_switch", data, timeout=timeout)
 
-    def mute(self, output_id, mute=True):
+    def mute(self, output_id, mute=True, timeout=None):
         """
         Mute/unmute an output.
 
         params:
             output_id: the id of the output that should be muted/unmuted
             mute: bool if the output should be muted. Will unmute if set to False
+            timeout: optional deadline in seconds for the response
         """
         how = "mute" if mute else "unmute"
         data = {"output_id": output_id, "how": how}
-        return self._request(SERVICE_TRANSPORT + "/mute", data)
+        return self._request(SERVICE_TRANSPORT + "/mute", data, timeout=timeout)
 
-    def change_volume(self, output_id, value, method="absolute"):
+    def change_volume(self, output_id, value, method="absolute", timeout=None):
         """
         Change the volume of an output.
 
@@ -272,6 +308,7 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
             output_id: the id of the output
             value: The new volume value, or the increment value or step (as percentage)
             method: How to interpret the volume ('absolute'|'relative'|'relative_step')
+            timeout: optional deadline in seconds for the response
         """
         if "volume" not in self._outputs[output_id]:
             LOGGER.info("This endpoint has fixed volume.")
@@ -283,12 +320,14 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
                 if self._outputs[output_id]["volume"]["type"] == "db":
                     value = int((float(value) / 100) * 80) - 80
             data = {"output_id": output_id, "how": method, "value": value}
-            return self._request(SERVICE_TRANSPORT + "/change_volume", data)
+            return self._request(SERVICE_TRANSPORT + "/change_volume", data, timeout=timeout)
+        except (RequestTimeoutException, ConnectionClosedException):
+            raise
         except Exception as exc:  # pylint: disable=broad-except
             LOGGER.error("set_volume_level failed for entity %s.", str(exc))
             return None
 
-    def seek(self, zone_or_output_id, seconds, method="absolute"):
+    def seek(self, zone_or_output_id, seconds, method="absolute", timeout=None):
         """
         Seek to a time position within the now playing media.
 
@@ -296,72 +335,78 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
             zone_or_output_id: the id of the zone or output
             seconds: The target seek position
             method: How to interpret the target seek position ('absolute'|'relative')
+            timeout: optional deadline in seconds for the response
         """
         data = {
             "zone_or_output_id": zone_or_output_id,
             "how": method,
             "seconds": seconds,
         }
-        return self._request(SERVICE_TRANSPORT + "/seek", data)
+        return self._request(SERVICE_TRANSPORT + "/seek", data, timeout=timeout)
 
-    def shuffle(self, zone_or_output_id, shuffle=True):
+    def shuffle(self, zone_or_output_id, shuffle=True, timeout=None):
         """
         Enable or disable playing in random order.
 
         params:
             zone_or_output_id: the id of the output or zone
             shuffle: bool if shuffle should be enabled. False will disable shuffle
+            timeout: optional deadline in seconds for the response
         """
         data = {"zone_or_output_id": zone_or_output_id, "shuffle": shuffle}
-        return self._request(SERVICE_TRANSPORT + "/change_settings", data)
+        return self._request(SERVICE_TRANSPORT + "/change_settings", data, timeout=timeout)
 
-    def repeat(self, zone_or_output_id, repeat=True):
+    def repeat(self, zone_or_output_id, repeat=True, timeout=None):
         """
         Enable/disable playing in a loop.
 
         params:
             zone_or_output_id: the id of the output or zone
             repeat: bool if repeat should be enabled. False will disable shuffle
+            timeout: optional deadline in seconds for the response
         """
         loop = "loop" if repeat else "disabled"
         data = {"zone_or_output_id": zone_or_output_id, "loop": loop}
-        return self._request(SERVICE_TRANSPORT + "/change_settings", data)
+        return self._request(SERVICE_TRANSPORT + "/change_settings", data, timeout=timeout)
 
-    def transfer_zone(self, from_zone_or_output_id, to_zone_or_output_id):
+    def transfer_zone(self, from_zone_or_output_id, to_zone_or_output_id, timeout=None):
         """
         Transfer the current queue from one zone to another.
 
         params:
             from_zone_or_output_id - The source zone or output
             to_zone_or_output_id - The destination zone or output
+            timeout: optional deadline in seconds for the response
         """
         data = {
             "from_zone_or_output_id": from_zone_or_output_id,
             "to_zone_or_output_id": to_zone_or_output_id,
         }
-        return self._request(SERVICE_TRANSPORT + "/transfer_zone", data)
+        return self._request(SERVICE_TRANSPORT + "/transfer_zone", data, timeout=timeout)
 
-    def group_outputs(self, output_ids):
+    def group_outputs(self, output_ids, timeout=None):
         """
         Create a group of synchronized audio outputs.
 
         params:
             output_ids - The outputs to group. The first output's zone's queue is preserved.
+            timeout: optional deadline in seconds for the response
         """
         data = {"output_ids": output_ids}
-        return self._request(SERVICE_TRANSPORT + "/group_outputs", data)
+        return self._request(SERVICE_TRANSPORT + "/group_outputs", data, timeout=timeout)
 
-    def ungroup_outputs(self, output_ids):
+    def ungroup_outputs(self, output_ids, timeout=None):
         """
         Ungroup outputs previous grouped.
 
         params:
             output_ids - The outputs to ungroup.
+            timeout: optional deadline in seconds for the response
         """
         data = {"output_ids": output_ids}
-        return self._request(SERVICE_TRANSPORT + "/ungroup_outputs", data)
+        return self._request(SERVICE_TRANSPORT + "/ungroup_outputs", data, timeout=timeout)
 
-    def register_state_callback(self, callback, event_filter=None, id_filter=None):
+    def register_state_callback(self, callback, event_filter=None, id_filter=None, with_changes=False):
         """
         Register a callback to be informed about changes to zones or outputs.
 
@@ -370,8 +415,12 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
                       callback will be called with params:
                       - event: string with name of the event ("zones_changed", "zones_seek_changed", "outputs_changed")
                       - a list with the zone or output id's that changed
+                      - if with_changes: a dict with per changed id a frozenset of the changed paths
+                        (eg "state", "now_playing.image_key", "volume.value", "outputs"),
+                        or None if the zone or output is new
             event_filter: only callback if the event is in this list
             id_filter: one or more zone or output id's or names to filter on (list or string)
+            with_changes: also pass the changed paths to the callback
         """
         if not event_filter:
             event_filter = []
@@ -381,36 +430,64 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
             id_filter = []
         elif not isinstance(id_filter, list):
             id_filter = [id_filter]
-        self._state_callbacks.append((callback, event_filter, id_filter))
-
-    def register_queue_callback(self, callback, zone_or_output_id=""):
+        index = len(self._state_callbacks)
+        self._state_callbacks.append((callback, event_filter, id_filter, with_changes))
+        # compile the filters into the routing table used by _on_state_change
+        for event in event_filter or STATE_EVENTS:
+            by_key, unfiltered = self._callback_routes.setdefault(event, ({}, []))
+            if not id_filter:
+                unfiltered.append(index)
+            for key in id_filter:
+                by_key.setdefault(key, []).append(index)
+
+    def register_queue_callback(self, callback, zone_or_output_id="", max_item_count=None):
         """
         Subscribe to queue change events.
 
         callback: function which will be called with the updated data (provided as dict object
         zone_or_output_id: If provided, only listen for updates for this zone or output
+        max_item_count: If provided, only the first max_item_count items of the queue are sent
+        The subscription is renewed after a reconnect to the core. Registering again for the same
+        zone or output replaces the previous subscription.
         """
+        if zone_or_output_id in self._queue_callbacks:
+            self.unregister_queue_callback(zone_or_output_id)
+        opt_data = {}
         if zone_or_output_id:
-            opt_data = {"zone_or_output_id": zone_or_output_id}
-        else:
-            opt_data = None
-        self._roonsocket.subscribe(SERVICE_TRANSPORT, "queue", callback, opt_data)
-
-    def browse_browse(self, opts):
+            opt_data["zone_or_output_id"] = zone_or_output_id
+        if max_item_count is not None:
+            opt_data["max_item_count"] = max_item_count
+        self._queue_callbacks[zone_or_output_id] = (callback, opt_data or None)
+        if self.ready:
+            self._roonsocket.subscribe(SERVICE_TRANSPORT, "queue", callback, opt_data or None)
+
+    def unregister_queue_callback(self, zone_or_output_id=""):
+        """Unsubscribe from the queue change events of a zone or output (or of all, if not provided)."""
+        queue_callback = self._queue_callbacks.pop(zone_or_output_id, None)
+        if queue_callback is not None and self.ready:
+            self._roonsocket.unsubscribe(SERVICE_TRANSPORT, "queue", queue_callback[1], exact=True)
+
+    def browse_browse(self, opts, timeout=None):
         """
         Complex browse call on the roon api.
 
         reference: https://github.com/RoonLabs/node-roon-api-browse/blob/master/lib.js
+
+        params:
+            timeout: optional deadline in seconds for the response
         """
-        return self._request(SERVICE_BROWSE + "/browse", opts)
+        return self._request(SERVICE_BROWSE + "/browse", opts, timeout=timeout)
 
-    def browse_load(self, opts):
+    def browse_load(self, opts, timeout=None):
         """
         Complex browse call on the roon api.
 
         reference: https://github.com/RoonLabs/node-roon-api-browse/blob/master/lib.js
+
+        params:
+            timeout: optional deadline in seconds for the response
         """
-        return self._request(SERVICE_BROWSE + "/load", opts)
+        return self._request(SERVICE_BROWSE + "/load", opts, timeout=timeout)
 
     def list_media(self, zone_or_output_id, path):
         """
@@ -686,6 +763,9 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
         host,
         port,
         blocking_init=True,
+        dispatcher=None,
+        coalesce_window=0,
+        address_resolver=None,
     ):
         """
         Set up the connection with Roon.
@@ -697,9 +777,39 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
         blocking_init: By default the init will halt untill the socket is connected and the app is authenticated,
                        if you set bool to False the init will continue but you will only receive data once the connection is fully initialized.
                        The latter is preferred if you're (only) using the callbacks
+        dispatcher: optional CallbackDispatcher to run the state callbacks on instead of the socket thread.
+                    Each callback is then called per changed zone or output, in order for that zone or output.
+        coalesce_window: if set, hold back state callbacks for this many seconds and merge the ones for the same
+                         event and zone/output, so eg seek updates and volume drags result in fewer calls.
+                         Changes of a zone's play state and new zones/outputs are delivered straight away.
+        address_resolver: optional function returning the (host, port) to reconnect to after the connection is lost
+                          (eg from discovery, in case the core's ip has changed) or None to retry the same address.
         """
         self._appinfo = appinfo
         self._token = token
+        # frozen zones and outputs by id, see snapshot.py
+        self._zones = {}
+        self._outputs = {}
+        self._snapshot = Snapshot(0, MappingProxyType({}), MappingProxyType({}))
+
+        # secondary indexes for the zone_by_* and output_by_* lookups, kept up to date
+        # by _on_state_change; the *_keys dicts hold what each zone/output was indexed under
+        self._zone_id_by_name = {}
+        self._zone_id_by_output_id = {}
+        self._zone_id_by_output_name = {}
+        self._zone_index_keys = {}
+        self._output_id_by_name = {}
+        self._output_index_keys = {}
+
+        # registered state callbacks and, per event, the indexes of the callbacks
+        # to call: ({zone/output id or name: [index, ...]}, [index of unfiltered, ...])
+        self._state_callbacks = []
+        self._callback_routes = {}
+        # (callback, opt_data) of the queue subscriptions by zone or output id ("" for all), (re)subscribed on registering with the core
+        self._queue_callbacks = {}
+        self._dispatcher = dispatcher
+        self._coalescer = EventCoalescer(coalesce_window, dispatcher) if coalesce_window else None
+        self._address_resolver = address_resolver
 
         if not appinfo or not isinstance(appinfo, dict):
             raise "appinfo missing or in incorrect format!"
@@ -717,10 +827,18 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
         # fill zones and outputs dicts one time so the data is available right away
         # This might not be needed as the on change callback may have already done this
         if self.token:
-            if not self._zones:
-                self._zones = self._get_zones()
-            if not self._outputs:
-                self._outputs = self._get_outputs()
+            try:
+                if not self._zones:
+                    self._zones = self._get_zones()
+                    for zone_id in self._zones:
+                        self._index_zone(zone_id)
+                if not self._outputs:
+                    self._outputs = self._get_outputs()
+                    for output_id in self._outputs:
+                        self._index_output(output_id)
+                self._publish_snapshot()
+            except (RequestTimeoutException, ConnectionClosedException) as exc:
+                LOGGER.warning("Initial zone/output fetch failed: %s", exc)
 
         # start socket watcher
         thread_id = threading.Thread(target=self._socket_watcher)
@@ -742,6 +860,17 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
         self._exit = True
         if self._roonsocket:
             self._roonsocket.stop()
+        if self._coalescer:
+            self._coalescer.stop()
+
+    def update_server_address(self, host, port):
+        """Reconnect to the roon server at a new address, eg when its ip has changed."""
+        if (host, port) == (self._host, self._port):
+            return
+        LOGGER.info("Roon server address changed to %s:%s, reconnecting", host, port)
+        if self._roonsocket:
+            self._roonsocket.stop()
+        self._server_setup(host, port)
 
     def _server_setup(self, host, port):
         """Open the roon socket connection to the roon server on the network."""
@@ -783,6 +912,8 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
 
         self._roonsocket.subscribe(SERVICE_TRANSPORT, "zones", self._on_state_change)
         self._roonsocket.subscribe(SERVICE_TRANSPORT, "outputs", self._on_state_change)
+        for callback, opt_data in list(self._queue_callbacks.values()):
+            self._roonsocket.subscribe(SERVICE_TRANSPORT, "queue", callback, opt_data)
         # set flag that we're fully initialized (used for blocking init)
         self.ready = True
 
@@ -792,10 +923,11 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
         events = []
         if not msg or not isinstance(msg, dict):
             return
+        urgent_ids = set()  # new zones/outputs and play state changes, not to be coalesced
+        changes = {}  # id -> changed paths, None for a new zone/output
         for state_key, state_values in msg.items():
             LOGGER.debug("_on_state_change %s", state_key)
             changed_ids = []
-            filter_keys = []
             if state_key in [
                 "zones_seek_changed",
                 "zones_changed",
@@ -803,64 +935,188 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
                 "zones",
             ]:
                 for zone in state_values:
+                    zone = freeze(zone)
                     if zone["zone_id"] in self._zones:
-                        self._zones[zone["zone_id"]].update(zone)
+                        current = self._zones[zone["zone_id"]]
+                        if "state" in zone and zone["state"] != current.get("state"):
+                            urgent_ids.add(zone["zone_id"])
+                        if changes.get(zone["zone_id"], ()) is not None:
+                            paths = changed_paths(current, zone)
+                            paths.extend(changes.get(zone["zone_id"], ()))
+                            changes[zone["zone_id"]] = frozenset(paths)
+                        self._zones[zone["zone_id"]] = merge(current, zone)
                     else:
                         self._zones[zone["zone_id"]] = zone
+                        urgent_ids.add(zone["zone_id"])
+                        changes[zone["zone_id"]] = None
+                    if "display_name" in zone or "outputs" in zone:
+                        self._index_zone(zone["zone_id"])
                     changed_ids.append(zone["zone_id"])
-                    if "display_name" in zone:
-                        filter_keys.append(zone["display_name"])
-                    if "outputs" in zone:
-                        for output in zone["outputs"]:
-                            filter_keys.append(output["output_id"])
-                            filter_keys.append(output["display_name"])
                 event = (
                     "zones_seek_changed"
                     if state_key == "zones_seek_changed"
                     else "zones_changed"
                 )
-                events.append((event, changed_ids, filter_keys))
+                events.append((event, changed_ids))
             elif state_key in ["outputs_changed", "outputs_added", "outputs"]:
                 for output in state_values:
+                    output = freeze(output)
                     if output["output_id"] in self._outputs:
-                        self._outputs[output["output_id"]].update(output)
+                        current = self._outputs[output["output_id"]]
+                        if "zone_id" in output and output["zone_id"] != current.get("zone_id"):
+                            urgent_ids.add(output["output_id"])
+                        if changes.get(output["output_id"], ()) is not None:
+                            paths = changed_paths(current, output)
+                            paths.extend(changes.get(output["output_id"], ()))
+                            changes[output["output_id"]] = frozenset(paths)
+                        self._outputs[output["output_id"]] = merge(current, output)
                     else:
                         self._outputs[output["output_id"]] = output
+                        urgent_ids.add(output["output_id"])
+                        changes[output["output_id"]] = None
+                    self._index_output(output["output_id"])
                     changed_ids.append(output["output_id"])
-                    filter_keys.append(output["display_name"])
-                    filter_keys.append(output["zone_id"])
                 event = "outputs_changed"
-                events.append((event, changed_ids, filter_keys))
+                events.append((event, changed_ids))
             elif state_key == "zones_removed":
                 for item in state_values:
+                    self._unindex_zone(item)
                     del self._zones[item]
             elif state_key == "outputs_removed":
                 for item in state_values:
+                    self._unindex_output(item)
                     del self._outputs[item]
             else:
                 LOGGER.warning("unknown state change: %s" % msg)
-        for event, changed_ids, filter_keys in events:
-            filter_keys.extend(changed_ids)
-            for item in self._state_callbacks:
-                callback = item[0]
-                event_filter = item[1]
-                id_filter = item[2]
-                if event_filter and (event not in event_filter):
-                    continue
-                if id_filter and set(id_filter).isdisjoint(filter_keys):
-                    continue
-                try:
-                    callback(event, changed_ids)
-                # pylint: disable=broad-except
-                except Exception:
-                    LOGGER.exception("Error while executing callback!")
+        self._publish_snapshot()
+        for event, changed_ids in events:
+            if self._coalescer is None and self._dispatcher is None:
+                for index in self._matching_callbacks(event, changed_ids):
+                    try:
+                        self._call_state_callback(index, event, changed_ids, changes)
+                    # pylint: disable=broad-except
+                    except Exception:
+                        LOGGER.exception("Error while executing callback!")
+                continue
+            # hand over per zone/output, so each one's changes stay in order
+            for changed_id in changed_ids:
+                for index in self._matching_callbacks(event, [changed_id]):
+                    callback, _, _, with_changes = self._state_callbacks[index]
+                    args = [[changed_id]]
+                    if with_changes:
+                        args.append({changed_id: changes.get(changed_id, frozenset())})
+                    if self._coalescer is not None:
+                        self._coalescer.submit(
+                            changed_id,
+                            callback,
+                            event,
+                            *args,
+                            urgent=changed_id in urgent_ids,
+                            merge=self._merge_changes if with_changes else None,
+                        )
+                    else:
+                        self._dispatcher.submit(changed_id, callback, event, *args)
+
+    def _call_state_callback(self, index, event, changed_ids, changes):
+        """Call a state callback, with the changed paths if it asked for them."""
+        callback, _, _, with_changes = self._state_callbacks[index]
+        if with_changes:
+            callback(event, changed_ids, {item: changes.get(item, frozenset()) for item in changed_ids})
+        else:
+            callback(event, changed_ids)
+
+    @staticmethod
+    def _merge_changes(pending_args, args):
+        """Merge the changed paths of a coalesced callback into those of the newer one."""
+        event, changed_ids, changes = args
+        merged = {}
+        for item, paths in changes.items():
+            pending_paths = pending_args[2].get(item, frozenset())
+            merged[item] = None if paths is None or pending_paths is None else pending_paths | paths
+        return event, changed_ids, merged
+
+    def _matching_callbacks(self, event, changed_ids):
+        """Return the indexes of the state callbacks to call, in registration order."""
+        route = self._callback_routes.get(event)
+        if route is None:
+            return []
+        by_key, unfiltered = route
+        if not by_key:
+            return unfiltered
+        matched = set(unfiltered)
+        for key in self._filter_keys(event, changed_ids):
+            matched.update(by_key.get(key, ()))
+        return sorted(matched)
+
+    def _filter_keys(self, event, changed_ids):
+        """
+        Return the ids and names the changed zones or outputs can be filtered on.
+
+        The keys come from the merged state (via the secondary indexes), so eg a seek
+        change, which carries no names, still matches a filter on the zone name.
+        """
+        keys = list(changed_ids)
+        if event == "outputs_changed":
+            for output_id in changed_ids:
+                keys.append(self._output_index_keys.get(output_id))
+                keys.append(self._outputs.get(output_id, {}).get("zone_id"))
+        else:
+            for zone_id in changed_ids:
+                name, output_ids, output_names = self._zone_index_keys.get(zone_id, (None, (), ()))
+                keys.append(name)
+                keys.extend(output_ids)
+                keys.extend(output_names)
+        return keys
+
+    @staticmethod
+    def _unindex(index, key, item_id):
+        """Remove key from index, unless it now refers to another zone/output."""
+        if index.get(key) == item_id:
+            del index[key]
+
+    def _unindex_zone(self, zone_id):
+        """Remove a zone from the secondary indexes."""
+        name, output_ids, output_names = self._zone_index_keys.pop(zone_id, (None, (), ()))
+        self._unindex(self._zone_id_by_name, name, zone_id)
+        for output_id in output_ids:
+            self._unindex(self._zone_id_by_output_id, output_id, zone_id)
+        for output_name in output_names:
+            self._unindex(self._zone_id_by_output_name, output_name, zone_id)
+
+    def _index_zone(self, zone_id):
+        """(Re)index a zone by its name and the ids and names of its outputs."""
+        self._unindex_zone(zone_id)
+        zone = self._zones[zone_id]
+        name = zone.get("display_name")
+        outputs = zone.get("outputs", ())
+        output_ids = [output["output_id"] for output in outputs]
+        output_names = [output["display_name"] for output in outputs]
+        self._zone_index_keys[zone_id] = (name, output_ids, output_names)
+        if name is not None:
+            self._zone_id_by_name[name] = zone_id
+        for output_id in output_ids:
+            self._zone_id_by_output_id[output_id] = zone_id
+        for output_name in output_names:
+            self._zone_id_by_output_name[output_name] = zone_id
+
+    def _unindex_output(self, output_id):
+        """Remove an output from the secondary indexes."""
+        self._unindex(self._output_id_by_name, self._output_index_keys.pop(output_id, None), output_id)
+
+    def _index_output(self, output_id):
+        """(Re)index an output by its name."""
+        self._unindex_output(output_id)
+        name = self._outputs[output_id].get("display_name")
+        self._output_index_keys[output_id] = name
+        if name is not None:
+            self._output_id_by_name[name] = output_id
 
     def _get_outputs(self):
         outputs = {}
         data = self._request(SERVICE_TRANSPORT + "/get_outputs")
         if data and "outputs" in data:
             for output in data["outputs"]:
-                outputs[output["output_id"]] = output
+                outputs[output["output_id"]] = freeze(output)
         return outputs
 
     def _get_zones(self):
@@ -868,12 +1124,11 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
         data = self._request(SERVICE_TRANSPORT + "/get_zones")
         if data and "zones" in data:
             for zone in data["zones"]:
-                zones[zone["zone_id"]] = zone
+                zones[zone["zone_id"]] = freeze(zone)
         return zones
 
-    def _request(self, command, data=None):
-        """Send command and wait for result."""
-        LOGGER.debug("_request: command: %s", command)
+    def _socket_ready(self):
+        """Wait (up to 4s) for the socket to be set up, return whether it exists."""
         if not self._roonsocket:
             retries = 20
             while (not self.ready or not self._roonsocket) and retries:
@@ -882,29 +1137,84 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
             if not self.ready or not self._roonsocket:
                 LOGGER.warning("socket is not yet ready")
                 if not self._roonsocket:
-                    return None
+                    return False
+        return True
+
+    def _request(self, command, data=None, timeout=None):
+        """
+        Send command and wait for result.
+
+        The calling thread is woken as soon as the response arrives. timeout is the
+        deadline in seconds for this call, it defaults to request_timeout.
+        Raises RequestTimeoutException if the roon server does not answer in time,
+        or ConnectionClosedException if the connection closes first.
+        """
+        LOGGER.debug("_request: command: %s", command)
+        if not self._socket_ready():
+            return None
+        if timeout is None:
+            timeout = self.request_timeout
         LOGGER.debug("_request: sending")
-        request_id = self._roonsocket.send_request(command, data)
-        result = None
-        retries = 50
-        while retries:
-            result = self._roonsocket.results.get(request_id)
-            LOGGER.debug(
-                "request: command: %s, retry: %d, success: %s",
-                command,
-                retries,
-                result is not None,
-            )
-            if result:
-                break
-            retries -= 1
+        return self._roonsocket.send_and_wait(command, data, timeout)
 
-            time.sleep(0.05)
-        try:
-            del self._roonsocket.results[request_id]
-        except KeyError:
-            pass
-        return result
+    def request_many(self, requests, timeout=None):
+        """
+        Send several requests back-to-back and wait for all of their responses.
+
+        params:
+            requests: list of (command, data) tuples,
+                      eg [(SERVICE_TRANSPORT + "/mute", {"output_id": "...", "how": "mute"}), ...]
+            timeout: optional deadline in seconds for the whole batch, defaults to request_timeout
+        returns: list with the response of each request, in the order of requests
+        Raises RequestTimeoutException if not all responses arrive in time,
+        or ConnectionClosedException if the connection closes first.
+        """
+        results = [None] * len(requests)
+        for index, result in self.iter_request_many(requests, timeout):
+            results[index] = result
+        return results
+
+    def iter_request_many(self, requests, timeout=None):
+        """
+        Send several requests back-to-back and yield the responses as they arrive.
+
+        params:
+            requests: list of (command, data) tuples
+            timeout: optional deadline in seconds for the whole batch, defaults to request_timeout
+        yields: (index, response) tuples in order of arrival, index is the position in requests
+        Raises RequestTimeoutException if not all responses arrive in time,
+        or ConnectionClosedException if the connection closes first.
+        """
+        if not self._socket_ready():
+            for index in range(len(requests)):
+                yield index, None
+            return
+        if timeout is None:
+            timeout = self.request_timeout
+        completed = queue.Queue()
+        sent = self._roonsocket.send_many(requests, completed)
+        outstanding = {}
+        for index, (request_id, pending) in enumerate(sent):
+            if request_id is False:
+                yield index, None
+            else:
+                outstanding[id(pending)] = (index, request_id, pending)
+
+        deadline = time.monotonic() + timeout
+        while outstanding:
+            try:
+                pending = completed.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                for _, request_id, pending in outstanding.values():
+                    self._roonsocket.pending.pop(request_id, None)
+                _, request_id, pending = next(iter(outstanding.values()))
+                raise RequestTimeoutException(pending.command, request_id, timeout)
+            index, request_id, _ = outstanding.pop(id(pending))
+            if pending.error is not None:
+                for _, other_request_id, _ in outstanding.values():
+                    self._roonsocket.pending.pop(other_request_id, None)
+                raise pending.error
+            yield index, pending.result
 
     def _socket_watcher(self):
         """Monitor the connection state of the socket and reconnect if needed."""
@@ -915,6 +1225,12 @@ class RoonApi:  # pylint: disable=too-many-instance-attributes
                 while not self._exit and count < 21:
                     count += 1
                     time.sleep(1)
+                host, port = self._host, self._port
+                if not self._exit and self._address_resolver is not None:
+                    try:
+                        host, port = self._address_resolver() or (host, port)
+                    except Exception:  # pylint: disable=broad-except
+                        LOGGER.exception("Resolving the Roon server address failed")
                 if not self._exit:
-                    self._server_setup(self._host, self._port)
+                    self._server_setup(host, port)
             time.sleep(2)
@@ -5,11 +5,7 @@ import threading
 import websocket
 
 from .constants import LOGGER, REGISTERED, SERVICE_PING
-
-try:
-    import simplejson as json
-except ImportError:
-    import json
+from .moomsg import decode_message, encode_complete, encode_continue, encode_request
 
 try:
     import thread
@@ -17,15 +13,73 @@ except ImportError:
     import _thread as thread
 
 
+class RequestTimeoutException(Exception):
+    """Exception raised when the roon server does not answer a request in time."""
+
+    def __init__(self, command, request_id, timeout):
+        """Init with the details of the request that timed out."""
+        Exception.__init__(
+            self,
+            "No response to request %s (%s) within %ss" % (request_id, command, timeout),
+        )
+        self.command = command
+        self.request_id = request_id
+        self.timeout = timeout
+
+
+class ConnectionClosedException(Exception):
+    """Exception raised for a request whose connection to the roon server closed before its response arrived."""
+
+    def __init__(self, command, request_id):
+        """Init with the details of the request that was abandoned."""
+        Exception.__init__(
+            self,
+            "Connection closed before the response to request %s (%s)" % (request_id, command),
+        )
+        self.command = command
+        self.request_id = request_id
+
+
+class PendingRequest:  # pylint: disable=too-few-public-methods
+    """A request that has been sent and is waiting for its response."""
+
+    __slots__ = ("command", "event", "result", "error", "notify")
+
+    def __init__(self, command, notify=None):
+        """
+        Init with the command that was sent.
+
+        notify: optional queue on which the request is put once it completes,
+                so a caller can wait for several requests at once.
+        """
+        self.command = command
+        self.event = threading.Event()
+        self.result = None
+        self.error = None  # exception to raise to the caller instead of returning a result
+        self.notify = notify
+
+    def complete(self, result):
+        """Store the response and wake up the waiting caller."""
+        self.result = result
+        self.event.set()
+        if self.notify is not None:
+            self.notify.put(self)
+
+    def fail(self, error):
+        """Wake up the waiting caller with an exception instead of a response."""
+        self.error = error
+        self.complete(None)
+
+
 class RoonApiWebSocket(
     threading.Thread
 ):  # pylint: disable=too-many-instance-attributes
     """Class to handle the roon websocket connection."""
 
     @property
-    def results(self):
-        """Return the result of the previous request."""
-        return self._results
+    def pending(self):
+        """Return the requests that are waiting for a response, keyed by Request-Id."""
+        return self._pending
 
     def register_connected_callback(self, callback):
         """To be called on connection."""
@@ -67,7 +121,8 @@ class RoonApiWebSocket(
         """Create the websocket connection to the roon server."""
 
         self._socket = None
-        self._results = {}
+        self._pending = {}
+        self._requestid_lock = threading.Lock()
         self._requestid = 10  # initial request_id of 10 to prevent confusion with the requests that are sent by the server at initialization
         self._subkey = 0
         self._exit = False
@@ -104,13 +159,20 @@ class RoonApiWebSocket(
             "request_id": request_id,
             "subkey": subkey,
             "callback": callback,
+            "opt_data": opt_data,
         }
 
-    def unsubscribe(self, service, endpoint):
-        """Subscribe to events."""
+    def unsubscribe(self, service, endpoint, opt_data=None, exact=False):
+        """
+        Unsubscribe from events (only the subscription made with opt_data, if given).
+
+        With exact, only the subscription made with opt_data is ended even if opt_data is None.
+        """
         matches = []
-        for key, value in self._subscriptions.items():
+        for key, value in list(self._subscriptions.items()):
             if value["service"] == service and value["endpoint"] == endpoint:
+                if (exact or opt_data is not None) and value["opt_data"] != opt_data:
+                    continue
                 matches.append((key, value["subkey"]))
         for item in matches:
             self.send_request(
@@ -124,38 +186,23 @@ class RoonApiWebSocket(
         if not message:
             message = w_socket  # compatability fix because of change in websocket-client v0.49
         try:
-            message = message.decode("utf-8")
-            lines = message.split("\n")
-            header = lines[0]
-            body = ""
-
-            request_id = None
-            line_with_request_id = [
-                line for line in lines if line.startswith("Request-Id")
-            ]
-            if line_with_request_id:
-                request_id = int(line_with_request_id[0].split("Request-Id: ")[1])
-
-            if "Content-Type:" in message:
-                # Roon uses a blank line after the header to indicate body.
-                # See https://github.com/RoonLabs/node-roon-api/blob/master/moomsg.js#L45
-                body = "".join(message.split("\n\n")[1:])
-            elif "Logging:" not in message:
-                body = header
-            if body and "{" in body:
-                body = json.loads(body)
+            moo_message = decode_message(message)
+            request_id = moo_message.request_id
+            body = moo_message.body
             # handle message
-            if SERVICE_PING in header:
+            if SERVICE_PING in moo_message.header:
                 # reply to incoming ping from server
                 self.send_complete(request_id, "Success")
-            elif REGISTERED in header:
+            elif REGISTERED in moo_message.header:
                 self._registered_calback(body)
             elif request_id in self._subscriptions:
                 # this is callback for one of our subscriptions
                 self._subscriptions[request_id]["callback"](body)
             else:
                 # this is just a result for one of our requests
-                self._results[request_id] = body
+                pending = self._pending.pop(request_id, None)
+                if pending is not None:
+                    pending.complete(body)
         except websocket.WebSocketConnectionClosedException:
             # This can happen while closing a connection - so ignore
             pass
@@ -178,6 +225,10 @@ class RoonApiWebSocket(
         self._requestid = 10
         self._subkey = 0
         self._subscriptions = {}
+        pending, self._pending = self._pending, {}
+        # wake up the callers still waiting for a response, rather than leaving them to time out
+        for request_id, pending_request in pending.items():
+            pending_request.fail(ConnectionClosedException(pending_request.command, request_id))
 
     # pylint: disable=unused-argument
     def on_open(self, w_socket=None):
@@ -191,49 +242,82 @@ class RoonApiWebSocket(
         if not self.connected:
             LOGGER.error("Connection is not (yet) ready!")
             return
-        body = json.dumps(body)
-        msg = (
-            "MOO/1 CONTINUE Changed\nRequest-Id: %s\nContent-Length: %s\nContent-Type: application/json\n\n%s"
-            % (request_id, len(body), body)
-        )
-        msg = bytes(msg, "utf-8")
-        self._socket.send(msg, 0x2)
+        self._socket.send(encode_continue("Changed", request_id, body), 0x2)
 
     def send_complete(self, request_id, name, body=""):
         """Send complete message if socket open."""
         if not self.connected:
             LOGGER.error("Connection is not (yet) ready!")
             return
-        msg = "MOO/1 COMPLETE %s\nRequest-Id: %s" % (name, request_id)
-        if body:
-            body = json.dumps(body)
-            msg += "\nContent-Length: %s\nContent-Type: application/json\n\n%s" % (
-                len(body),
-                body,
-            )
-        else:
-            msg += "\n\n"
-        msg = bytes(msg, "utf-8")
-        self._socket.send(msg, 0x2)
+        self._socket.send(encode_complete(name, request_id, body), 0x2)
 
     def send_request(
-        self, command, body=None, content_type="application/json", header_type="REQUEST"
+        self,
+        command,
+        body=None,
+        content_type="application/json",
+        header_type="REQUEST",
+        pending=None,
     ):
-        """Send request to the roon sever."""
+        """
+        Send request to the roon sever.
+
+        If pending is given it is registered under the new Request-Id before the
+        message is written, so that on_message can complete it when the response
+        arrives.
+        """
         if not self.connected:
             LOGGER.error("Connection is not (yet) ready!")
             return False
-        request_id = self._requestid
-        self._requestid += 1
-        self._results[request_id] = None
-        if body is None:
-            msg = "MOO/1 REQUEST %s\nRequest-Id: %s\n\n" % (command, request_id)
-        else:
-            body = json.dumps(body)
-            msg = (
-                "MOO/1 REQUEST %s\nRequest-Id: %s\nContent-Length: %s\nContent-Type: %s\n\n%s"
-                % (command, request_id, len(body), content_type, body)
-            )
-        msg = bytes(msg, "utf-8")
-        self._socket.send(msg, 0x2)
+        with self._requestid_lock:
+            request_id = self._requestid
+            self._requestid += 1
+        msg = encode_request(command, request_id, body, content_type)
+        if pending is not None:
+            self._pending[request_id] = pending
+        try:
+            self._socket.send(msg, 0x2)
+        except Exception:
+            self._pending.pop(request_id, None)
+            raise
         return request_id
+
+    def send_many(self, requests, notify):
+        """
+        Write several requests back-to-back without waiting for their responses.
+
+        requests: iterable of (command, body) tuples
+        notify: queue on which each PendingRequest is put as its response arrives
+        returns: list of (request_id, PendingRequest), request_id is False if the
+                 request could not be sent
+        """
+        sent = []
+        try:
+            for command, body in requests:
+                pending = PendingRequest(command, notify)
+                sent.append((self.send_request(command, body, pending=pending), pending))
+        except Exception:
+            # Nobody waits on the batch once it has failed: drop the requests already sent with it
+            for request_id, _ in sent:
+                if request_id is not False:
+                    self._pending.pop(request_id, None)
+            raise
+        return sent
+
+    def send_and_wait(self, command, body=None, timeout=None):
+        """
+        Send request to the roon server and block until its response arrives.
+
+        Raises RequestTimeoutException if no response arrives within timeout seconds,
+        or ConnectionClosedException if the connection closes first.
+        """
+        pending = PendingRequest(command)
+        request_id = self.send_request(command, body, pending=pending)
+        if request_id is False:
+            return None
+        if not pending.event.wait(timeout):
+            self._pending.pop(request_id, None)
+            raise RequestTimeoutException(command, request_id, timeout)
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
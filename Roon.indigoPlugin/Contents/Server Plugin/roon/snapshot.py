@@ -0,0 +1,54 @@
+"""
+Immutable zone and output state.
+
+RoonApi keeps every zone and output as a frozen structure: dicts become read-only
+mappings and lists become tuples. A change never modifies a zone in place; merging
+an update builds a new top level mapping that shares all unchanged values with the
+previous one (copy-on-write). Consumers can therefore hold on to a zone, or to a
+whole Snapshot, without copying it: it will not change underneath them.
+"""
+
+from __future__ import unicode_literals
+
+from types import MappingProxyType
+
+
+def freeze(value):
+    """Return an immutable copy of a json value (dicts become read-only mappings, lists tuples)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def merge(current, update):
+    """
+    Return a frozen zone or output with the top level values of update applied.
+
+    params:
+        current: the frozen zone or output (or None if it is new)
+        update: the frozen update, as received from roon
+    returns: a new mapping; values that are not in update are shared with current
+    """
+    if current is None:
+        return update
+    merged = current.copy()
+    merged.update(update)
+    return MappingProxyType(merged)
+
+
+class Snapshot:  # pylint: disable=too-few-public-methods
+    """The state of all zones and outputs at one version."""
+
+    __slots__ = ("version", "zones", "outputs")
+
+    def __init__(self, version, zones, outputs):
+        """Init with the version and read-only mappings of the frozen zones and outputs by id."""
+        self.version = version
+        self.zones = zones
+        self.outputs = outputs
+
+    def __repr__(self):
+        """Print version and number of zones and outputs."""
+        return "<Snapshot %s: %s zones, %s outputs>" % (self.version, len(self.zones), len(self.outputs))
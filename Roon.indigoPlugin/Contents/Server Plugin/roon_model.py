@@ -0,0 +1,215 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Roon Controller © Autolog 2019-2022
+#
+
+# Compact model of the Roon Zones and Outputs (and the play queues subscribed to) known to the plugin.
+# Each Zone / Output object is created once and then updated in place from every Roon payload,
+# the lists in a payload (outputs, source controls, artist image keys, can group with output ids) are held as tuples.
+#
+# The plain fields are described declaratively as (attribute, payload path, converter, default) and each
+# description is compiled once into an extractor function. A field missing from the payload is reset to its default.
+
+_NO_DATA = dict()  # Shared, never modified: stands in for a missing part of a payload
+
+
+def _zero_if_none(value):
+    return 0 if value is None else value
+
+
+def compile_mapping(name, fields):
+    # Compile a field description into a function(obj, data) that sets the fields of obj from the payload data.
+    # Each payload path ('key' or 'key.sub_key') is read with a single dict.get, nested parts are looked up once.
+    lines = [f"def {name}(obj, data):"]
+    namespace = {"_NO_DATA": _NO_DATA}
+    parents = {"": "data"}
+    for field_number, (attribute, path, converter, default) in enumerate(fields):
+        parent, _, key = path.rpartition(".")
+        if parent not in parents:
+            grand_parent, _, parent_key = parent.rpartition(".")
+            parents[parent] = f"part_{len(parents)}"
+            lines.append(f"    {parents[parent]} = {parents[grand_parent]}.get({parent_key!r}) or _NO_DATA")
+        namespace[f"default_{field_number}"] = default
+        value = f"{parents[parent]}.get({key!r}, default_{field_number})"
+        if converter is not None:
+            namespace[f"convert_{field_number}"] = converter
+            value = f"convert_{field_number}({value})"
+        lines.append(f"    obj.{attribute} = {value}")
+    exec("\n".join(lines), namespace)  # noqa [Generated from the field description only]
+    return namespace[name]
+
+
+def _update_items(items, payload, item_class):
+    # Return a tuple of item_class objects updated from the payload list, re-using the existing objects
+    if len(items) != len(payload):
+        items = tuple(items[index] if index < len(items) else item_class() for index in range(len(payload)))
+    for item, item_data in zip(items, payload):
+        item.update(item_data)
+    return items
+
+
+# Field descriptions: (attribute, payload path, converter or None, default)
+
+SOURCE_CONTROL_FIELDS = (
+    ("status", "status", None, ""),
+    ("display_name", "display_name", None, ""),
+    ("control_key", "control_key", None, ""),
+    ("supports_standby", "supports_standby", bool, False),
+)
+
+VOLUME_FIELDS = (
+    ("hard_limit_min", "hard_limit_min", None, 0),
+    ("min", "min", None, 0),
+    ("is_muted", "is_muted", None, False),
+    ("max", "max", None, 0),
+    ("value", "value", None, 0),
+    ("step", "step", None, 0),
+    ("hard_limit_max", "hard_limit_max", None, 0),
+    ("soft_limit", "soft_limit", None, 0),
+    ("type", "type", None, "number"),
+)
+
+OUTPUT_FIELDS = (
+    ("output_id", "output_id", None, ""),
+    ("display_name", "display_name", None, ""),
+    ("zone_id", "zone_id", None, ""),
+    ("can_group_with_output_ids", "can_group_with_output_ids", tuple, ()),
+)
+
+NOW_PLAYING_FIELDS = (
+    ("artist_image_keys", "artist_image_keys", tuple, ()),
+    ("image_key", "image_key", None, ""),
+    ("one_line_1", "one_line.line1", None, ""),
+    ("two_line_1", "two_line.line1", None, ""),
+    ("two_line_2", "two_line.line2", None, ""),
+    ("three_line_1", "three_line.line1", None, ""),
+    ("three_line_2", "three_line.line2", None, ""),
+    ("three_line_3", "three_line.line3", None, ""),
+    ("length", "length", None, 0),
+    ("seek_position", "seek_position", _zero_if_none, 0),
+)
+
+QUEUE_ITEM_FIELDS = (
+    ("queue_item_id", "queue_item_id", None, 0),
+    ("image_key", "image_key", None, ""),
+    ("length", "length", None, 0),
+    ("one_line_1", "one_line.line1", None, ""),
+)
+
+ZONE_FIELDS = (
+    ("zone_id", "zone_id", None, ""),
+    ("display_name", "display_name", None, ""),
+    ("queue_items_remaining", "queue_items_remaining", None, 0),
+    ("queue_time_remaining", "queue_time_remaining", None, 0),
+    ("auto_radio", "settings.auto_radio", bool, False),
+    ("shuffle", "settings.shuffle", bool, False),
+    ("loop", "settings.loop", None, "disabled"),
+    ("is_previous_allowed", "is_previous_allowed", bool, False),
+    ("is_pause_allowed", "is_pause_allowed", bool, False),
+    ("is_seek_allowed", "is_seek_allowed", bool, False),
+    ("state", "state", None, "stopped"),
+    ("is_play_allowed", "is_play_allowed", bool, False),
+    ("is_next_allowed", "is_next_allowed", bool, False),
+)
+
+
+class SourceControl:
+    __slots__ = tuple(field[0] for field in SOURCE_CONTROL_FIELDS)
+
+    update = compile_mapping("update", SOURCE_CONTROL_FIELDS)
+
+    def __init__(self):
+        self.update(_NO_DATA)
+
+
+class Volume:
+    __slots__ = tuple(field[0] for field in VOLUME_FIELDS)
+
+    update = compile_mapping("update", VOLUME_FIELDS)
+
+    def __init__(self):
+        self.update(_NO_DATA)
+
+
+class Output:
+    __slots__ = tuple(field[0] for field in OUTPUT_FIELDS) + ("source_controls", "volume")
+
+    _update_fields = compile_mapping("_update_fields", OUTPUT_FIELDS)
+
+    def __init__(self):
+        self.source_controls = ()
+        self.volume = None  # None if the Output has no volume control
+        self.update(_NO_DATA)
+
+    def update(self, data):
+        self._update_fields(data)
+        self.source_controls = _update_items(self.source_controls, data.get("source_controls", ()), SourceControl)
+        volume = data.get("volume")
+        if volume is None:
+            self.volume = None
+        else:
+            if self.volume is None:
+                self.volume = Volume()
+            self.volume.update(volume)
+
+
+class NowPlaying:
+    __slots__ = tuple(field[0] for field in NOW_PLAYING_FIELDS)
+
+    update = compile_mapping("update", NOW_PLAYING_FIELDS)
+
+    def __init__(self):
+        self.update(_NO_DATA)
+
+
+class Zone:
+    __slots__ = tuple(field[0] for field in ZONE_FIELDS) + ("outputs", "unique_identity_key", "now_playing", "seek_position", "remaining")
+
+    _update_fields = compile_mapping("_update_fields", ZONE_FIELDS)
+
+    def __init__(self):
+        self.outputs = ()
+        self.now_playing = NowPlaying()
+        self.seek_position = 0  # Seek position and remaining time are maintained from the 'zones_seek_changed' events
+        self.remaining = 0
+        self.update(_NO_DATA)
+
+    def update(self, data):
+        self._update_fields(data)
+        self.outputs = _update_items(self.outputs, data.get("outputs", ()), Output)
+        # The Zone Unique Identity Key is the sorted list of the Zone's Output Ids, separated by '#'
+        self.unique_identity_key = "#".join(sorted(output.output_id for output in self.outputs))
+        self.now_playing.update(data.get("now_playing", _NO_DATA))
+
+
+class QueueItem:
+    __slots__ = tuple(field[0] for field in QUEUE_ITEM_FIELDS)
+
+    update = compile_mapping("update", QUEUE_ITEM_FIELDS)
+
+    def __init__(self, data=_NO_DATA):
+        self.update(data)
+
+
+class ZoneQueue:
+    # Play queue of a Zone, the first item is the one now playing. Only the first max_items items are held
+    __slots__ = ("items", "max_items")
+
+    def __init__(self, max_items):
+        self.items = ()
+        self.max_items = max_items
+
+    def update(self, data):
+        # Apply a queue subscription payload: the complete queue ('items') or a list of insert / remove operations ('changes')
+        items = list(self.items)
+        if "items" in data:
+            items = [QueueItem(item_data) for item_data in data["items"][:self.max_items]]
+        for change in data.get("changes", ()):
+            index = change.get("index", 0)
+            if change.get("operation") == "remove":
+                del items[index:index + change.get("count", 0)]
+            elif change.get("operation") == "insert" and index < self.max_items:
+                items[index:index] = [QueueItem(item_data) for item_data in change.get("items", ())[:self.max_items - index]]
+            del items[self.max_items:]
+        self.items = tuple(items)
@@ -0,0 +1,108 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Roon Controller © Autolog 2019-2022
+#
+
+# Local shadow copy of the states last pushed to (or read from) the Indigo server, per device.
+# Reading dev.states[...] goes to the Indigo server object (and dev.states is rebuilt per access), so the device
+# updates are diffed against the shadow instead and only the states that differ are sent with updateStatesOnServer.
+#
+# When deferred, the changed states (and state image) are accumulated per device and only sent when flush() is called,
+# which the plugin does on a short tick from its concurrent thread: a burst of Roon events for a device becomes a single
+# updateStatesOnServer call. Changes to the keys listed in flush_on (e.g. the play state) are flushed straight away.
+
+import threading
+
+_MISSING = object()
+
+
+def diff_states(shadow, states):
+    # Return the minimal updateStatesOnServer key / value list to move the shadow to states, and apply it to the shadow
+    key_value_list = [{'key': key, 'value': value} for key, value in states.items() if shadow.get(key, _MISSING) != value]
+    for key_value in key_value_list:
+        shadow[key_value['key']] = key_value['value']
+    return key_value_list
+
+
+class ShadowStates:
+    def __init__(self, deferred=False):
+        self.deferred = deferred  # False: every update is pushed immediately
+        self._states = dict()  # Indigo device id -> {state key: value}
+        self._state_images = dict()  # Indigo device id -> state image last pushed
+        self._pending = dict()  # Indigo device id -> [dev, {state key: value}, state image or None] not yet pushed
+        self._lock = threading.Lock()  # Guards the dictionaries above
+        self._flush_lock = threading.Lock()  # Serialises flushes so that pushes for a device are never reordered
+
+    def resync(self, dev):
+        # (Re)load the shadow of a device from its Indigo states when the device is started (its states may have changed while stopped)
+        with self._lock:
+            shadow = dict(dev.states)
+            pending = self._pending.get(dev.id)
+            if pending is not None:
+                shadow.update(pending[1])  # Still to be pushed
+            self._states[dev.id] = shadow
+            self._state_images.pop(dev.id, None)
+
+    def adopt_external(self, dev):
+        # Take the states of a device that the shadow doesn't hold (and that aren't waiting to be pushed) from its Indigo states.
+        # The states the shadow does hold are left alone: a deviceUpdated notification may be a late echo of an earlier push of
+        # the plugin's own, and reloading from it would make a later push of that same value look unchanged
+        with self._lock:
+            shadow = self._states.get(dev.id)
+            if shadow is None:
+                return  # Loaded in full on the device's next update
+            pending = self._pending.get(dev.id)
+            for key, value in dev.states.items():
+                if key not in shadow and (pending is None or key not in pending[1]):
+                    shadow[key] = value
+
+    def forget(self, dev_id):
+        with self._lock:
+            self._states.pop(dev_id, None)
+            self._state_images.pop(dev_id, None)
+            self._pending.pop(dev_id, None)
+
+    def update(self, dev, states, state_image=None, flush_on=()):
+        # Queue (or push, if not deferred) the states that differ from the shadow and the state image if it has changed.
+        # Returns the key / value list of the states that changed
+        with self._lock:
+            shadow = self._states.get(dev.id)
+            if shadow is None:
+                shadow = dict(dev.states)
+                self._states[dev.id] = shadow
+            key_value_list = diff_states(shadow, states)
+            if state_image is not None and self._state_images.get(dev.id) == state_image:
+                state_image = None
+            if len(key_value_list) > 0 or state_image is not None:
+                pending = self._pending.setdefault(dev.id, [dev, dict(), None])
+                pending[0] = dev
+                for key_value in key_value_list:
+                    pending[1][key_value['key']] = key_value['value']
+                if state_image is not None:
+                    pending[2] = state_image
+                    self._state_images[dev.id] = state_image
+
+        if not self.deferred or any(key_value['key'] in flush_on for key_value in key_value_list):
+            self.flush()
+        return key_value_list
+
+    def flush(self):
+        # Push everything pending: one updateStatesOnServer call (and at most one state image update) per device
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, dict()
+
+            first_exception = None
+            for dev_id, (dev, states, state_image) in pending.items():
+                try:
+                    if len(states) > 0:
+                        dev.updateStatesOnServer([{'key': key, 'value': value} for key, value in states.items()])
+                    if state_image is not None:
+                        dev.updateStateImageOnServer(state_image)
+                except Exception as exception_error:
+                    self.forget(dev_id)  # The shadow can no longer be trusted: resync from the server on the next update
+                    if first_exception is None:
+                        first_exception = exception_error
+            if first_exception is not None:
+                raise first_exception
@@ -0,0 +1,66 @@
+"""
+Benchmark of the json backends of roon.codec on zone and browse payloads.
+
+For each installed backend, loads() and dumps() are timed on a zones_changed message of
+all the recorded zones and on the recorded browse_load result, and reported as MB/s of
+json. The first row is the transport before roon.codec (as of cc56d4a): simplejson (or
+json) on a str, with the utf-8 encoding / decoding that went with it.
+
+    python benchmarks/bench_codec.py [--payloads FILE] [--repeat N]
+"""
+
+import importlib
+
+import common
+
+from roon import codec
+
+
+def before_codec():
+    """Return loads and dumps as the transport used them before roon.codec."""
+    try:
+        module = importlib.import_module("simplejson")
+    except ImportError:
+        module = importlib.import_module("json")
+
+    def loads(data):
+        return module.loads(data.decode("utf-8"))
+
+    def dumps(obj):
+        return module.dumps(obj).encode("utf-8")
+
+    return f"before ({module.__name__})", loads, dumps
+
+
+def main():
+    args = common.arguments(__doc__.splitlines()[1])
+    payloads = common.load_payloads(args.payloads)
+    documents = {
+        "zones": {"zones_changed": payloads["zones"]},
+        "browse": payloads["browse_load"],
+    }
+
+    candidates = [before_codec()]
+    for backend in codec.available():
+        codec.select(backend)
+        candidates.append((backend, codec.loads, codec.dumps))
+
+    rows = []
+    for label, loads, dumps in candidates:
+        row = [label]
+        for document in documents.values():
+            data = codec.dumps(document)
+            megabytes = len(data) / 1e6
+            number = max(5, 2000000 // len(data))
+            assert loads(data) == document
+            row.append("%.0f / %.0f" % (megabytes / common.best_of(lambda: loads(data), args.repeat, number),
+                                        megabytes / common.best_of(lambda: dumps(document), args.repeat, number)))
+        rows.append(row)
+
+    sizes = ", ".join(f"{name} {len(codec.dumps(document)) / 1024:.0f} KB" for name, document in documents.items())
+    common.table(f"json throughput in MB/s, loads / dumps (best of {args.repeat}; {sizes})",
+                 ["backend"] + list(documents), rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark of the zone image path in images per second: before (b628e46) and after the image cache changes.
+
+Each version turns the image bytes delivered by the Roon Core into the zone's Album_Image.png:
+- before: written to the shared temp.jpg, opened from there, saved as PNG, temp.jpg removed,
+- after, PNG: decoded from memory and rendered for the standard profile into the image cache,
+  then linked into the zone folder,
+- after, JPEG kept ('Keep JPEG Images'): stored in the image cache as delivered, then linked.
+Every image has a new key, so nothing is served from the cache, except for the last row: the
+same image shown again (on another zone, or on a return to the track), linked from the cache.
+The image is a synthetic photo-like 500x500 JPEG unless a real cover is given with --image.
+
+    python benchmarks/bench_images.py [--repeat N] [--count N] [--image FILE]
+"""
+
+import io
+import os
+import tempfile
+
+import common
+
+from PIL import Image, ImageFilter
+
+from image_cache import ImageCache
+from image_profiles import STANDARD_JPEG_PROFILE, STANDARD_PNG_PROFILE
+
+
+def sample_jpeg():
+    """Return the bytes of a photo-like 500x500 cover: blurred noise over a gradient, as a quality 85 JPEG."""
+    noise = Image.effect_noise((500, 500), 60).convert("RGB").filter(ImageFilter.GaussianBlur(2))
+    gradient = Image.linear_gradient("L").resize((500, 500)).convert("RGB")
+    buffer = io.BytesIO()
+    Image.blend(noise, gradient, 0.5).save(buffer, format="JPEG", quality=85)
+    return buffer.getvalue()
+
+
+def main():
+    args = common.arguments(__doc__.splitlines()[1], count=30, image="")
+    if args.image:
+        with open(args.image, "rb") as image_file:
+            content = image_file.read()
+    else:
+        content = sample_jpeg()
+    folder = tempfile.mkdtemp(prefix="roon-bench-")
+    zone_folder = os.path.join(folder, "ZONE-A")
+    os.makedirs(zone_folder)
+    output_image_file = os.path.join(zone_folder, "Album_Image.png")
+    image_cache = ImageCache(os.path.join(folder, "image_cache"), 1024 * 1024 * 1024)
+    image_keys = iter(range(1000000))
+
+    def before():
+        work_file = os.path.join(zone_folder, "temp.jpg")
+        with open(work_file, "wb") as f:
+            f.write(content)
+        image_to_process = Image.open(work_file)
+        image_to_process.save(output_image_file)
+        os.remove(work_file)
+
+    def after(profile):
+        def write_image(path):
+            if profile.accepts(content):
+                with open(path, "wb") as image_file:
+                    image_file.write(content)
+            else:
+                image = Image.open(io.BytesIO(content))
+                image.load()
+                profile.render(image, path)
+
+        cached_image_file = image_cache.add(f"key{next(image_keys)}", profile.scale, profile.width, profile.height,
+                                            profile.cache_format, write_image)
+        image_cache.link(cached_image_file, output_image_file)
+
+    def cached():
+        cached_image_file = image_cache.get("key0", STANDARD_PNG_PROFILE.scale, STANDARD_PNG_PROFILE.width,
+                                            STANDARD_PNG_PROFILE.height, STANDARD_PNG_PROFILE.cache_format)
+        image_cache.link(cached_image_file, output_image_file)
+
+    versions = [
+        ("before (temp.jpg, PNG save)", before),
+        ("after (from memory, PNG to cache, link)", lambda: after(STANDARD_PNG_PROFILE)),
+        ("after (JPEG kept, to cache, link)", lambda: after(STANDARD_JPEG_PROFILE)),
+        ("after (PNG already cached, link)", cached),
+    ]
+    rows = []
+    for label, process in versions:
+        elapsed = common.best_of(process, args.repeat, args.count)
+        rows.append([label, "%.1f" % (1 / elapsed), "%.2f ms" % (elapsed * 1e3), os.path.getsize(output_image_file)])
+    common.table(f"{len(content)} byte JPEG to Album_Image.png (best of {args.repeat} runs of {args.count} images)",
+                 ["", "images/s", "per image", "file bytes"], rows)
+
+
+if __name__ == "__main__":
+    main()
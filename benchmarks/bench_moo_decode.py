@@ -0,0 +1,58 @@
+"""
+Benchmark of roon.moomsg.decode_message: the str based parser (as of cc56d4a) against the byte level one.
+
+Frames are built from the recorded zones: a zones_seek_changed for one and for all the playing zones and
+zones_changed frames of 1, 10, 30 and 50 zones (the recorded zones are repeated, with new
+ids, up to 50). Each parser is run with the same json decoder, for every installed backend.
+
+    python benchmarks/bench_moo_decode.py [--payloads FILE] [--repeat N] [--rev REV]
+"""
+
+import importlib
+
+import common
+
+from roon import codec
+from roon import moomsg
+
+
+def frame(name, request_id, body):
+    body = codec.dumps(body)
+    return b"MOO/1 CONTINUE %s\nRequest-Id: %d\nContent-Length: %d\nContent-Type: application/json\n\n%s" % (
+        name.encode("utf-8"), request_id, len(body), body)
+
+
+def zones_frames(zones):
+    playing = [zone for zone in zones if zone["state"] == "playing"]
+    seek = [{"zone_id": zone["zone_id"], "queue_time_remaining": zone["queue_time_remaining"],
+             "seek_position": zone["now_playing"]["seek_position"]} for zone in playing]
+    frames = [("seek 1 zone", frame("Changed", 12, {"zones_seek_changed": seek[:1]})),
+              (f"seek {len(seek)} zones", frame("Changed", 12, {"zones_seek_changed": seek}))]
+    for count in (1, 10, 30, 50):
+        frames.append((f"{count} zones", frame("Changed", 12, {"zones_changed": common.numbered_zones(zones, count)})))
+    return frames
+
+
+def main():
+    args = common.arguments(__doc__.splitlines()[1], rev="cc56d4a")
+    zones = common.load_payloads(args.payloads)["zones"]
+    old = common.load_module_at(args.rev, f"{common.PLUGIN_PATH}/roon/moomsg.py", "moomsg_old")
+    frames = zones_frames(zones)
+
+    for backend in codec.available():
+        codec.select(backend)
+        old.json = importlib.import_module(backend)  # the old parser calls json.loads on the decoded body
+        rows = []
+        for label, message in frames:
+            assert old.decode_message(message).body == moomsg.decode_message(message).body
+            number = max(10, 2000000 // len(message))
+            old_time = common.best_of(lambda: old.decode_message(message), args.repeat, number)
+            new_time = common.best_of(lambda: moomsg.decode_message(message), args.repeat, number)
+            rows.append([label, len(message), "%.1f us" % (old_time * 1e6), "%.1f us" % (new_time * 1e6),
+                         "%.2fx" % (old_time / new_time)])
+        common.table(f"decode_message with {backend} (best of {args.repeat}, per message)",
+                     ["frame", "bytes", "old", "new", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark of the routing of state callbacks: testing every callback (fd9624e^) against the routing table (fd9624e).
+
+100 zones (the recorded zones repeated, with new ids and names) are loaded into an unconnected
+RoonApi and 50 callbacks are registered: every fifth filtered on a zone id, the others on a
+zone name, every other one limited to zones_changed. The time of _on_state_change is
+reported per message, with the number of callbacks called. Both versions are loaded from
+git, so only the routing differs; pass --new-rev "" to time the current code instead
+(which also freezes and diffs each zone, see snapshot.py).
+
+    python benchmarks/bench_state_routing.py [--payloads FILE] [--repeat N] [--rev REV] [--new-rev REV]
+"""
+
+import copy
+
+import common
+
+import roon
+
+
+def register_callbacks(api, zones, called):
+    def callback(event, changed_ids, *args):
+        called.append(event)
+
+    for index in range(50):
+        zone = zones[index * 2]
+        api.register_state_callback(callback, "zones_changed" if index % 2 else None,
+                                    zone["zone_id"] if index % 5 == 0 else zone["display_name"])
+
+
+def main():
+    args = common.arguments(__doc__.splitlines()[1], rev="fd9624e^", new_rev="fd9624e")
+    zones = common.numbered_zones(common.load_payloads(args.payloads)["zones"], 100)
+    playing = next(zone for zone in zones[4::8] if zone["state"] == "playing")  # filtered on its name for all events
+    messages = [
+        ("zones_changed, 100 zones", {"zones_changed": zones}),
+        ("zones_changed, 1 zone", {"zones_changed": [playing]}),
+        ("zones_seek_changed, 1 zone", {"zones_seek_changed": [{
+            "zone_id": playing["zone_id"], "queue_time_remaining": playing["queue_time_remaining"],
+            "seek_position": playing["now_playing"]["seek_position"]}]}),
+    ]
+    versions = [common.load_roon_package_at(args.rev, "roon_old"),
+                common.load_roon_package_at(args.new_rev, "roon_new") if args.new_rev else roon]
+
+    rows = []
+    for label, message in messages:
+        row = [label]
+        for package in versions:
+            api = common.offline_api(package)
+            api._on_state_change({"zones": copy.deepcopy(zones)})  # pylint: disable=protected-access
+            called = []
+            register_callbacks(api, zones, called)
+            api._on_state_change(copy.deepcopy(message))  # pylint: disable=protected-access
+            count = len(called)
+            number = max(10, 3000 // len(next(iter(message.values()))))
+            elapsed = common.best_of(lambda: api._on_state_change(message), args.repeat, number)  # pylint: disable=protected-access
+            row += ["%.1f us" % (elapsed * 1e6), count]
+            api.stop()
+        rows.append(row)
+    common.table(f"_on_state_change with 50 callbacks and 100 zones (best of {args.repeat}, per message)",
+                 ["message", "old", "called", "new", "called"], rows)
+
+
+if __name__ == "__main__":
+    main()
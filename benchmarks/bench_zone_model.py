@@ -0,0 +1,87 @@
+"""
+Benchmark of the zone / output extractors: process_zone's if/elif loops against the model classes.
+
+Three versions update the plugin's view of a zone and of an output from the recorded
+(frozen) zone payloads:
+- the if/elif loops of process_zone / process_output into a tree of dicts (e519665^), run
+  as they were, cut out of the plugin with the constants of that commit,
+- the hand written update methods of the __slots__ model classes (roon_model.py at e519665),
+- the extractors compiled from the field descriptions by compile_mapping (current roon_model.py).
+
+    python benchmarks/bench_zone_model.py [--payloads FILE] [--repeat N] [--rev REV] [--hand-rev REV]
+"""
+
+import textwrap
+
+import common
+
+import roon_model
+from roon.snapshot import freeze
+
+
+def plugin_loops(rev):
+    """Return (zone, output) functions running the loops of process_zone / process_output as of rev."""
+    source = common.git_source(rev, f"{common.PLUGIN_PATH}/plugin.py").decode("utf-8")
+    constants = common.load_module_at(rev, f"{common.PLUGIN_PATH}/constants.py", "constants_old")
+    namespace = dict(vars(constants))
+
+    def cut(method, first_line, end_line):
+        start = source.index(first_line, source.index(f"    def {method}("))
+        end = source.index(end_line, start)
+        return textwrap.indent(textwrap.dedent(source[start:end]), "    ")
+
+    exec("def zone_loops(self, zone_id, zoneData):\n" + cut(  # noqa
+        "process_zone", "            self.globals[ROON][ZONES][zone_id] = dict()\n", "            # ### SPECIAL ANNOUCEMENT CODE - START"), namespace)
+    exec("def output_loops(self, output_id, outputData):\n" + cut(  # noqa
+        "process_output", "            self.globals[ROON][OUTPUTS][output_id] = dict()\n",
+        "            if output_id not in self.globals[ROON][OUTPUT_ID_TO_DEV_ID]:"), namespace)
+
+    class Plugin:  # pylint: disable=too-few-public-methods
+        globals = {constants.ROON: {constants.ZONES: {}, constants.OUTPUTS: {}}}
+
+        @staticmethod
+        def convert_output_id_list_to_string(output_ids):
+            return "#".join(output_ids)
+
+    plugin = Plugin()
+    return (lambda zone: namespace["zone_loops"](plugin, zone["zone_id"], zone),
+            lambda output: namespace["output_loops"](plugin, output["output_id"], output))
+
+
+def model_updates(model, zones, outputs):
+    """Return (zone, output) functions updating the model object of each zone / output."""
+    zone_objects = {zone["zone_id"]: model.Zone() for zone in zones}
+    output_objects = {output["output_id"]: model.Output() for output in outputs}
+    return (lambda zone: zone_objects[zone["zone_id"]].update(zone),
+            lambda output: output_objects[output["output_id"]].update(output))
+
+
+def main():
+    args = common.arguments(__doc__.splitlines()[1], rev="e519665^", hand_rev="e519665")
+    zones = [freeze(zone) for zone in common.load_payloads(args.payloads)["zones"]]
+    outputs = [output for zone in zones for output in zone["outputs"]]
+    hand_model = common.load_module_at(args.hand_rev, f"{common.PLUGIN_PATH}/roon_model.py", "roon_model_hand")
+    versions = [
+        ("if/elif loops (before the model)", plugin_loops(args.rev)),
+        ("hand written update", model_updates(hand_model, zones, outputs)),
+        ("compiled field mapping", model_updates(roon_model, zones, outputs)),
+    ]
+
+    rows = []
+    for label, (update_zone, update_output) in versions:
+        def all_zones():
+            for zone in zones:
+                update_zone(zone)
+
+        def all_outputs():
+            for output in outputs:
+                update_output(output)
+
+        rows.append([label, "%.2f us" % (common.best_of(all_zones, args.repeat, 200) / len(zones) * 1e6),
+                     "%.2f us" % (common.best_of(all_outputs, args.repeat, 200) / len(outputs) * 1e6)])
+    common.table(f"update from {len(zones)} zone / {len(outputs)} output payloads (best of {args.repeat}, per payload)",
+                 ["", "zone", "output"], rows)
+
+
+if __name__ == "__main__":
+    main()
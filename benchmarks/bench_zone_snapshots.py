@@ -0,0 +1,74 @@
+"""
+Benchmark of a zone replay: deep copies per callback (b380ae9^) against frozen copy-on-write snapshots (b380ae9).
+
+The zone messages (recorded, or for the sample a ten minute session of seek updates and
+track changes of its 30 zones) are replayed into an unconnected RoonApi, with a state
+callback reading each changed zone as the plugin does: a deep copy before the snapshots,
+the frozen zone itself after. Every zone read is held on to, as the events waiting on a
+busy dispatcher are, and the memory then in use is measured with tracemalloc, as is the
+largest amount allocated while processing one message. The time is measured without
+tracemalloc. Pass --new-rev "" to replay into the current code.
+
+    python benchmarks/bench_zone_snapshots.py [--payloads FILE] [--repeat N] [--rev REV] [--new-rev REV]
+"""
+
+import copy
+import tracemalloc
+
+import common
+
+import roon
+
+
+def replay(package, zones, messages, consume, trace=False):
+    """Replay the messages, return (bytes in use after, most bytes allocated for one message)."""
+    api = common.offline_api(package)
+    api._on_state_change({"zones": copy.deepcopy(zones)})  # pylint: disable=protected-access
+    held = []
+
+    def callback(event, changed_ids, *args):
+        for zone_id in changed_ids:
+            held.append(consume(api.zone_by_zone_id(zone_id)))
+
+    api.register_state_callback(callback)
+    in_use = peak = 0
+    if trace:
+        tracemalloc.start()
+    for message in messages:
+        if trace:
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        api._on_state_change(message)  # pylint: disable=protected-access
+        if trace:
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+    if trace:
+        in_use = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    api.stop()
+    return in_use, peak
+
+
+def main():
+    args = common.arguments(__doc__.splitlines()[1], rev="b380ae9^", new_rev="b380ae9")
+    payloads = common.load_payloads(args.payloads)
+    zones = payloads["zones"]
+    messages = common.replay_messages(payloads)
+    events = sum(len(values) for message in messages for values in message.values())
+    versions = [
+        ("deepcopy per event", common.load_roon_package_at(args.rev, "roon_old"), copy.deepcopy),
+        ("frozen snapshots", common.load_roon_package_at(args.new_rev, "roon_new") if args.new_rev else roon,
+         lambda zone: zone),
+    ]
+
+    rows = []
+    for label, package, consume in versions:
+        replays = iter([copy.deepcopy(messages) for _ in range(args.repeat)])  # copied up front, out of the timing
+        elapsed = common.best_of(lambda: replay(package, zones, next(replays), consume), args.repeat)
+        in_use, peak = replay(package, zones, copy.deepcopy(messages), consume, trace=True)
+        rows.append([label, "%.3f s" % elapsed, "%.1f MB" % (in_use / 1e6), "%.0f KB" % (peak / 1e3)])
+    common.table(f"replay of {len(zones)} zones: {len(messages)} messages, {events} zone events (best of {args.repeat})",
+                 ["consumer", "time", "in use after", "peak per message"], rows)
+
+
+if __name__ == "__main__":
+    main()
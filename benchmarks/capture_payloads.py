@@ -0,0 +1,81 @@
+"""
+Record zone / output / browse payloads from a Roon Core, for the benchmark scripts.
+
+Connects as the plugin's extension, records every zone and output subscription message
+for a while and then the zones, the outputs and a browse_load of the top browse list.
+The token of an authorised extension is read from / saved to --token-file (authorise the
+extension in Roon > Settings > Extensions on the first run).
+
+    python benchmarks/capture_payloads.py HOST [--port 9330] [--seconds 600] [--out FILE]
+"""
+
+import argparse
+import json
+import os
+import time
+
+import common  # noqa: F401 (puts the plugin on sys.path)
+
+from roon import RoonApi
+
+APP_INFO = {
+    "extension_id": "indigo_plugin_roon_payload_capture",
+    "display_name": "Indigo Plugin for Roon (payload capture)",
+    "display_version": "1.0",
+    "publisher": "autolog",
+    "email": "my@email.com",
+}
+
+
+class RecordingRoonApi(RoonApi):
+    """RoonApi that keeps a copy of every zone / output message received."""
+
+    messages = None
+
+    def _on_state_change(self, msg):
+        if self.messages is not None and isinstance(msg, dict):
+            self.messages.append(msg)
+        super()._on_state_change(msg)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("host")
+    parser.add_argument("--port", type=int, default=9330)
+    parser.add_argument("--seconds", type=int, default=600, help="how long to record messages for")
+    parser.add_argument("--token-file", default=os.path.expanduser("~/.roon-bench-token"))
+    parser.add_argument("--out", default=os.path.join(os.path.dirname(common.DEFAULT_PAYLOADS), "captured.json"))
+    args = parser.parse_args()
+
+    token = None
+    if os.path.isfile(args.token_file):
+        with open(args.token_file, encoding="utf-8") as token_file:
+            token = token_file.read().strip()
+
+    api = RecordingRoonApi(APP_INFO, token, args.host, args.port)
+    try:
+        with open(args.token_file, "w", encoding="utf-8") as token_file:
+            token_file.write(api.token)
+        api.messages = []
+        time.sleep(args.seconds)
+        messages = api.messages
+        api.messages = None
+
+        api.browse_browse({"hierarchy": "browse", "pop_all": True})
+        browse_load = api.browse_load({"hierarchy": "browse", "offset": 0, "count": 100})
+        payloads = {
+            "zones": list(api.zones.values()),
+            "outputs": list(api.outputs.values()),
+            "messages": messages,
+            "browse_load": browse_load,
+        }
+    finally:
+        api.stop()
+
+    with open(args.out, "w", encoding="utf-8") as out:
+        json.dump(payloads, out, indent=1, default=dict)  # zones and outputs are read-only mappings
+    print(f"{len(payloads['zones'])} zones, {len(messages)} messages recorded to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
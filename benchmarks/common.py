@@ -0,0 +1,156 @@
+"""
+Shared helpers of the benchmark scripts.
+
+The scripts compare the current code with the code as it was at an earlier commit, which is
+loaded straight from git (so the comparison can be re-run at any time), on the zone / output /
+browse payloads recorded by capture_payloads.py. payloads/sample.json is used by default.
+"""
+
+import argparse
+import copy
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PLUGIN_DIR = os.path.join(REPO_DIR, "Roon.indigoPlugin", "Contents", "Server Plugin")
+PLUGIN_PATH = "Roon.indigoPlugin/Contents/Server Plugin"
+DEFAULT_PAYLOADS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "payloads", "sample.json")
+
+sys.path.insert(0, PLUGIN_DIR)
+
+
+def arguments(description, **extra):
+    """Parse the common command line: --payloads FILE and --repeat N (plus extra --name default pairs)."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--payloads", default=DEFAULT_PAYLOADS, help="payloads recorded by capture_payloads.py")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement, the best is reported")
+    for name, default in extra.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(default), default=default)
+    return parser.parse_args()
+
+
+def load_payloads(path):
+    with open(path, encoding="utf-8") as payloads_file:
+        return json.load(payloads_file)
+
+
+def git_source(rev, path):
+    """Return the source of a file of the repository at a commit."""
+    return subprocess.run(["git", "-C", REPO_DIR, "show", f"{rev}:{path}"],
+                          check=True, capture_output=True).stdout
+
+
+def load_module_at(rev, path, name):
+    """Import a stand-alone module of the repository as it was at a commit, as module name."""
+    source = git_source(rev, path)
+    module_file = os.path.join(tempfile.mkdtemp(prefix="roon-bench-"), f"{name}.py")
+    with open(module_file, "wb") as out:
+        out.write(source)
+    spec = importlib.util.spec_from_file_location(name, module_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_roon_package_at(rev, name):
+    """Import the roon package as it was at a commit, as package name (its imports are relative)."""
+    listing = subprocess.run(["git", "-C", REPO_DIR, "ls-tree", "-z", "--name-only", rev, f"{PLUGIN_PATH}/roon/"],
+                             check=True, capture_output=True, text=True).stdout.split("\0")[:-1]
+    package_dir = os.path.join(tempfile.mkdtemp(prefix="roon-bench-"), name)
+    os.makedirs(package_dir)
+    for path in listing:
+        with open(os.path.join(package_dir, os.path.basename(path)), "wb") as out:
+            out.write(git_source(rev, path))
+    sys.path.insert(0, os.path.dirname(package_dir))
+    return importlib.import_module(name)
+
+
+def offline_api(roon):
+    """Return a RoonApi of the roon package given that never connects, to feed messages to _on_state_change."""
+
+    class OfflineRoonApi(roon.RoonApi):
+        def _server_setup(self, host, port):
+            self._host = host
+            self._port = port
+            self._roonsocket = None
+            self._exit = True  # the socket watcher has nothing to watch
+
+    return OfflineRoonApi({"extension_id": "benchmark"}, None, "localhost", 9330, blocking_init=False)
+
+
+def numbered_zones(zones, count):
+    """Return count copies of the zones, cycled, with a unique id and name (and output ids and names) each."""
+    numbered = []
+    for index in range(count):
+        zone = copy.deepcopy(zones[index % len(zones)])
+        zone["zone_id"] = "%s%03d" % (zone["zone_id"][:-3], index)
+        zone["display_name"] = "%s %d" % (zone["display_name"], index)
+        for output in zone["outputs"]:
+            output["output_id"] = "%s%03d" % (output["output_id"][:-3], index)
+            output["zone_id"] = zone["zone_id"]
+            output["display_name"] = "%s %d" % (output["display_name"], index)
+        numbered.append(zone)
+    return numbered
+
+
+def best_of(function, repeat=5, number=1):
+    """Return the best time in seconds of number calls of function, over repeat runs."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / number
+
+
+def replay_messages(payloads, seconds=600, track_every=180):
+    """
+    Return the zone / output subscription messages to replay, in order.
+
+    The messages captured with the payloads are used as they are. For payloads without
+    any (eg the sample), a session is built from their zones: a zones_seek_changed per
+    second for the playing zones and a zones_changed with the next track for each playing
+    zone every track_every seconds, staggered across the zones.
+    """
+    if payloads.get("messages"):
+        return payloads["messages"]
+    zones = payloads["zones"]
+    playing = [zone for zone in zones if zone["state"] == "playing"]
+    messages = []
+    track = {zone["zone_id"]: 0 for zone in playing}
+    for second in range(1, seconds + 1):
+        seek = []
+        for index, zone in enumerate(playing):
+            if (second + index * 9) % track_every == 0:
+                track[zone["zone_id"]] += 1
+                changed = copy.deepcopy(zone)
+                now_playing = changed["now_playing"]
+                number = track[zone["zone_id"]]
+                for line in ("one_line", "two_line", "three_line"):
+                    now_playing[line]["line1"] = f"{now_playing[line]['line1']} ({number})"
+                now_playing["image_key"] = f"{now_playing['image_key'][:24]}{number:08d}"
+                now_playing["seek_position"] = 0
+                changed["queue_items_remaining"] -= number
+                messages.append({"zones_changed": [changed]})
+            seek.append({"zone_id": zone["zone_id"], "queue_time_remaining": zone["queue_time_remaining"] - second,
+                         "seek_position": (zone["now_playing"]["seek_position"] + second) % zone["now_playing"]["length"]})
+        messages.append({"zones_seek_changed": seek})
+    return messages
+
+
+def table(title, header, rows):
+    """Print a small fixed width table."""
+    print(title)
+    widths = [max(len(str(row[column])) for row in [header] + rows) for column in range(len(header))]
+    for row in [header] + rows:
+        print("  " + "  ".join(str(cell).rjust(width) if index else str(cell).ljust(width)
+                               for index, (cell, width) in enumerate(zip(row, widths))))
+    print()